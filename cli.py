@@ -0,0 +1,354 @@
+"""DDE 게시판 명령줄 도구
+
+GUI 없이 PostRepository를 직접 사용하며 PySide6를 import하지 않는다.
+모든 결과는 JSON으로 출력한다 (list --stream은 한 줄에 게시글 하나인 JSON Lines).
+
+    python cli.py list --page 2 --page-size 20
+    python cli.py list --stream > posts.jsonl
+    python cli.py list --tags 공지,질문 --match-all
+    python cli.py list --tags 공지 --stream > notices.jsonl
+    python cli.py create --title 제목 --content 내용 --author 작성자
+    python cli.py create --from-file posts.jsonl
+    python cli.py maintenance migrate
+    python cli.py maintenance vacuum
+    python cli.py maintenance archive --before-year 2024
+    python cli.py sync other/board.db
+"""
+import argparse
+import json
+import sys
+from typing import Optional
+
+from controllers import validate_post_data
+from models import Post, PostRepository, PostSync, parse_tags
+
+BATCH_SIZE = 1000
+
+
+class CliError(Exception):
+    pass
+
+
+class JsonlLineError(CliError):
+    """JSON Lines 입력의 특정 줄 오류"""
+
+    def __init__(self, line_no: int, message: str):
+        super().__init__(f"{line_no}번째 줄: {message}")
+        self.line_no = line_no
+
+
+def print_json(data):
+    json.dump(data, sys.stdout, ensure_ascii=False)
+    sys.stdout.write("\n")
+
+
+def read_content(args) -> Optional[str]:
+    """--content 또는 --content-file('-'이면 표준 입력)에서 본문 읽기"""
+    if args.content_file == "-":
+        return sys.stdin.read()
+    if args.content_file:
+        with open(args.content_file, encoding="utf-8") as f:
+            return f.read()
+    return args.content
+
+
+def validate(title: str, content: str):
+    error = validate_post_data(title, content)
+    if error:
+        raise CliError(error)
+
+
+# === 하위 명령 ===
+
+def cmd_list(repository: PostRepository, args):
+    if args.tags and args.stream:
+        for post in repository.iter_by_tags(parse_tags(args.tags), args.match_all, batch_size=args.batch_size):
+            print_json(post.to_dict(include_content=False))
+        return
+
+    if args.tags:
+        posts = repository.get_by_tags(parse_tags(args.tags), args.match_all, args.page, args.page_size)
+        print_json({
+            "page": args.page,
+            "page_size": args.page_size,
+            "tags": parse_tags(args.tags),
+            "match_all": args.match_all,
+            "posts": [post.to_dict(include_content=False) for post in posts],
+        })
+        return
+
+    if args.stream:
+        for post in repository.iter_all(batch_size=args.batch_size, include_content=args.content):
+            print_json(post.to_dict(include_content=args.content))
+        return
+
+    posts = repository.get_page(args.page, args.page_size)
+    print_json({
+        "page": args.page,
+        "page_size": args.page_size,
+        "total": repository.count(),
+        "posts": [post.to_dict(include_content=False) for post in posts],
+    })
+
+
+def cmd_show(repository: PostRepository, args):
+    post = repository.get_by_id(args.id)
+    if not post:
+        raise CliError("게시글을 찾을 수 없습니다.")
+    print_json(post.to_dict())
+
+
+def iter_jsonl_posts(path: str):
+    f = sys.stdin if path == "-" else open(path, encoding="utf-8")
+    try:
+        for line_no, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                data = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise JsonlLineError(line_no, f"JSON 형식 오류 ({e.msg})")
+            title = data.get("title", "")
+            content = data.get("content", "")
+            error = validate_post_data(title, content)
+            if error:
+                raise JsonlLineError(line_no, error)
+            tags = data.get("tags")
+            if tags is not None and (not isinstance(tags, list) or not all(isinstance(tag, str) for tag in tags)):
+                raise JsonlLineError(line_no, "tags는 문자열 목록이어야 합니다.")
+            yield Post(title=title, content=content, author=data.get("author", ""), tags=tags)
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+
+def cmd_create(repository: PostRepository, args):
+    if args.from_file:
+        # BATCH_SIZE개씩 한 트랜잭션으로 저장
+        post_ids = []
+        batch = []
+        try:
+            for post in iter_jsonl_posts(args.from_file):
+                batch.append(post)
+                if len(batch) >= BATCH_SIZE:
+                    post_ids.extend(repository.create_many(batch))
+                    batch = []
+        except JsonlLineError as e:
+            # 앞 줄까지는 모두 저장하고 만든 id와 실패한 줄을 출력 (그 줄부터 다시 실행하면 중복 없음)
+            if batch:
+                post_ids.extend(repository.create_many(batch))
+            print_json({"created": len(post_ids), "ids": post_ids, "failed_line": e.line_no})
+            raise
+        if batch:
+            post_ids.extend(repository.create_many(batch))
+        print_json({"created": len(post_ids), "ids": post_ids})
+        return
+
+    content = read_content(args)
+    validate(args.title, content)
+    tags = parse_tags(args.tags) if args.tags else None
+    post_id = repository.create(Post(title=args.title, content=content, author=args.author, tags=tags))
+    print_json(repository.get_by_id(post_id).to_dict())
+
+
+def cmd_update(repository: PostRepository, args):
+    post = repository.get_by_id(args.id)
+    if not post:
+        raise CliError("게시글을 찾을 수 없습니다.")
+    if post.archived:
+        raise CliError("아카이브된 게시글은 읽기 전용입니다.")
+
+    title = args.title if args.title is not None else post.title
+    content = read_content(args)
+    content = content if content is not None else post.content
+    validate(title, content)
+
+    tags = parse_tags(args.tags) if args.tags is not None else None
+    if not repository.update(Post(id=args.id, title=title, content=content, tags=tags)):
+        raise CliError("수정 실패")
+    print_json(repository.get_by_id(args.id).to_dict())
+
+
+def cmd_delete(repository: PostRepository, args):
+    """아카이브된 글은 읽기 전용이라 지워지지 않으므로 없는 글과 구분해 알림"""
+    deleted, archived, missing = [], [], []
+    for post_id in args.ids:
+        if repository.delete(post_id):
+            deleted.append(post_id)
+        else:
+            post = repository.get_by_id(post_id)
+            (archived if post and post.archived else missing).append(post_id)
+    print_json({"deleted": deleted, "archived": archived, "not_found": missing})
+    return 1 if archived or missing else 0
+
+
+def cmd_search(repository: PostRepository, args):
+    posts = repository.search(args.keyword, args.page, args.page_size)
+    print_json({
+        "keyword": args.keyword,
+        "page": args.page,
+        "page_size": args.page_size,
+        "posts": [post.to_dict(include_content=False) for post in posts],
+    })
+
+
+def cmd_tags(repository: PostRepository, args):
+    print_json({"tags": [{"name": tag.name, "post_count": tag.post_count} for tag in repository.get_tags(args.limit)]})
+
+
+def cmd_stats(repository: PostRepository, args):
+    stats = repository.get_stats(author_limit=args.authors, day_limit=args.days)
+    print_json(stats.to_dict())
+
+
+def print_migration_progress(step: str, done: int, total: int):
+    """이전 버전 DB를 변환하는 동안 진행 상황을 stderr에 한 줄씩 (stdout의 결과 JSON과 섞이지 않게)"""
+    json.dump({"migrating": step, "done": done, "total": total}, sys.stderr, ensure_ascii=False)
+    sys.stderr.write("\n")
+
+
+def cmd_maintenance(repository: PostRepository, args):
+    if args.task == "migrate":
+        # 변환은 DB를 열 때 이미 끝났으므로 결과 버전만 출력
+        version = repository.connection.execute("PRAGMA user_version").fetchone()[0]
+        print_json({"task": args.task, "ok": True, "schema_version": version})
+        return
+
+    if args.task == "integrity-check":
+        result = repository.integrity_check()
+        print_json({"task": args.task, "ok": result == ["ok"], "messages": result})
+        return
+
+    if args.task == "vacuum":
+        repository.vacuum()
+    elif args.task == "analyze":
+        repository.analyze()
+    elif args.task == "rebuild-stats":
+        repository.rebuild_stats()
+    elif args.task == "archive":
+        if args.before_year is None:
+            raise CliError("archive에는 --before-year가 필요합니다.")
+        moved = repository.archive_before(args.before_year, args.batch_size)
+        print_json({"task": args.task, "ok": True, "moved": moved})
+        return
+    print_json({"task": args.task, "ok": True})
+
+
+def cmd_sync(repository: PostRepository, args):
+    result = PostSync(repository, batch_size=args.batch_size).sync(args.other_db)
+    print_json({"other_db": args.other_db, **result})
+
+
+def add_content_arguments(parser: argparse.ArgumentParser):
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--content", help="본문")
+    group.add_argument("--content-file", help="본문 파일 경로 ('-'이면 표준 입력)")
+
+
+def add_page_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--page", type=int, default=1)
+    parser.add_argument("--page-size", type=int, default=50)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="cli.py", description="DDE 게시판 명령줄 도구")
+    parser.add_argument("--db", default="board.db", help="DB 파일 경로 (기본값: board.db)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    list_parser = subparsers.add_parser("list", help="게시글 목록")
+    add_page_arguments(list_parser)
+    list_parser.add_argument("--stream", action="store_true", help="전체 목록을 JSON Lines로 출력")
+    list_parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    list_parser.add_argument("--content", action="store_true", help="--stream 시 본문 포함 (--tags와 함께 쓸 수 없음)")
+    list_parser.add_argument("--tags", help="쉼표로 구분한 태그 중 하나라도 가진 글만 조회")
+    list_parser.add_argument("--match-all", action="store_true", help="--tags의 모든 태그를 가진 글만 조회")
+    list_parser.set_defaults(handler=cmd_list)
+
+    show_parser = subparsers.add_parser("show", help="게시글 조회")
+    show_parser.add_argument("id", type=int)
+    show_parser.set_defaults(handler=cmd_show)
+
+    create_parser = subparsers.add_parser("create", help="게시글 작성")
+    create_parser.add_argument("--title", default="")
+    create_parser.add_argument("--author", default="")
+    create_parser.add_argument("--tags", help="쉼표로 구분한 태그")
+    add_content_arguments(create_parser)
+    create_parser.add_argument(
+        "--from-file",
+        help="JSON Lines 파일로 일괄 작성 ('-'이면 표준 입력, 줄마다 title/content/author)"
+    )
+    create_parser.set_defaults(handler=cmd_create)
+
+    update_parser = subparsers.add_parser("update", help="게시글 수정")
+    update_parser.add_argument("id", type=int)
+    update_parser.add_argument("--title")
+    update_parser.add_argument("--tags", help="쉼표로 구분한 태그 (빈 문자열이면 모두 제거)")
+    add_content_arguments(update_parser)
+    update_parser.set_defaults(handler=cmd_update)
+
+    delete_parser = subparsers.add_parser("delete", help="게시글 삭제")
+    delete_parser.add_argument("ids", type=int, nargs="+")
+    delete_parser.set_defaults(handler=cmd_delete)
+
+    search_parser = subparsers.add_parser("search", help="제목/내용 검색")
+    search_parser.add_argument("keyword")
+    add_page_arguments(search_parser)
+    search_parser.set_defaults(handler=cmd_search)
+
+    tags_parser = subparsers.add_parser("tags", help="태그별 게시글 수")
+    tags_parser.add_argument("--limit", type=int)
+    tags_parser.set_defaults(handler=cmd_tags)
+
+    stats_parser = subparsers.add_parser("stats", help="게시판 통계")
+    stats_parser.add_argument("--authors", type=int, default=10, help="작성자 수 (기본값: 10)")
+    stats_parser.add_argument("--days", type=int, default=30, help="일 수 (기본값: 30)")
+    stats_parser.set_defaults(handler=cmd_stats)
+
+    maintenance_parser = subparsers.add_parser("maintenance", help="DB 유지보수")
+    maintenance_parser.add_argument(
+        "task", choices=["migrate", "integrity-check", "vacuum", "analyze", "rebuild-stats", "archive"]
+    )
+    maintenance_parser.add_argument(
+        "--before-year", type=int, help="archive: 이 연도(UTC) 이전 게시글을 연도별 아카이브 파일로 이동"
+    )
+    maintenance_parser.add_argument("--batch-size", type=int, default=500, help="archive: 한 번에 옮길 게시글 수")
+    maintenance_parser.set_defaults(handler=cmd_maintenance)
+
+    sync_parser = subparsers.add_parser("sync", help="다른 board.db와 게시글 양방향 동기화")
+    sync_parser.add_argument("other_db", help="동기화할 DB 파일 경로")
+    sync_parser.add_argument("--batch-size", type=int, default=500, help="한 번에 주고받을 변경 수")
+    sync_parser.set_defaults(handler=cmd_sync)
+
+    return parser
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == "list" and args.tags and args.content:
+        # 태그 목록은 본문 없이 조회하므로 조용히 무시하지 않고 거부
+        parser.error("list --tags는 --content와 함께 쓸 수 없습니다.")
+    return args
+
+
+def run(repository: PostRepository, args: argparse.Namespace) -> int:
+    """열린 저장소로 명령을 실행하고 종료 코드 반환 (오류는 stderr에 JSON으로)"""
+    try:
+        return args.handler(repository, args) or 0
+    except (CliError, ValueError) as e:
+        json.dump({"error": str(e)}, sys.stderr, ensure_ascii=False)
+        sys.stderr.write("\n")
+        return 1
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = parse_args(argv)
+    repository = PostRepository(args.db, migration_progress=print_migration_progress)
+    try:
+        return run(repository, args)
+    finally:
+        repository.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
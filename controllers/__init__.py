@@ -1,3 +1,25 @@
-from .post_controller import PostController
+from .cancel_token import CancelToken
+from .validation import validate_post_data, validate_comment_data
 
-__all__ = ['PostController']
+__all__ = [
+    'PostController', 'DraftAutosaver', 'DocumentText', 'MarkdownRenderer', 'CancelToken',
+    'validate_post_data', 'validate_comment_data',
+]
+
+
+def __getattr__(name):
+    # Qt 의존 클래스는 처음 사용할 때 import
+    # (CLI 등에서 validation만 사용할 때 PySide6를 불러오지 않기 위함)
+    if name == 'PostController':
+        from .post_controller import PostController
+        return PostController
+    if name == 'DraftAutosaver':
+        from .draft_autosaver import DraftAutosaver
+        return DraftAutosaver
+    if name == 'DocumentText':
+        from .draft_autosaver import DocumentText
+        return DocumentText
+    if name == 'MarkdownRenderer':
+        from .markdown_renderer import MarkdownRenderer
+        return MarkdownRenderer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
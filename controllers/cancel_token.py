@@ -0,0 +1,20 @@
+from itertools import count
+
+
+class CancelToken:
+    """진행 중인 조각 단위 작업을 멈추라고 알리는 표시 (Qt 비의존)
+
+    id는 시그널로 함께 전달되어, 받는 쪽이 이미 취소된 이전 작업의 조각을 걸러낼 수 있다.
+    """
+    _ids = count(1)
+
+    def __init__(self):
+        self.id = next(self._ids)
+        self._cancelled = False
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def cancel(self):
+        self._cancelled = True
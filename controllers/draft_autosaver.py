@@ -0,0 +1,104 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+from PySide6.QtCore import QObject, QTimer, Signal
+from PySide6.QtGui import QTextDocument
+
+from models import Draft, DraftRepository
+
+
+class DocumentText:
+    """문서 본문을 revision이 바뀌었을 때만 다시 읽음
+
+    제목만 고친 뒤의 스냅샷처럼 본문이 그대로면 toPlainText()로 전체를 복사하지 않는다.
+    """
+
+    def __init__(self, document: QTextDocument):
+        self.document = document
+        self._revision: Optional[int] = None
+        self._text = ""
+
+    def text(self) -> str:
+        revision = self.document.revision()
+        if revision != self._revision:
+            self._text = self.document.toPlainText()
+            self._revision = revision
+        return self._text
+
+
+class DraftAutosaver(QObject):
+    """입력 변경을 모아 일정 주기로 임시 저장본을 기록
+
+    - mark_dirty()는 키와 스냅샷 함수만 기록하므로 키 입력마다 O(1)
+    - 주기 안의 여러 변경은 키별로 마지막 상태 하나로 합쳐짐
+    - DB 읽기/쓰기는 전용 스레드 하나에서 순서대로 처리 (UI 스레드 블로킹 없음)
+    """
+    draft_loaded = Signal(str, object)   # (키, 임시 저장본 또는 None)
+    error_occurred = Signal(str)
+    _loaded = Signal(str, object)        # 쓰기 스레드 → UI 스레드 전달용
+
+    DEFAULT_INTERVAL_MS = 3000
+
+    def __init__(self, repository: DraftRepository, interval_ms: int = DEFAULT_INTERVAL_MS):
+        super().__init__()
+        self.repository = repository
+        self._pending: dict[str, Callable[[], Draft]] = {}
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="draft-writer")
+
+        # 첫 변경 시점부터 interval 뒤에 한 번만 기록 (계속 입력해도 재시작하지 않음)
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self.flush)
+        self._loaded.connect(self._on_loaded)
+
+    def mark_dirty(self, key: str, snapshot: Callable[[], Draft]):
+        self._pending[key] = snapshot
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def flush(self):
+        """대기 중인 변경을 스냅샷으로 만들어 쓰기 스레드에 전달"""
+        self._timer.stop()
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        drafts = [snapshot() for snapshot in pending.values()]
+        self._executor.submit(self._write, drafts)
+
+    def _write(self, drafts: list[Draft]):
+        try:
+            self.repository.save_many(drafts)
+        except Exception as e:
+            self.error_occurred.emit(f"임시 저장 오류: {str(e)}")
+
+    def request_load(self, key: str):
+        """임시 저장본을 쓰기 스레드에서 읽어 draft_loaded로 전달
+
+        대기 중인 변경을 먼저 제출하므로 같은 스레드에서 순서대로 처리되어 최신 상태를 읽는다.
+        """
+        self.flush()
+        self._executor.submit(self._read, key)
+
+    def _read(self, key: str):
+        try:
+            draft = self.repository.get(key)
+        except Exception as e:
+            self.error_occurred.emit(f"임시 저장본 읽기 오류: {str(e)}")
+            draft = None
+        self._loaded.emit(key, draft)
+
+    def _on_loaded(self, key: str, draft: Optional[Draft]):
+        self.draft_loaded.emit(key, draft)
+
+    def discard(self, key: str):
+        self._pending.pop(key, None)
+        self._executor.submit(self.repository.delete, key)
+
+    def wait(self):
+        """제출된 쓰기가 모두 끝날 때까지 대기"""
+        self._executor.submit(lambda: None).result()
+
+    def close(self):
+        self.flush()
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,104 @@
+import re
+from collections import deque
+
+from PySide6.QtCore import QObject, QTimer, Signal
+from PySide6.QtGui import QTextDocument
+
+from models import Post, RenderCache
+
+MARKDOWN_FEATURES = QTextDocument.MarkdownFeature.MarkdownDialectGitHub | QTextDocument.MarkdownFeature.MarkdownNoHTML
+BODY_PATTERN = re.compile(r"<body[^>]*>(.*)</body>", re.DOTALL)
+
+
+def split_markdown(text: str, chunk_chars: int) -> list[str]:
+    """빈 줄을 경계로 chunk_chars 이상씩 나눔 (코드 블록 안에서는 나누지 않음)"""
+    chunks = []
+    lines = []
+    size = 0
+    in_fence = False
+    for line in text.splitlines():
+        if line.lstrip().startswith(("```", "~~~")):
+            in_fence = not in_fence
+        if not line.strip() and not in_fence and size >= chunk_chars:
+            chunks.append("\n".join(lines))
+            lines, size = [], 0
+            continue
+        lines.append(line)
+        size += len(line) + 1
+    if lines:
+        chunks.append("\n".join(lines))
+    return chunks
+
+
+def markdown_to_html(text: str) -> str:
+    """Markdown을 QTextDocument로 변환한 HTML의 <body> 안쪽 (본문 속 HTML 태그는 글자로 표시)"""
+    document = QTextDocument()
+    document.setMarkdown(text, MARKDOWN_FEATURES)
+    match = BODY_PATTERN.search(document.toHtml())
+    return match.group(1) if match else ""
+
+
+class MarkdownRenderer(QObject):
+    """게시글 본문을 Markdown으로 렌더링 (결과는 RenderCache에 보관)
+
+    긴 본문은 조각으로 나눠 첫 조각은 바로, 나머지는 이벤트 루프가 빌 때마다 하나씩
+    렌더링하므로 첫 화면이 먼저 보이고 그동안 UI도 멈추지 않는다.
+    """
+    render_started = Signal(int)      # post_id
+    chunk_rendered = Signal(int, str)  # (post_id, HTML 조각)
+    render_finished = Signal(int)     # post_id
+
+    CHUNK_CHARS = 16000
+
+    def __init__(self, cache: RenderCache, chunk_chars: int = CHUNK_CHARS, parent=None):
+        super().__init__(parent)
+        self.cache = cache
+        self.chunk_chars = chunk_chars
+        self._post = None
+        self._chunks: deque[str] = deque()
+        self._html: list[str] = []
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._render_next)
+
+    def render(self, post: Post):
+        """진행 중인 렌더링을 취소하고 post 본문 렌더링 (캐시에 있으면 한 번에)"""
+        self.cancel()
+        self.render_started.emit(post.id)
+        html = self.cache.get(post.id, post.updated_at)
+        if html is not None:
+            self.chunk_rendered.emit(post.id, html)
+            self.render_finished.emit(post.id)
+            return
+
+        self._post = post
+        self._chunks = deque(split_markdown(post.content, self.chunk_chars))
+        self._render_next()
+        if self._post is not None:
+            self._timer.start()
+
+    def is_rendering(self) -> bool:
+        return self._post is not None
+
+    def cancel(self):
+        self._timer.stop()
+        self._post = None
+        self._chunks.clear()
+        self._html = []
+
+    def _render_next(self):
+        post = self._post
+        if post is None:
+            self._timer.stop()
+            return
+        if self._chunks:
+            html = markdown_to_html(self._chunks.popleft())
+            self._html.append(html)
+            self.chunk_rendered.emit(post.id, html)
+        if not self._chunks and self._post is post:
+            self._timer.stop()
+            self.cache.put(post.id, post.updated_at, "".join(self._html))
+            self._post = None
+            self._html = []
+            self.render_finished.emit(post.id)
@@ -1,42 +1,183 @@
-from PySide6.QtCore import QObject, Signal
+import getpass
+from itertools import islice
+from typing import Iterator, Optional
 
-from models import Post, PostRepository
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from models import Post, PostStore, RenderCache
+from .cancel_token import CancelToken
+from .markdown_renderer import MarkdownRenderer
+from .validation import validate_post_data, validate_comment_data
 
 
 class PostController(QObject):
     posts_loaded = Signal(list)
+    posts_load_started = Signal(int)           # 토큰 id
+    posts_chunk_loaded = Signal(int, object)   # (토큰 id, 게시글 조각)
+    posts_load_finished = Signal(int, bool)    # (토큰 id, 취소 여부)
     post_loaded = Signal(object)
     post_created = Signal()
     post_updated = Signal()
     post_deleted = Signal()
+    stats_loaded = Signal(object)
+    tags_loaded = Signal(list)
+    comments_loaded = Signal(int, list, bool)  # (post_id, 댓글, 다음 페이지 여부)
+    comment_added = Signal(int)                # post_id
+    comment_deleted = Signal(int)              # post_id
+    attachments_loaded = Signal(int, list)     # (post_id, 첨부파일)
+    attachments_changed = Signal(int)          # post_id
+    attachment_preview_loaded = Signal(object, bytes)  # (첨부파일, 앞부분 내용)
+    content_render_started = Signal(int)       # post_id
+    content_chunk_rendered = Signal(int, str)  # (post_id, 본문 HTML 조각)
+    content_render_finished = Signal(int)      # post_id
+    read_state_loaded = Signal(object)         # {post_id: 읽음 여부}
+    unread_count_loaded = Signal(int)
+    read_state_changed = Signal(object)        # 읽음 처리된 post_id 목록 (모두 읽음이면 None)
     error_occurred = Signal(str)
 
-    def __init__(self, repository: PostRepository):
+    POST_CHUNK_SIZE = 500
+    COMMENT_PAGE_SIZE = 50
+    PREVIEW_BYTES = 4096
+    VIEW_FLUSH_INTERVAL_MS = 10000
+    RENDER_CACHE_BYTES = 8 * 1024 * 1024
+
+    def __init__(self, repository: PostStore, view_flush_interval_ms: int = VIEW_FLUSH_INTERVAL_MS,
+                 render_cache_bytes: int = RENDER_CACHE_BYTES, reader: Optional[str] = None):
+        """reader는 읽음 표시를 기록할 독자 이름 (기본값: OS 사용자 이름)"""
         super().__init__()
         self.repository = repository
+        self.reader = reader or self._default_reader()
+
+        # 본문 렌더링 결과는 수정 시각별로 캐시하고, 수정/삭제되면 이전 결과를 버림
+        self.render_cache = RenderCache(render_cache_bytes)
+        self.repository.add_change_listener(self.render_cache.invalidate)
+        self.renderer = MarkdownRenderer(self.render_cache, parent=self)
+        self.renderer.render_started.connect(self.content_render_started)
+        self.renderer.chunk_rendered.connect(self.content_chunk_rendered)
+        self.renderer.render_finished.connect(self.content_render_finished)
+
+        # 조회수는 repository 버퍼에 쌓아 두고 주기적으로 한 번에 반영
+        self.view_flush_timer = QTimer(self)
+        self.view_flush_timer.setInterval(view_flush_interval_ms)
+        self.view_flush_timer.timeout.connect(self.flush_views)
+        self.view_flush_timer.start()
+
+        # 목록은 조각으로 나눠 이벤트 루프가 빌 때마다 하나씩 전달
+        self._post_stream: Optional[tuple[CancelToken, Iterator[list[Post]]]] = None
+        self.post_stream_timer = QTimer(self)
+        self.post_stream_timer.setInterval(0)
+        self.post_stream_timer.timeout.connect(self._emit_next_chunk)
+
+    def _default_reader(self) -> str:
+        try:
+            return getpass.getuser()
+        except Exception:
+            return "local"
 
     def _validate_post_data(self, title: str, content: str) -> bool:
         """데이터 유효성 검사"""
-        if not title or not title.strip():
-            self.error_occurred.emit("제목을 입력해주세요.")
-            return False
-        if not content or not content.strip():
-            self.error_occurred.emit("내용을 입력해주세요.")
+        error = validate_post_data(title, content)
+        if error:
+            self.error_occurred.emit(error)
             return False
         return True
 
-    def load_posts(self):
+    def load_posts(self, tags: Optional[list[str]] = None, match_all: bool = False):
+        """tags가 있으면 태그로 거른 목록 (match_all=True면 모든 태그를 가진 글만)"""
         try:
-            posts = self.repository.get_all()
+            if tags:
+                # 결과 전체를 한 번에 정렬하지 않고 (created_at, id) 순서로 나눠 읽음
+                posts = list(self.repository.iter_by_tags(tags, match_all, batch_size=self.POST_CHUNK_SIZE))
+            else:
+                posts = self.repository.get_all()
             self.posts_loaded.emit(posts)
         except Exception as e:
             self.error_occurred.emit(str(e))
 
-    def load_post(self, post_id: int) -> bool:
+    def stream_posts(self, tags: Optional[list[str]] = None, match_all: bool = False,
+                     chunk_size: int = POST_CHUNK_SIZE) -> CancelToken:
+        """load_posts와 같은 목록을 chunk_size개씩 나눠 posts_chunk_loaded로 전달
+
+        첫 조각은 바로, 나머지는 이벤트 루프가 빌 때마다 하나씩 보내므로 목록이 길어도
+        첫 화면이 먼저 보이고 그동안 입력도 막히지 않는다. 새 목록을 요청하면 진행 중이던
+        목록은 취소된다 (posts_load_finished의 취소 여부가 True).
+        """
+        self.cancel_post_stream()
+        token = CancelToken()
+        self._post_stream = (token, self._post_chunks(tags, match_all, chunk_size))
+        self.posts_load_started.emit(token.id)
+        self._emit_next_chunk()
+        if self._post_stream is not None and self._post_stream[0] is token:
+            self.post_stream_timer.start()
+        return token
+
+    def _post_chunks(self, tags: Optional[list[str]], match_all: bool, chunk_size: int) -> Iterator[list[Post]]:
+        # 둘 다 (created_at, id) 키셋으로 읽으므로 받는 도중 글이 추가/삭제되어도 중복/누락 없음
+        if tags:
+            posts = self.repository.iter_by_tags(tags, match_all, batch_size=chunk_size)
+        else:
+            posts = self.repository.iter_all(batch_size=chunk_size)
+        while chunk := list(islice(posts, chunk_size)):
+            yield chunk
+
+    def is_streaming_posts(self) -> bool:
+        return self._post_stream is not None
+
+    def cancel_post_stream(self):
+        if self._post_stream is not None:
+            self._post_stream[0].cancel()
+            self._emit_next_chunk()
+
+    def _finish_post_stream(self, cancelled: bool):
+        token, _ = self._post_stream
+        self.post_stream_timer.stop()
+        self._post_stream = None
+        self.posts_load_finished.emit(token.id, cancelled)
+
+    def _emit_next_chunk(self):
+        if self._post_stream is None:
+            self.post_stream_timer.stop()
+            return
+        token, chunks = self._post_stream
+        if token.cancelled:
+            self._finish_post_stream(cancelled=True)
+            return
+        try:
+            posts = next(chunks, None)
+        except Exception as e:
+            self._finish_post_stream(cancelled=True)
+            self.error_occurred.emit(str(e))
+            return
+        if posts is None:
+            self._finish_post_stream(cancelled=False)
+        else:
+            self.posts_chunk_loaded.emit(token.id, posts)
+
+    def load_tags(self):
+        try:
+            self.tags_loaded.emit(self.repository.get_tags())
+        except Exception as e:
+            self.error_occurred.emit(str(e))
+
+    def load_stats(self):
+        try:
+            stats = self.repository.get_stats()
+            self.stats_loaded.emit(stats)
+        except Exception as e:
+            self.error_occurred.emit(str(e))
+
+    def load_post(self, post_id: int, count_view: bool = False) -> bool:
+        """count_view=True면 조회수 1 증가 및 읽음 표시 (게시글 화면을 열 때)"""
         try:
             post = self.repository.get_by_id(post_id)
             if post:
+                # 아카이브된 글은 읽기 전용이라 조회수를 세지 않음
+                if count_view and not post.archived:
+                    self.repository.record_view(post_id)
+                    post.view_count += 1
                 self.post_loaded.emit(post)
+                if count_view:
+                    self._mark_read(post_id)
                 return True
             else:
                 self.error_occurred.emit("게시글을 찾을 수 없습니다.")
@@ -45,23 +186,73 @@ class PostController(QObject):
             self.error_occurred.emit(str(e))
             return False
 
-    def create_post(self, title: str, content: str, author: str):
+    def _mark_read(self, post_id: int):
+        try:
+            self.repository.mark_read(self.reader, [post_id])
+        except Exception:
+            # 다른 프로그램이 DB를 잠그고 있으면 다음에 열 때 다시 표시
+            return
+        self.read_state_changed.emit([post_id])
+
+    def load_read_state(self, post_ids: list[int]):
+        """목록에 보이는 글들의 읽음 여부 (post_ids만 조회하므로 조각마다 불러도 됨)"""
+        try:
+            self.read_state_loaded.emit(self.repository.is_read(self.reader, post_ids))
+        except Exception as e:
+            self.error_occurred.emit(str(e))
+
+    def load_unread_count(self):
+        """읽지 않은 글 수 (아카이브까지 모두 세므로 목록을 다 받은 뒤 한 번만)"""
+        try:
+            self.unread_count_loaded.emit(self.repository.unread_count(self.reader))
+        except Exception as e:
+            self.error_occurred.emit(str(e))
+
+    def mark_all_read(self):
+        try:
+            self.repository.mark_all_read(self.reader)
+            self.read_state_changed.emit(None)
+        except Exception as e:
+            self.error_occurred.emit(str(e))
+
+    def flush_views(self):
+        try:
+            self.repository.flush_views()
+        except Exception:
+            # 다른 프로그램이 DB를 잠그고 있으면 다음 주기에 다시 시도
+            pass
+
+    def render_content(self, post: Post):
+        """본문을 Markdown으로 렌더링해 content_chunk_rendered로 나눠 전달"""
+        try:
+            self.renderer.render(post)
+        except Exception as e:
+            self.error_occurred.emit(str(e))
+
+    def close(self):
+        self.view_flush_timer.stop()
+        self.renderer.cancel()
+        self.cancel_post_stream()
+        self.flush_views()
+
+    def create_post(self, title: str, content: str, author: str, tags: Optional[list[str]] = None):
         if not self._validate_post_data(title, content):
             return
 
         try:
-            post = Post(title=title, content=content, author=author)
+            post = Post(title=title, content=content, author=author, tags=tags)
             self.repository.create(post)
             self.post_created.emit()
         except Exception as e:
             self.error_occurred.emit(f"저장 오류: {str(e)}")
 
-    def update_post(self, post_id: int, title: str, content: str):
+    def update_post(self, post_id: int, title: str, content: str, tags: Optional[list[str]] = None):
+        """tags가 None이면 태그는 그대로 둠"""
         if not self._validate_post_data(title, content):
             return
 
         try:
-            post = Post(id=post_id, title=title, content=content)
+            post = Post(id=post_id, title=title, content=content, tags=tags)
             success = self.repository.update(post)
             if success:
                 self.post_updated.emit()
@@ -79,3 +270,74 @@ class PostController(QObject):
                 self.error_occurred.emit("삭제 실패")
         except Exception as e:
             self.error_occurred.emit(f"삭제 오류: {str(e)}")
+
+    def load_comments(self, post_id: int, after_path: Optional[str] = None,
+                      limit: int = COMMENT_PAGE_SIZE):
+        """after_path 다음부터 limit개 (한 개 더 읽어 다음 페이지가 있는지 확인)"""
+        try:
+            comments = self.repository.get_comments(post_id, after_path, limit + 1)
+            self.comments_loaded.emit(post_id, comments[:limit], len(comments) > limit)
+        except Exception as e:
+            self.error_occurred.emit(str(e))
+
+    def add_comment(self, post_id: int, content: str, author: str, parent_id: Optional[int] = None):
+        error = validate_comment_data(content)
+        if error:
+            self.error_occurred.emit(error)
+            return
+
+        try:
+            self.repository.add_comment(post_id, content, author, parent_id)
+            self.comment_added.emit(post_id)
+        except Exception as e:
+            self.error_occurred.emit(f"댓글 저장 오류: {str(e)}")
+
+    def delete_comment(self, post_id: int, comment_id: int):
+        try:
+            if self.repository.delete_comment(comment_id):
+                self.comment_deleted.emit(post_id)
+            else:
+                self.error_occurred.emit("댓글 삭제 실패")
+        except Exception as e:
+            self.error_occurred.emit(f"댓글 삭제 오류: {str(e)}")
+
+    def load_attachments(self, post_id: int):
+        try:
+            self.attachments_loaded.emit(post_id, self.repository.get_attachments(post_id))
+        except Exception as e:
+            self.error_occurred.emit(str(e))
+
+    def add_attachment(self, post_id: int, file_path: str):
+        try:
+            self.repository.add_attachment_file(post_id, file_path)
+            self.attachments_changed.emit(post_id)
+        except Exception as e:
+            self.error_occurred.emit(f"첨부 오류: {str(e)}")
+
+    def save_attachment(self, attachment_id: int, destination_path: str):
+        try:
+            with open(destination_path, "wb") as destination:
+                if not self.repository.save_attachment(attachment_id, destination):
+                    self.error_occurred.emit("첨부파일을 찾을 수 없습니다.")
+        except Exception as e:
+            self.error_occurred.emit(f"저장 오류: {str(e)}")
+
+    def load_attachment_preview(self, attachment_id: int):
+        try:
+            attachment = self.repository.get_attachment(attachment_id)
+            if not attachment:
+                self.error_occurred.emit("첨부파일을 찾을 수 없습니다.")
+                return
+            preview = self.repository.read_attachment_preview(attachment_id, self.PREVIEW_BYTES)
+            self.attachment_preview_loaded.emit(attachment, preview)
+        except Exception as e:
+            self.error_occurred.emit(str(e))
+
+    def delete_attachment(self, post_id: int, attachment_id: int):
+        try:
+            if self.repository.delete_attachment(attachment_id):
+                self.attachments_changed.emit(post_id)
+            else:
+                self.error_occurred.emit("첨부파일 삭제 실패")
+        except Exception as e:
+            self.error_occurred.emit(f"첨부파일 삭제 오류: {str(e)}")
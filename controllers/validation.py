@@ -0,0 +1,16 @@
+from typing import Optional
+
+
+def validate_post_data(title: str, content: str) -> Optional[str]:
+    """유효하지 않으면 사용자에게 보여줄 오류 메시지, 유효하면 None 반환"""
+    if not title or not title.strip():
+        return "제목을 입력해주세요."
+    if not content or not content.strip():
+        return "내용을 입력해주세요."
+    return None
+
+
+def validate_comment_data(content: str) -> Optional[str]:
+    if not content or not content.strip():
+        return "댓글 내용을 입력해주세요."
+    return None
@@ -1,12 +1,20 @@
 import sys
 from PySide6.QtWidgets import QApplication
+from models import DraftRepository, InMemoryPostRepository
 from views import MainWindow
 
 
 def main():
     app = QApplication(sys.argv)
 
-    window = MainWindow()
+    # --memory: 파일을 만들지 않고 메모리 저장소로 실행 (데모용, 종료하면 사라짐)
+    # --memory-diagnostics: 목록으로 돌아올 때마다 메모리 사용량과 늘어난 양을 stderr에 출력
+    # --wal: board.db를 WAL 모드로 전환 (로컬 디스크 전용, 네트워크 공유 폴더의 DB에는 쓰지 않음)
+    diagnostics = "--memory-diagnostics" in sys.argv[1:]
+    if "--memory" in sys.argv[1:]:
+        window = MainWindow(InMemoryPostRepository(), DraftRepository(":memory:"), diagnostics)
+    else:
+        window = MainWindow(memory_diagnostics=diagnostics, wal="--wal" in sys.argv[1:])
     window.show()
 
     sys.exit(app.exec())
@@ -1,4 +1,28 @@
 from .post import Post
 from .post_repository import PostRepository
+from .post_store import PostStore
+from .memory_post_repository import InMemoryPostRepository
+from .stats import AuthorStats, BoardStats, DailyStats
+from .tag import Tag, normalize_tags, parse_tags
+from .comment import Comment
+from .attachment import Attachment
+from .blob_store import BlobStore
+from .view_counter import ViewCounter
+from .render_cache import RenderCache
+from .read_set import ReadSet
+from .timestamps import format_local, from_ms
+from .draft import Draft
+from .draft_repository import DraftRepository
+from .post_snapshot import PostSnapshot
+from .post_archiver import PostArchiver
+from .post_change import PostChange
+from .post_sync import PostSync
 
-__all__ = ['Post', 'PostRepository']
+__all__ = [
+    'Post', 'PostRepository', 'PostStore', 'InMemoryPostRepository',
+    'AuthorStats', 'BoardStats', 'DailyStats', 'Tag', 'normalize_tags', 'parse_tags',
+    'Comment', 'Attachment', 'BlobStore', 'ViewCounter', 'RenderCache', 'ReadSet',
+    'format_local', 'from_ms',
+    'Draft', 'DraftRepository', 'PostSnapshot', 'PostArchiver',
+    'PostChange', 'PostSync',
+]
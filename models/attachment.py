@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+
+@dataclass
+class Attachment:
+    id: Optional[int] = None
+    post_id: Optional[int] = None
+    filename: str = ""
+    digest: str = ""      # 내용의 SHA-256 (같은 파일은 한 번만 저장)
+    size: int = 0
+    created_at: Optional[datetime] = None
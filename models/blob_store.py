@@ -0,0 +1,94 @@
+import hashlib
+import mmap
+import os
+import shutil
+import tempfile
+from typing import BinaryIO
+
+
+class BlobStore:
+    """SHA-256 값을 이름으로 쓰는 파일 저장소
+
+    같은 내용은 어느 게시글에 첨부하든 파일 하나만 저장한다.
+    파일은 <root>/<해시 앞 2자리>/<해시> 에 두며, 쓰기/읽기 모두
+    CHUNK_SIZE 단위로 나눠 처리하므로 큰 파일도 메모리에 한 번에 올리지 않는다.
+    참조 수 관리는 PostRepository의 blobs 테이블이 맡는다.
+    """
+
+    CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def path(self, digest: str) -> str:
+        return os.path.join(self.root, digest[:2], digest)
+
+    def exists(self, digest: str) -> bool:
+        return os.path.exists(self.path(digest))
+
+    def put(self, stream: BinaryIO) -> tuple[str, int]:
+        """stream을 끝까지 읽어 저장하고 (digest, 크기) 반환
+
+        임시 파일에 쓰면서 해시를 계산한 뒤 최종 경로로 옮기므로
+        중간에 실패해도 불완전한 파일이 저장소에 남지 않는다.
+        """
+        os.makedirs(self.root, exist_ok=True)
+        sha256 = hashlib.sha256()
+        size = 0
+        fd, temp_path = tempfile.mkstemp(dir=self.root, prefix=".upload-")
+        try:
+            with os.fdopen(fd, "wb") as temp:
+                while True:
+                    chunk = stream.read(self.CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    sha256.update(chunk)
+                    temp.write(chunk)
+                    size += len(chunk)
+                temp.flush()
+                os.fsync(temp.fileno())
+
+            digest = sha256.hexdigest()
+            target = self.path(digest)
+            if os.path.exists(target):
+                os.remove(temp_path)
+            else:
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                os.replace(temp_path, target)
+            return digest, size
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def put_file(self, file_path: str) -> tuple[str, int]:
+        with open(file_path, "rb") as stream:
+            return self.put(stream)
+
+    def open(self, digest: str) -> BinaryIO:
+        return open(self.path(digest), "rb")
+
+    def copy_to(self, digest: str, destination: BinaryIO):
+        """저장된 내용을 CHUNK_SIZE 단위로 destination에 복사"""
+        with self.open(digest) as source:
+            shutil.copyfileobj(source, destination, self.CHUNK_SIZE)
+
+    def read_preview(self, digest: str, limit: int = 4096) -> bytes:
+        """앞부분 limit바이트만 mmap으로 읽음 (파일 전체를 읽어 들이지 않음)"""
+        with self.open(digest) as source:
+            if os.fstat(source.fileno()).st_size == 0:
+                return b""
+            with mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return mapped[:limit]
+
+    def remove(self, digest: str) -> bool:
+        try:
+            os.remove(self.path(digest))
+        except FileNotFoundError:
+            return False
+        try:
+            os.rmdir(os.path.dirname(self.path(digest)))
+        except OSError:
+            # 같은 디렉터리에 다른 파일이 남아 있음
+            pass
+        return True
@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+
+@dataclass
+class Comment:
+    id: Optional[int] = None
+    post_id: Optional[int] = None
+    parent_id: Optional[int] = None   # None이면 게시글에 바로 단 댓글
+    author: str = ""
+    content: str = ""
+    depth: int = 0
+    path: str = ""                    # 조상 id를 이은 정렬 키 (스레드 순서)
+    created_at: Optional[datetime] = None
@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+
+@dataclass
+class Draft:
+    key: str = ""
+    title: str = ""
+    content: str = ""
+    author: str = ""
+    tags: str = ""
+    updated_at: Optional[datetime] = None
+
+    def is_empty(self) -> bool:
+        return not (self.title.strip() or self.content.strip() or self.author.strip() or self.tags.strip())
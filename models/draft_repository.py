@@ -0,0 +1,99 @@
+import sqlite3
+import os
+from typing import Optional
+
+from .draft import Draft
+from .post_repository import PostRepository
+from .timestamps import SQL_NOW_MS, from_ms
+
+
+class DraftRepository:
+    """작성/수정 중인 임시 저장본을 drafts 테이블에 보관
+
+    자동 저장 스레드에서 사용하므로 check_same_thread=False로 연결하며,
+    호출 순서는 사용하는 쪽(DraftAutosaver)에서 직렬화한다.
+    """
+
+    def __init__(self, db_path: str = "board.db"):
+        self.db_path = db_path
+        self.connection = None
+        self._connect()
+        self._create_table()
+
+    def _connect(self):
+        db_dir = os.path.dirname(self.db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+        self.connection = sqlite3.connect(self.db_path, check_same_thread=False,
+                                          timeout=PostRepository.BUSY_TIMEOUT)
+        self.connection.row_factory = sqlite3.Row
+        # 임시 저장본은 유실되어도 치명적이지 않으므로 fsync 횟수를 줄임
+        self.connection.execute("PRAGMA synchronous = NORMAL")
+
+    def _create_table(self):
+        """drafts 테이블을 함께 만드는 스키마 버전 이상이면 user_version만 읽고 넘어감
+
+        board.db는 PostRepository가 먼저 열면서 drafts 테이블까지 만들어 두므로,
+        창을 열 때마다 DDL과 변환 UPDATE로 쓰기 잠금을 잡지 않는다.
+        """
+        cursor = self.connection.cursor()
+        cursor.execute("PRAGMA user_version")
+        if cursor.fetchone()[0] >= PostRepository.SCHEMA_VERSION:
+            return
+        PostRepository.create_draft_table(self.connection)
+        self.connection.commit()
+
+    def _row_to_draft(self, row: sqlite3.Row) -> Draft:
+        return Draft(
+            key=row["key"],
+            title=row["title"],
+            content=row["content"],
+            author=row["author"],
+            tags=row["tags"],
+            updated_at=from_ms(row["updated_at"]),
+        )
+
+    def save_many(self, drafts: list[Draft]):
+        """여러 임시 저장본을 한 트랜잭션으로 기록 (빈 저장본은 삭제)"""
+        cursor = self.connection.cursor()
+        cursor.executemany(f"""
+            INSERT INTO drafts (key, title, content, author, tags, updated_at)
+            VALUES (?, ?, ?, ?, ?, {SQL_NOW_MS})
+            ON CONFLICT (key) DO UPDATE SET
+                title = excluded.title,
+                content = excluded.content,
+                author = excluded.author,
+                tags = excluded.tags,
+                updated_at = excluded.updated_at
+        """, [
+            (draft.key, draft.title, draft.content, draft.author, draft.tags)
+            for draft in drafts if not draft.is_empty()
+        ])
+        cursor.executemany(
+            "DELETE FROM drafts WHERE key = ?",
+            [(draft.key,) for draft in drafts if draft.is_empty()]
+        )
+        self.connection.commit()
+
+    def save(self, draft: Draft):
+        self.save_many([draft])
+
+    def get(self, key: str) -> Optional[Draft]:
+        cursor = self.connection.cursor()
+        cursor.execute("""
+            SELECT key, title, content, author, tags, updated_at
+            FROM drafts
+            WHERE key = ?
+        """, (key,))
+        row = cursor.fetchone()
+        return self._row_to_draft(row) if row else None
+
+    def delete(self, key: str) -> bool:
+        cursor = self.connection.cursor()
+        cursor.execute("DELETE FROM drafts WHERE key = ?", (key,))
+        self.connection.commit()
+        return cursor.rowcount > 0
+
+    def close(self):
+        if self.connection:
+            self.connection.close()
@@ -0,0 +1,33 @@
+"""하이브리드 논리 시계 (HLC)
+
+값은 "물리 시각 ms(15자리):카운터(5자리):노드 id" 문자열이다.
+자릿수를 고정했으므로 문자열 비교가 곧 시간 순서이고,
+같은 시각/카운터면 노드 id가 순서를 정하므로 어느 DB에서 비교해도 결과가 같다.
+"""
+from typing import Optional
+
+# SQLite printf()와 함께 쓰는 형식
+HLC_SQL_FORMAT = "%015d:%05d:%s"
+
+
+def parse_hlc(value: str) -> tuple[int, int, str]:
+    physical, counter, node_id = value.split(":", 2)
+    return int(physical), int(counter), node_id
+
+
+def receive(physical: int, counter: int, remote: Optional[str], now_ms: int) -> tuple[int, int]:
+    """원격 HLC를 받은 뒤의 로컬 (물리 시각, 카운터)
+
+    로컬 시계가 다른 DB보다 늦어도 이후 로컬 변경이 받은 변경보다 항상 뒤에 오도록 한다.
+    """
+    if remote is None:
+        return physical, counter
+    remote_physical, remote_counter, _ = parse_hlc(remote)
+    new_physical = max(physical, remote_physical, now_ms)
+    if new_physical == physical == remote_physical:
+        return new_physical, max(counter, remote_counter) + 1
+    if new_physical == physical:
+        return new_physical, counter + 1
+    if new_physical == remote_physical:
+        return new_physical, remote_counter + 1
+    return new_physical, 0
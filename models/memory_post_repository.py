@@ -0,0 +1,443 @@
+import hashlib
+import heapq
+import os
+import time
+from bisect import bisect_left, bisect_right, insort
+from dataclasses import replace
+from datetime import datetime
+from typing import BinaryIO, Callable, Iterator, Optional
+
+from .post import Post, validate_post_fields
+from .stats import AuthorStats, BoardStats, DailyStats
+from .tag import Tag, normalize_tags
+from .comment import Comment
+from .attachment import Attachment
+from .view_counter import ViewCounter
+from .read_set import ReadSet
+from .timestamps import from_ms
+
+# LIKE와 같게 ASCII 문자만 대소문자를 구분하지 않음
+_ASCII_LOWER = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
+
+
+def _now_ms() -> int:
+    return time.time_ns() // 1_000_000
+
+
+class InMemoryPostRepository:
+    """PostStore를 메모리 안의 dict와 정렬 리스트로 구현한 저장소
+
+    테스트와 데모용으로 파일이나 SQLite 없이 같은 동작을 제공한다.
+    - 최신순 목록: (-created_at, -id) 키를 정렬 리스트로 유지해 페이지를 슬라이스로 자름
+    - 태그: 태그별 게시글 id 집합, 게시글별 태그는 이름순 리스트
+    - 댓글: 게시글별 path 정렬 리스트 (PostRepository와 같은 materialized path)
+    - 첨부파일: 내용(SHA-256)별 bytes 하나를 참조 수로 공유
+    아카이브/동기화/유지보수 기능은 없으며, 스레드 간 동시 접근은 호출하는 쪽에서 막아야 한다.
+    """
+
+    CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self):
+        self._posts: dict[int, Post] = {}
+        self._created_ms: dict[int, int] = {}
+        self._order: list[tuple[int, int]] = []       # (-created_at ms, -id)
+        self._ids: list[int] = []                     # 오름차순 (읽지 않은 글 수 계산용)
+        self._next_post_id = 1
+
+        self._tag_posts: dict[str, set[int]] = {}
+
+        self._comments: dict[int, Comment] = {}
+        self._comment_paths: dict[int, list[str]] = {}   # post_id → 정렬된 path
+        self._comment_by_path: dict[str, int] = {}
+        self._next_comment_id = 1
+
+        self._attachments: dict[int, Attachment] = {}
+        self._blobs: dict[str, bytes] = {}
+        self._blob_refs: dict[str, int] = {}
+        self._next_attachment_id = 1
+
+        self._read_sets: dict[str, ReadSet] = {}
+        self._author_posts: dict[str, int] = {}
+        self._author_activity: dict[str, int] = {}
+        self._daily_posts: dict[str, int] = {}
+
+        self.view_counter = ViewCounter()
+        self.change_listeners: list[Callable[[int], None]] = []
+
+    # === 게시글 ===
+
+    def _copy(self, post: Post, include_content: bool = True, include_tags: bool = True) -> Post:
+        return replace(
+            post,
+            content=post.content if include_content else "",
+            tags=list(post.tags) if include_tags else None,
+            view_count=post.view_count + self.view_counter.pending(post.id),
+        )
+
+    def _local_day(self, created_ms: int) -> str:
+        return datetime.fromtimestamp(created_ms / 1000).date().isoformat()
+
+    def _insert(self, title: str, content: str, author: str, tags: list[str]) -> int:
+        post_id = self._next_post_id
+        self._next_post_id += 1
+        now = _now_ms()
+        tags = sorted(normalize_tags(tags))
+        self._posts[post_id] = Post(
+            id=post_id, title=title, content=content, author=author,
+            created_at=from_ms(now), updated_at=from_ms(now), tags=tags,
+        )
+        self._created_ms[post_id] = now
+        insort(self._order, (-now, -post_id))
+        self._ids.append(post_id)
+        for tag in tags:
+            self._tag_posts.setdefault(tag, set()).add(post_id)
+
+        self._author_posts[author] = self._author_posts.get(author, 0) + 1
+        self._author_activity[author] = max(self._author_activity.get(author, 0), now)
+        day = self._local_day(now)
+        self._daily_posts[day] = self._daily_posts.get(day, 0) + 1
+        return post_id
+
+    def _set_tags(self, post: Post, tags: list[str]):
+        tags = sorted(normalize_tags(tags))
+        for tag in set(post.tags) - set(tags):
+            self._tag_posts[tag].discard(post.id)
+            if not self._tag_posts[tag]:
+                del self._tag_posts[tag]
+        for tag in set(tags) - set(post.tags):
+            self._tag_posts.setdefault(tag, set()).add(post.id)
+        post.tags = tags
+
+    def create(self, post: Post) -> int:
+        title, content = validate_post_fields(post.title, post.content)
+        author = post.author.strip() if post.author.strip() else "익명"
+        return self._insert(title, content, author, post.tags or [])
+
+    def create_many(self, posts: list[Post]) -> list[int]:
+        """하나라도 유효하지 않으면 아무것도 만들지 않음"""
+        rows = []
+        for post in posts:
+            title, content = validate_post_fields(post.title, post.content)
+            author = post.author.strip() if post.author.strip() else "익명"
+            rows.append((title, content, author, post.tags or []))
+        return [self._insert(*row) for row in rows]
+
+    def count(self) -> int:
+        return len(self._posts)
+
+    def _ordered_ids(self, offset: int = 0, limit: Optional[int] = None) -> list[int]:
+        end = None if limit is None else offset + limit
+        return [-key[1] for key in self._order[offset:end]]
+
+    def get_all(self) -> list[Post]:
+        return [self._copy(self._posts[post_id], False, False) for post_id in self._ordered_ids()]
+
+    def get_page(self, page: int = 1, page_size: int = 50) -> list[Post]:
+        post_ids = self._ordered_ids((max(page, 1) - 1) * page_size, page_size)
+        return [self._copy(self._posts[post_id], include_content=False) for post_id in post_ids]
+
+    def iter_all(self, batch_size: int = 500, include_content: bool = False) -> Iterator[Post]:
+        """최신순 제너레이터 (배치마다 마지막 키 다음부터 다시 찾으므로 도중에 글이 바뀌어도 됨)"""
+        last = None
+        while True:
+            start = 0 if last is None else bisect_right(self._order, last)
+            keys = self._order[start:start + batch_size]
+            if not keys:
+                return
+            for key in keys:
+                post = self._posts.get(-key[1])
+                if post is not None:
+                    yield self._copy(post, include_content, False)
+            last = keys[-1]
+
+    def search(self, keyword: str, page: int = 1, page_size: int = 50) -> list[Post]:
+        keyword = keyword.translate(_ASCII_LOWER)
+        skip = (max(page, 1) - 1) * page_size
+        posts = []
+        for post_id in self._ordered_ids():
+            post = self._posts[post_id]
+            if keyword not in post.title.translate(_ASCII_LOWER) \
+                    and keyword not in post.content.translate(_ASCII_LOWER):
+                continue
+            if skip:
+                skip -= 1
+                continue
+            posts.append(self._copy(post, include_content=False))
+            if len(posts) == page_size:
+                break
+        return posts
+
+    def get_by_tags(self, tags: list[str], match_all: bool = False,
+                    page: int = 1, page_size: Optional[int] = 50) -> list[Post]:
+        """get_all()과 같은 (created_at, id) 역순으로 조회, page_size=None이면 전체"""
+        keys = self._tag_post_keys(tags, match_all)
+        if page_size is not None:
+            offset = (max(page, 1) - 1) * page_size
+            keys = keys[offset:offset + page_size]
+        return [self._copy(self._posts[-key[1]], include_content=False) for key in keys]
+
+    def iter_by_tags(self, tags: list[str], match_all: bool = False, batch_size: int = 500) -> Iterator[Post]:
+        """배치마다 마지막 키 다음부터 다시 찾으므로 도중에 글이 바뀌어도 됨"""
+        last = None
+        while True:
+            keys = self._tag_post_keys(tags, match_all, last, batch_size)
+            if not keys:
+                return
+            for key in keys:
+                yield self._copy(self._posts[-key[1]], include_content=False)
+            last = keys[-1]
+
+    def _tag_post_keys(self, tags: list[str], match_all: bool, after: Optional[tuple[int, int]] = None,
+                       limit: Optional[int] = None) -> list[tuple[int, int]]:
+        """태그 조건에 맞는 글의 정렬 키 (-created_at ms, -id)를 최신순으로 (after가 있으면 그 다음부터)"""
+        tags = normalize_tags(tags)
+        sets = [self._tag_posts[tag] for tag in tags if tag in self._tag_posts]
+        if not sets or (match_all and len(sets) < len(tags)):
+            return []
+        if match_all:
+            sets.sort(key=len)
+            post_ids = set(sets[0]).intersection(*sets[1:])
+        else:
+            post_ids = set().union(*sets)
+
+        keys = ((-self._created_ms[post_id], -post_id) for post_id in post_ids)
+        if after is not None:
+            keys = (key for key in keys if key > after)
+        return sorted(keys) if limit is None else heapq.nsmallest(limit, keys)
+
+    def get_tags(self, limit: Optional[int] = None) -> list[Tag]:
+        tags = sorted(self._tag_posts.items(), key=lambda item: (-len(item[1]), item[0]))
+        return [Tag(name=name, post_count=len(post_ids)) for name, post_ids in tags[:limit]]
+
+    def get_by_id(self, post_id: int) -> Optional[Post]:
+        post = self._posts.get(post_id)
+        return self._copy(post) if post else None
+
+    def update(self, post: Post) -> bool:
+        """post.tags가 None이면 태그는 그대로 둠"""
+        title, content = validate_post_fields(post.title, post.content)
+        stored = self._posts.get(post.id)
+        if not stored:
+            return False
+        now = _now_ms()
+        stored.title = title
+        stored.content = content
+        stored.updated_at = from_ms(now)
+        self._author_activity[stored.author] = max(self._author_activity.get(stored.author, 0), now)
+        if post.tags is not None:
+            self._set_tags(stored, post.tags)
+        self._notify_changed([post.id])
+        return True
+
+    def delete(self, post_id: int) -> bool:
+        """게시글과 댓글/첨부파일/태그를 함께 삭제"""
+        post = self._posts.pop(post_id, None)
+        if not post:
+            return False
+        created_ms = self._created_ms.pop(post_id)
+        del self._order[bisect_left(self._order, (-created_ms, -post_id))]
+        del self._ids[bisect_left(self._ids, post_id)]
+        self._set_tags(post, [])
+
+        self._author_posts[post.author] -= 1
+        if self._author_posts[post.author] <= 0:
+            del self._author_posts[post.author]
+            del self._author_activity[post.author]
+        day = self._local_day(created_ms)
+        self._daily_posts[day] -= 1
+        if self._daily_posts[day] <= 0:
+            del self._daily_posts[day]
+
+        for path in self._comment_paths.pop(post_id, []):
+            del self._comments[self._comment_by_path.pop(path)]
+        for attachment in [a for a in self._attachments.values() if a.post_id == post_id]:
+            self._remove_attachment(attachment.id)
+
+        self._notify_changed([post_id])
+        return True
+
+    def add_change_listener(self, listener: Callable[[int], None]):
+        self.change_listeners.append(listener)
+
+    def _notify_changed(self, post_ids: list[int]):
+        for post_id in post_ids:
+            for listener in self.change_listeners:
+                listener(post_id)
+
+    def get_stats(self, author_limit: int = 10, day_limit: int = 30) -> BoardStats:
+        authors = sorted(self._author_posts.items(), key=lambda item: (-item[1], item[0]))[:author_limit]
+        days = sorted(self._daily_posts.items(), reverse=True)[:day_limit]
+        return BoardStats(
+            total_posts=len(self._posts),
+            total_authors=len(self._author_posts),
+            authors=[
+                AuthorStats(author=author, post_count=count,
+                            last_activity=from_ms(self._author_activity[author]))
+                for author, count in authors
+            ],
+            daily=[DailyStats(day=datetime.fromisoformat(day).date(), post_count=count) for day, count in days],
+        )
+
+    # === 조회수 ===
+
+    def record_view(self, post_id: int):
+        self.view_counter.add(post_id)
+
+    def flush_views(self) -> int:
+        pending = self.view_counter.take()
+        for post_id, count in pending.items():
+            if post_id in self._posts:
+                self._posts[post_id].view_count += count
+        return sum(pending.values())
+
+    # === 읽음 표시 ===
+
+    def get_read_set(self, reader: str) -> ReadSet:
+        return self._read_sets.setdefault(reader, ReadSet())
+
+    def mark_read(self, reader: str, post_ids: list[int]):
+        read_set = self.get_read_set(reader)
+        for post_id in post_ids:
+            read_set.add(post_id)
+
+    def mark_all_read(self, reader: str):
+        self.get_read_set(reader).mark_upto(self._ids[-1] if self._ids else 0)
+
+    def is_read(self, reader: str, post_ids: list[int]) -> dict[int, bool]:
+        return self.get_read_set(reader).contains_many(post_ids)
+
+    def unread_count(self, reader: str) -> int:
+        """정렬된 id 목록에서 read_upto 이후 개수와 읽은 구간의 개수를 이분 탐색으로 셈"""
+        read_set = self.get_read_set(reader)
+        unread = len(self._ids) - bisect_right(self._ids, read_set.read_upto)
+        for first_id, last_id in read_set.ranges:
+            unread -= bisect_right(self._ids, last_id) - bisect_left(self._ids, first_id)
+        return unread
+
+    # === 첨부파일 ===
+
+    def add_attachment(self, post_id: int, filename: str, stream: BinaryIO) -> Attachment:
+        filename = os.path.basename(filename.strip())
+        if not filename:
+            raise ValueError("파일 이름은 필수입니다.")
+        if post_id not in self._posts:
+            raise ValueError("게시글을 찾을 수 없습니다.")
+
+        sha256 = hashlib.sha256()
+        chunks = []
+        while True:
+            chunk = stream.read(self.CHUNK_SIZE)
+            if not chunk:
+                break
+            sha256.update(chunk)
+            chunks.append(chunk)
+        digest = sha256.hexdigest()
+        data = self._blobs.setdefault(digest, b"".join(chunks))
+        self._blob_refs[digest] = self._blob_refs.get(digest, 0) + 1
+
+        attachment = Attachment(
+            id=self._next_attachment_id, post_id=post_id, filename=filename,
+            digest=digest, size=len(data), created_at=from_ms(_now_ms()),
+        )
+        self._next_attachment_id += 1
+        self._attachments[attachment.id] = attachment
+        return replace(attachment)
+
+    def add_attachment_file(self, post_id: int, file_path: str) -> Attachment:
+        with open(file_path, "rb") as stream:
+            return self.add_attachment(post_id, os.path.basename(file_path), stream)
+
+    def get_attachment(self, attachment_id: int) -> Optional[Attachment]:
+        attachment = self._attachments.get(attachment_id)
+        return replace(attachment) if attachment else None
+
+    def get_attachments(self, post_id: int) -> list[Attachment]:
+        return [replace(a) for a in sorted(self._attachments.values(), key=lambda a: a.id)
+                if a.post_id == post_id]
+
+    def save_attachment(self, attachment_id: int, destination: BinaryIO) -> bool:
+        attachment = self._attachments.get(attachment_id)
+        if not attachment:
+            return False
+        data = self._blobs[attachment.digest]
+        for start in range(0, len(data), self.CHUNK_SIZE):
+            destination.write(data[start:start + self.CHUNK_SIZE])
+        return True
+
+    def read_attachment_preview(self, attachment_id: int, limit: int = 4096) -> Optional[bytes]:
+        attachment = self._attachments.get(attachment_id)
+        return self._blobs[attachment.digest][:limit] if attachment else None
+
+    def _remove_attachment(self, attachment_id: int):
+        attachment = self._attachments.pop(attachment_id)
+        self._blob_refs[attachment.digest] -= 1
+        if self._blob_refs[attachment.digest] <= 0:
+            del self._blob_refs[attachment.digest]
+            del self._blobs[attachment.digest]
+
+    def delete_attachment(self, attachment_id: int) -> bool:
+        if attachment_id not in self._attachments:
+            return False
+        self._remove_attachment(attachment_id)
+        return True
+
+    # === 댓글 ===
+
+    def add_comment(self, post_id: int, content: str, author: str = "",
+                    parent_id: Optional[int] = None) -> int:
+        content = content.strip()
+        if not content:
+            raise ValueError("내용은 필수입니다.")
+        author = author.strip() if author.strip() else "익명"
+        if post_id not in self._posts:
+            raise ValueError("게시글을 찾을 수 없습니다.")
+        parent = self._comments.get(parent_id) if parent_id is not None else None
+        if parent_id is not None and (not parent or parent.post_id != post_id):
+            raise ValueError("답글을 달 댓글을 찾을 수 없습니다.")
+
+        comment_id = self._next_comment_id
+        self._next_comment_id += 1
+        path = (parent.path if parent else "") + f"{comment_id:010d}/"
+        self._comments[comment_id] = Comment(
+            id=comment_id, post_id=post_id, parent_id=parent_id, author=author, content=content,
+            depth=parent.depth + 1 if parent else 0, path=path, created_at=from_ms(_now_ms()),
+        )
+        insort(self._comment_paths.setdefault(post_id, []), path)
+        self._comment_by_path[path] = comment_id
+        self._posts[post_id].comment_count += 1
+        return comment_id
+
+    def get_comments(self, post_id: int, after_path: Optional[str] = None,
+                     limit: Optional[int] = None) -> list[Comment]:
+        paths = self._comment_paths.get(post_id, [])
+        start = bisect_right(paths, after_path or "")
+        end = None if limit is None else start + limit
+        return [replace(self._comments[self._comment_by_path[path]]) for path in paths[start:end]]
+
+    def _subtree(self, comment: Comment) -> tuple[list[str], int, int]:
+        # '/' 다음 문자가 '0'이므로 [path, path의 마지막 '/'를 '0'으로 바꾼 값) 이 하위 트리 전체
+        paths = self._comment_paths[comment.post_id]
+        start = bisect_left(paths, comment.path)
+        end = bisect_left(paths, comment.path[:-1] + "0")
+        return paths, start, end
+
+    def get_comment_thread(self, comment_id: int) -> list[Comment]:
+        comment = self._comments.get(comment_id)
+        if not comment:
+            return []
+        paths, start, end = self._subtree(comment)
+        return [replace(self._comments[self._comment_by_path[path]]) for path in paths[start:end]]
+
+    def delete_comment(self, comment_id: int) -> bool:
+        comment = self._comments.get(comment_id)
+        if not comment:
+            return False
+        paths, start, end = self._subtree(comment)
+        for path in paths[start:end]:
+            del self._comments[self._comment_by_path.pop(path)]
+        del paths[start:end]
+        self._posts[comment.post_id].comment_count -= end - start
+        return True
+
+    def close(self):
+        self.flush_views()
@@ -11,3 +11,36 @@ class Post:
     author: str = ""
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
+    comment_count: int = 0
+    view_count: int = 0
+    archived: bool = False            # 연도별 아카이브로 옮겨진 글 (읽기 전용)
+    # None: 태그를 읽지 않음(전체 목록 등) / 수정 시 태그를 바꾸지 않음
+    tags: Optional[list[str]] = None
+
+    def to_dict(self, include_content: bool = True) -> dict:
+        """JSON 직렬화용 dict (일시는 ISO 8601 문자열)"""
+        data = {
+            "id": self.id,
+            "title": self.title,
+            "author": self.author,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "comment_count": self.comment_count,
+            "view_count": self.view_count,
+        }
+        if self.tags is not None:
+            data["tags"] = list(self.tags)
+        if include_content:
+            data["content"] = self.content
+        return data
+
+
+def validate_post_fields(title: str, content: str) -> tuple[str, str]:
+    """앞뒤 공백을 제거한 (제목, 내용) 반환, 비어 있으면 ValueError"""
+    title = title.strip()
+    content = content.strip()
+    if not title:
+        raise ValueError("제목은 필수입니다.")
+    if not content:
+        raise ValueError("내용은 필수입니다.")
+    return title, content
@@ -0,0 +1,73 @@
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Optional
+
+from .post_repository import PostRepository
+
+
+class PostArchiver:
+    """오래된 게시글을 연도별 아카이브 파일로 옮기는 백그라운드 작업
+
+    최근 keep_years년(UTC 기준, 올해 포함)은 라이브 DB에 두고 그 이전 글을
+    batch_size개씩 옮긴다. 배치마다 짧은 트랜잭션으로 커밋하고 pause초 쉬므로
+    옮기는 동안에도 앱/서버의 읽기와 쓰기는 계속된다.
+    """
+
+    def __init__(self, db_path: str, keep_years: int = 2, batch_size: int = 500, pause: float = 0.05):
+        self.db_path = db_path
+        self.keep_years = keep_years
+        self.batch_size = batch_size
+        self.pause = pause
+        self._stop_event: Optional[threading.Event] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def before_year(self) -> int:
+        return datetime.now(timezone.utc).year - self.keep_years + 1
+
+    def run_once(self, stop_event: Optional[threading.Event] = None) -> int:
+        """옮길 후보가 없을 때까지(또는 stop_event가 설정될 때까지) 배치를 반복하고 옮긴 게시글 수 반환"""
+        repository = PostRepository(self.db_path)
+        total = 0
+        try:
+            for moved in repository.iter_archive_batches(self.before_year(), self.batch_size):
+                total += moved
+                # 배치 사이에 쉬면서 중지 요청 확인
+                if stop_event is not None:
+                    if stop_event.wait(self.pause):
+                        break
+                else:
+                    time.sleep(self.pause)
+        finally:
+            repository.close()
+        return total
+
+    # === 주기적 실행 ===
+
+    def start(self, interval: float):
+        """interval초마다 백그라운드 스레드에서 run_once()"""
+        if self._thread:
+            return
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, args=(interval, self._stop_event),
+            name="post-archiver", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self, interval: float, stop_event: threading.Event):
+        while True:
+            try:
+                self.run_once(stop_event)
+            except sqlite3.Error:
+                # 다음 주기에 다시 시도
+                pass
+            if stop_event.wait(interval):
+                break
+
+    def stop(self):
+        if self._thread:
+            self._stop_event.set()
+            self._thread.join()
+            self._thread = None
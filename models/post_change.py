@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class PostChange:
+    """다른 DB로 보낼 게시글 변경 하나 (change_log 행 + 그 시점의 게시글 내용)"""
+    seq: int = 0                      # 보낸 쪽 change_log의 순번 (받은 위치 기록용)
+    uid: str = ""                     # 모든 DB에서 같은 게시글을 가리키는 id
+    hlc: str = ""
+    deleted: bool = False
+    # 삭제된 글이면 None (아카이브로 옮겨진 글은 아카이브 파일의 내용)
+    title: Optional[str] = None
+    content: Optional[str] = None
+    author: Optional[str] = None
+    created_at: Optional[int] = None  # epoch ms
+    tags: Optional[list[str]] = None
@@ -1,117 +1,1793 @@
 import sqlite3
 import os
-from datetime import datetime
-from typing import Optional
+import shutil
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from datetime import date, datetime, timezone
+from typing import BinaryIO, Callable, Iterator, Optional
 
-from .post import Post
+from .post import Post, validate_post_fields
+from .stats import AuthorStats, BoardStats, DailyStats
+from .tag import Tag, normalize_tags
+from .comment import Comment
+from .attachment import Attachment
+from .blob_store import BlobStore
+from .view_counter import ViewCounter
+from .read_set import ReadSet
+from .post_change import PostChange
+from .hlc import HLC_SQL_FORMAT, receive
+from .timestamps import SQL_NOW_MS, from_ms, sql_local_day, sql_local_text_to_ms
 
 
 class PostRepository:
-    def __init__(self, db_path: str = "board.db"):
+    # 목록 조회 컬럼 (본문 제외)
+    LIST_COLUMNS = "id, title, author, created_at, updated_at, comment_count, view_count"
+    COMMENT_COLUMNS = "id, post_id, parent_id, path, depth, author, content, created_at"
+    ATTACHMENT_COLUMNS = "id, post_id, filename, digest, size, created_at"
+    # PRAGMA user_version
+    # 1: 일시를 UTC epoch ms 정수로 저장 / 2: posts 삭제 트리거가 아카이브 이동 중에는 동작하지 않음
+    # 3: 모든 테이블/트리거를 만든 뒤에 기록 (이 버전의 DB는 열 때 _create_*를 건너뛰므로
+    #    테이블/트리거를 바꾸면 버전을 올려야 함)
+    # 4: post_tags에 게시글 작성 시각 (태그별 목록도 (created_at, id) 최신순으로 인덱스 조회)
+    # 5: posts.updated_at 인덱스
+    # 6: 임시 저장본(drafts) 테이블도 함께 생성 (DraftRepository는 이 버전 이상이면 DDL을 건너뜀)
+    SCHEMA_VERSION = 6
+    MIGRATION_BATCH_SIZE = 5000
+    # 동시에 ATTACH해 두는 아카이브 수 (SQLite 기본 한도 10개 안쪽)
+    MAX_ATTACHED_ARCHIVES = 8
+    # 아카이브 이동 중임을 트리거에 알리는 maintenance_flags 행
+    ARCHIVING_GUARD = "WHEN NOT EXISTS (SELECT 1 FROM maintenance_flags WHERE name = 'archiving')"
+    # 아카이브 쪽 조회에서 hot DB에도 남아 있는 행(이동 중 중단된 경우)을 제외
+    NOT_IN_HOT = "NOT EXISTS (SELECT 1 FROM main.posts AS h WHERE h.id = p.id)"
+    ARCHIVE_COLUMNS = "id, title, content, author, created_at, updated_at, comment_count, view_count"
+    # unread_count()에서 한 쿼리로 세는 읽은 구간 수
+    READ_RANGE_BATCH_SIZE = 400
+    # 아카이브 이동이나 다른 DB의 변경을 반영하는 중에는 change_log에 기록하지 않음
+    SYNC_GUARD = "NOT EXISTS (SELECT 1 FROM maintenance_flags WHERE name IN ('archiving', 'syncing'))"
+    MEMORY_DB = ":memory:"
+    # 다른 연결이 쓰기 잠금을 잡고 있을 때 기다리는 시간(초)
+    # (sqlite3 기본값 5초는 여러 프로그램이 함께 쓰면 잠금 순서가 밀려 "database is locked"로 새어 나옴)
+    BUSY_TIMEOUT = 30.0
+
+    def __init__(self, db_path: str = "board.db", read_only: bool = False, check_same_thread: bool = True,
+                 attachment_dir: Optional[str] = None, archive_dir: Optional[str] = None,
+                 migration_progress: Optional[Callable[[str, int, int], None]] = None, create: bool = True):
+        """read_only=True이면 기존 DB를 읽기 전용으로 열고 스키마를 만들지 않음
+        create=False이면 DB 파일이 없을 때 새로 만들지 않고 sqlite3.OperationalError
+
+        db_path=":memory:"이면 파일 없이 메모리 DB를 쓴다 (테스트/데모용, 아카이브는 지원하지 않음).
+
+        check_same_thread=False는 연결을 여러 스레드가 번갈아 쓰는 경우(서버의 연결 풀 등)에
+        사용하며, 동시 접근은 호출하는 쪽에서 막아야 한다.
+        첨부파일은 attachment_dir (기본값: DB 파일 옆의 attachments/)에,
+        연도별 아카이브 파일은 archive_dir (기본값: DB 파일과 같은 디렉터리)에 둔다.
+        이전 버전 DB를 열면 배치로 나눠 변환하며, 배치마다 migration_progress(단계, 완료, 전체)를 부른다.
+        """
         self.db_path = db_path
+        self.migration_progress = migration_progress
+        self.read_only = read_only
+        self.create_if_missing = create
+        self.check_same_thread = check_same_thread
+        # ":memory:" DB는 닫으면 사라지므로 첨부파일도 임시 디렉터리에 두고 close() 때 지움
+        self.in_memory = db_path == self.MEMORY_DB
+        self._temp_dir = tempfile.mkdtemp(prefix="board-") if self.in_memory and not attachment_dir else None
+        db_dir = os.path.dirname(os.path.abspath(db_path))
+        self.blobs = BlobStore(attachment_dir or os.path.join(self._temp_dir or db_dir, "attachments"))
+        self.archive_dir = archive_dir or db_dir
+        self.view_counter = ViewCounter()
+        # 게시글 수정/삭제 후 post_id로 호출 (렌더링 캐시 무효화 등)
+        self.change_listeners: list[Callable[[int], None]] = []
         self.connection = None
+        self._attached_archives: OrderedDict[int, str] = OrderedDict()
         self._connect()
-        self._create_table()
+        if not read_only:
+            self._ensure_schema()
 
     def _connect(self):
-        db_dir = os.path.dirname(self.db_path)
-        if db_dir:
-            os.makedirs(db_dir, exist_ok=True)
-        self.connection = sqlite3.connect(self.db_path)
+        if self.read_only or not self.create_if_missing:
+            mode = "ro" if self.read_only else "rw"
+            uri = Path(self.db_path).resolve().as_uri() + f"?mode={mode}"
+            self.connection = sqlite3.connect(uri, uri=True, check_same_thread=self.check_same_thread,
+                                              timeout=self.BUSY_TIMEOUT)
+        else:
+            db_dir = os.path.dirname(self.db_path)
+            if db_dir:
+                os.makedirs(db_dir, exist_ok=True)
+            self.connection = sqlite3.connect(self.db_path, check_same_thread=self.check_same_thread,
+                                              timeout=self.BUSY_TIMEOUT)
         self.connection.row_factory = sqlite3.Row
 
+    def enable_wal(self):
+        """WAL 모드로 전환 (읽기 연결이 쓰기를 막지 않음, DB 파일에 유지됨)
+
+        WAL은 같은 컴퓨터의 공유 메모리(-shm 파일)로 연결 사이를 맞추므로, 네트워크 파일 시스템
+        (SMB/NFS 공유 폴더 등)에 있는 DB나 여러 컴퓨터가 함께 여는 DB에는 쓰지 않는다.
+        """
+        self.connection.execute("PRAGMA journal_mode = WAL")
+
+    def _ensure_schema(self):
+        """user_version이 SCHEMA_VERSION보다 낮을 때만 기존 DB 변환과 테이블/트리거 생성
+
+        같은 DB를 여러 프로그램이 동시에 열 때마다 DDL 문마다 쓰기 잠금을 주고받으면
+        다른 연결의 쓰기와 겹쳐 "database is locked"로 열기에 실패하므로,
+        최신 스키마인 DB는 user_version 한 번만 읽고 넘어간다.
+        """
+        cursor = self.connection.cursor()
+        cursor.execute("PRAGMA user_version")
+        version = cursor.fetchone()[0]
+        if version >= self.SCHEMA_VERSION:
+            return
+
+        migrated = self._migrate_schema(version)
+        # 테이블/인덱스/트리거는 한 트랜잭션으로 만들어 문장마다 커밋하지 않음 (새 DB는 커밋 한 번)
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            self._create_table()
+            self._create_stats_tables()
+            self._create_tag_tables()
+            self._create_comment_tables()
+            self._create_attachment_tables()
+            self._create_archive_tables()
+            self._create_sync_tables()
+            self._create_read_state_tables()
+            self.create_draft_table(self.connection)
+            if version < 4:
+                self._backfill_post_tag_times()
+        except Exception:
+            self.connection.rollback()
+            raise
+        if migrated:
+            self.rebuild_stats()
+        # 중간에 중단되면 다음에 열 때 처음부터 다시 (변환/생성은 여러 번 실행해도 같은 결과)
+        cursor.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+        self.connection.commit()
+
+    def _execute_script(self, script: str):
+        """여러 문장을 현재 트랜잭션 안에서 차례로 실행 (executescript()는 먼저 커밋하므로 쓰지 않음)"""
+        statement = ""
+        for line in script.splitlines(keepends=True):
+            statement += line
+            if sqlite3.complete_statement(statement):
+                self.connection.execute(statement)
+                statement = ""
+        if statement.strip():
+            self.connection.execute(statement)
+
+    def _migrate_schema(self, version: int) -> bool:
+        """user_version(version)에 따라 기존 DB 변환 (집계를 다시 계산해야 하면 True)"""
+        cursor = self.connection.cursor()
+        needs_rebuild = False
+        if version < 1:
+            needs_rebuild = self._migrate_timestamps(cursor)
+        if version < 2:
+            # 아카이브 이동 중에는 집계/태그/댓글/첨부가 지워지지 않도록 조건을 붙여 다시 생성
+            for trigger in ("posts_stats_delete", "posts_tags_delete",
+                            "posts_comments_delete", "posts_attachments_delete"):
+                cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        if version < 4:
+            cursor.execute("PRAGMA table_info(post_tags)")
+            columns = [row["name"] for row in cursor.fetchall()]
+            if columns and "created_at" not in columns:
+                cursor.execute("ALTER TABLE post_tags ADD COLUMN created_at INTEGER")
+        self.connection.commit()
+        return needs_rebuild
+
+    def _backfill_post_tag_times(self):
+        """post_tags.created_at이 비어 있는 행을 hot DB와 아카이브의 게시글 작성 시각으로 채움"""
+        cursor = self.connection.cursor()
+        for alias, _ in self._sources():
+            cursor.execute(f"""
+                UPDATE post_tags
+                SET created_at = (SELECT p.created_at FROM {alias}.posts AS p WHERE p.id = post_tags.post_id)
+                WHERE created_at IS NULL
+            """)
+
+    def _migrate_timestamps(self, cursor: sqlite3.Cursor) -> bool:
+        """localtime 문자열로 저장하던 일시를 UTC epoch ms 정수로 변환
+
+        id 범위로 MIGRATION_BATCH_SIZE씩 나눠 커밋하므로 큰 DB도 쓰기 잠금을 오래 잡지 않고,
+        도중에 중단되면 다음 실행 때 문자열로 남은 행만 이어서 변환한다.
+        """
+        cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+        tables = {row["name"] for row in cursor.fetchall()}
+
+        # 문자열 일시를 쓰던 트리거 제거 (_create_* 에서 새 정의로 다시 생성)
+        for trigger in ("update_posts_timestamp", "posts_touch_updated_at", "posts_stats_insert",
+                        "posts_stats_delete", "posts_stats_activity"):
+            cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        self.connection.commit()
+
+        for table, columns in (("posts", ("created_at", "updated_at")),
+                               ("comments", ("created_at",)),
+                               ("attachments", ("created_at",))):
+            if table not in tables:
+                continue
+            assignments = ", ".join(f"{column} = {sql_local_text_to_ms(column)}" for column in columns)
+            cursor.execute(f"SELECT coalesce(max(id), 0) FROM {table}")
+            max_id = cursor.fetchone()[0]
+            for start in range(0, max_id, self.MIGRATION_BATCH_SIZE):
+                cursor.execute(
+                    f"UPDATE {table} SET {assignments} WHERE id > ? AND id <= ?",
+                    (start, start + self.MIGRATION_BATCH_SIZE)
+                )
+                self.connection.commit()
+                self._report_migration(f"timestamps:{table}", min(start + self.MIGRATION_BATCH_SIZE, max_id), max_id)
+        return "posts" in tables
+
+    def _report_migration(self, step: str, done: int, total: int):
+        if self.migration_progress:
+            self.migration_progress(step, done, total)
+
     def _create_table(self):
         cursor = self.connection.cursor()
-        cursor.execute("""
+        cursor.execute(f"""
             CREATE TABLE IF NOT EXISTS posts (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 title TEXT NOT NULL,
                 content TEXT NOT NULL,
                 author TEXT NOT NULL,
-                created_at TIMESTAMP DEFAULT (datetime('now', 'localtime')),
-                updated_at TIMESTAMP DEFAULT (datetime('now', 'localtime'))
+                created_at INTEGER DEFAULT ({SQL_NOW_MS}),
+                updated_at INTEGER DEFAULT ({SQL_NOW_MS})
             )
         """)
 
+        # 댓글 수 (comments 트리거로 관리), 조회수 (flush_views()로 모아서 반영)
+        cursor.execute("PRAGMA table_info(posts)")
+        columns = [row["name"] for row in cursor.fetchall()]
+        if "comment_count" not in columns:
+            cursor.execute("ALTER TABLE posts ADD COLUMN comment_count INTEGER NOT NULL DEFAULT 0")
+        if "view_count" not in columns:
+            cursor.execute("ALTER TABLE posts ADD COLUMN view_count INTEGER NOT NULL DEFAULT 0")
+
+        # 트리거 동작을 잠시 바꿀 때 쓰는 표시 (아카이브 이동 등, 같은 트랜잭션 안에서만 존재)
+        cursor.execute("CREATE TABLE IF NOT EXISTS maintenance_flags (name TEXT PRIMARY KEY)")
+
         # updated_at 자동 갱신 트리거
-        cursor.execute("""
-            CREATE TRIGGER IF NOT EXISTS update_posts_timestamp
-            AFTER UPDATE ON posts
+        # 제목/내용이 바뀔 때만 갱신 (댓글 수 같은 집계 컬럼 변경은 수정으로 보지 않음)
+        cursor.execute("DROP TRIGGER IF EXISTS update_posts_timestamp")
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS posts_touch_updated_at
+            AFTER UPDATE OF title, content ON posts
             FOR EACH ROW
             BEGIN
-                UPDATE posts SET updated_at = datetime('now', 'localtime') WHERE id = NEW.id;
+                UPDATE posts SET updated_at = {SQL_NOW_MS} WHERE id = NEW.id;
             END
         """)
+
+        # 목록 정렬/페이지 조회용 인덱스
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_posts_created_at
+            ON posts (created_at DESC, id DESC)
+        """)
+        # 최근 수정순 조회/동기화 변경 범위 확인용
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_posts_updated_at
+            ON posts (updated_at DESC, id DESC)
+        """)
+
+    def _create_stats_tables(self):
+        """작성자별/일별 집계 테이블과 갱신 트리거 생성"""
+        cursor = self.connection.cursor()
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'board_stats'")
+        needs_backfill = cursor.fetchone() is None
+
+        self._execute_script(f"""
+            CREATE TABLE IF NOT EXISTS board_stats (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                post_count INTEGER NOT NULL DEFAULT 0,
+                author_count INTEGER NOT NULL DEFAULT 0
+            );
+
+            CREATE TABLE IF NOT EXISTS author_stats (
+                author TEXT PRIMARY KEY,
+                post_count INTEGER NOT NULL DEFAULT 0,
+                last_activity INTEGER
+            );
+            CREATE INDEX IF NOT EXISTS idx_author_stats_post_count
+                ON author_stats (post_count DESC, author);
+
+            CREATE TABLE IF NOT EXISTS daily_stats (
+                day TEXT PRIMARY KEY,
+                post_count INTEGER NOT NULL DEFAULT 0
+            );
+
+            -- 작성자 수는 author_stats 행의 생성/삭제로 관리
+            CREATE TRIGGER IF NOT EXISTS author_stats_insert
+            AFTER INSERT ON author_stats
+            BEGIN
+                UPDATE board_stats SET author_count = author_count + 1 WHERE id = 1;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS author_stats_delete
+            AFTER DELETE ON author_stats
+            BEGIN
+                UPDATE board_stats SET author_count = author_count - 1 WHERE id = 1;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS posts_stats_insert
+            AFTER INSERT ON posts
+            BEGIN
+                UPDATE board_stats SET post_count = post_count + 1 WHERE id = 1;
+                INSERT INTO author_stats (author, post_count, last_activity)
+                VALUES (NEW.author, 1, NEW.created_at)
+                ON CONFLICT (author) DO UPDATE SET
+                    post_count = post_count + 1,
+                    last_activity = max(coalesce(last_activity, 0), excluded.last_activity);
+                INSERT INTO daily_stats (day, post_count)
+                VALUES ({sql_local_day('NEW.created_at')}, 1)
+                ON CONFLICT (day) DO UPDATE SET post_count = post_count + 1;
+            END;
+
+            -- 아카이브로 옮긴 게시글은 계속 집계에 포함
+            CREATE TRIGGER IF NOT EXISTS posts_stats_delete
+            AFTER DELETE ON posts
+            {self.ARCHIVING_GUARD}
+            BEGIN
+                UPDATE board_stats SET post_count = post_count - 1 WHERE id = 1;
+                UPDATE author_stats SET post_count = post_count - 1 WHERE author = OLD.author;
+                DELETE FROM author_stats WHERE author = OLD.author AND post_count <= 0;
+                UPDATE daily_stats SET post_count = post_count - 1 WHERE day = {sql_local_day('OLD.created_at')};
+                DELETE FROM daily_stats WHERE day = {sql_local_day('OLD.created_at')} AND post_count <= 0;
+            END;
+
+            -- 수정 시각이 바뀌면 작성자의 마지막 활동 시각 갱신
+            CREATE TRIGGER IF NOT EXISTS posts_stats_activity
+            AFTER UPDATE OF updated_at ON posts
+            BEGIN
+                UPDATE author_stats
+                SET last_activity = max(coalesce(last_activity, 0), NEW.updated_at)
+                WHERE author = NEW.author;
+            END;
+        """)
+
+        if needs_backfill:
+            self.rebuild_stats()
+
+    def rebuild_stats(self):
+        """hot DB와 아카이브의 게시글 전체를 다시 집계 (기존 DB 최초 변환, 유지보수용)"""
+        cursor = self.connection.cursor()
+        cursor.execute("DELETE FROM author_stats")
+        cursor.execute("DELETE FROM daily_stats")
+        cursor.execute("INSERT OR REPLACE INTO board_stats (id, post_count, author_count) VALUES (1, 0, 0)")
+        for alias, archived in list(self._sources()):
+            where_sql = f"WHERE {self.NOT_IN_HOT}" if archived else "WHERE true"
+            cursor.execute(f"""
+                INSERT INTO author_stats (author, post_count, last_activity)
+                SELECT author, COUNT(*), max(max(created_at), max(coalesce(updated_at, 0)))
+                FROM {alias}.posts AS p
+                {where_sql}
+                GROUP BY author
+                ON CONFLICT (author) DO UPDATE SET
+                    post_count = post_count + excluded.post_count,
+                    last_activity = max(coalesce(last_activity, 0), excluded.last_activity)
+            """)
+            cursor.execute(f"""
+                INSERT INTO daily_stats (day, post_count)
+                SELECT {sql_local_day('created_at')} AS day, COUNT(*)
+                FROM {alias}.posts AS p
+                {where_sql}
+                GROUP BY day
+                ON CONFLICT (day) DO UPDATE SET post_count = post_count + excluded.post_count
+            """)
+        cursor.execute("""
+            UPDATE board_stats
+            SET post_count = (SELECT coalesce(sum(post_count), 0) FROM author_stats)
+            WHERE id = 1
+        """)
+
+    def _create_tag_tables(self):
+        """태그 테이블 (tags: 태그별 게시글 수를 트리거로 관리, post_tags: 다대다 연결)"""
+        self._execute_script(f"""
+            CREATE TABLE IF NOT EXISTS tags (
+                id INTEGER PRIMARY KEY,
+                name TEXT NOT NULL UNIQUE,
+                post_count INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE INDEX IF NOT EXISTS idx_tags_post_count ON tags (post_count DESC, name);
+
+            -- (tag_id, created_at, post_id) 인덱스와 (post_id, tag_id) 인덱스가 각각
+            -- 태그별 최신순 게시글 조회, 게시글별 태그 조회를 테이블 접근 없이 처리
+            -- created_at은 게시글 작성 시각 사본 (아카이브로 옮긴 글도 hot DB에서 정렬하기 위함)
+            CREATE TABLE IF NOT EXISTS post_tags (
+                tag_id INTEGER NOT NULL,
+                post_id INTEGER NOT NULL,
+                created_at INTEGER,
+                PRIMARY KEY (tag_id, post_id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_post_tags_post ON post_tags (post_id, tag_id);
+            CREATE INDEX IF NOT EXISTS idx_post_tags_recent
+            ON post_tags (tag_id, created_at DESC, post_id DESC);
+
+            CREATE TRIGGER IF NOT EXISTS post_tags_created_at
+            AFTER INSERT ON post_tags
+            WHEN NEW.created_at IS NULL
+            BEGIN
+                UPDATE post_tags SET created_at = (SELECT created_at FROM posts WHERE id = NEW.post_id)
+                WHERE tag_id = NEW.tag_id AND post_id = NEW.post_id;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS posts_tags_created_at
+            AFTER UPDATE OF created_at ON posts
+            BEGIN
+                UPDATE post_tags SET created_at = NEW.created_at WHERE post_id = NEW.id;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS post_tags_insert
+            AFTER INSERT ON post_tags
+            BEGIN
+                UPDATE tags SET post_count = post_count + 1 WHERE id = NEW.tag_id;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS post_tags_delete
+            AFTER DELETE ON post_tags
+            BEGIN
+                UPDATE tags SET post_count = post_count - 1 WHERE id = OLD.tag_id;
+                DELETE FROM tags WHERE id = OLD.tag_id AND post_count <= 0;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS posts_tags_delete
+            AFTER DELETE ON posts
+            {self.ARCHIVING_GUARD}
+            BEGIN
+                DELETE FROM post_tags WHERE post_id = OLD.id;
+            END;
+        """)
+
+    def _create_comment_tables(self):
+        """댓글 테이블 (materialized path로 스레드 전체/일부를 인덱스 범위 조회 한 번에 읽음)
+
+        path는 조상부터 자신까지의 id를 10자리로 맞춰 '/'로 이은 문자열이므로
+        path 순 정렬이 곧 스레드 순서(부모 다음에 자식, 형제는 작성순)가 된다.
+        """
+        self._execute_script(f"""
+            CREATE TABLE IF NOT EXISTS comments (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                post_id INTEGER NOT NULL,
+                parent_id INTEGER,
+                path TEXT NOT NULL DEFAULT '',
+                depth INTEGER NOT NULL DEFAULT 0,
+                author TEXT NOT NULL,
+                content TEXT NOT NULL,
+                created_at INTEGER DEFAULT ({SQL_NOW_MS})
+            );
+            CREATE INDEX IF NOT EXISTS idx_comments_thread ON comments (post_id, path);
+
+            -- 삽입 직후 부모의 path 뒤에 자신의 id를 붙이고, 게시글의 댓글 수 증가
+            CREATE TRIGGER IF NOT EXISTS comments_insert
+            AFTER INSERT ON comments
+            BEGIN
+                UPDATE comments
+                SET path = coalesce((SELECT path FROM comments WHERE id = NEW.parent_id), '')
+                           || printf('%010d/', NEW.id),
+                    depth = coalesce((SELECT depth + 1 FROM comments WHERE id = NEW.parent_id), 0)
+                WHERE id = NEW.id;
+                UPDATE posts SET comment_count = comment_count + 1 WHERE id = NEW.post_id;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS comments_delete
+            AFTER DELETE ON comments
+            BEGIN
+                UPDATE posts SET comment_count = comment_count - 1 WHERE id = OLD.post_id;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS posts_comments_delete
+            AFTER DELETE ON posts
+            {self.ARCHIVING_GUARD}
+            BEGIN
+                DELETE FROM comments WHERE post_id = OLD.id;
+            END;
+        """)
+
+    def _create_attachment_tables(self):
+        """첨부파일 테이블 (blobs: 내용별 참조 수, attachments: 게시글별 첨부 목록)
+
+        같은 내용의 파일은 blobs 행 하나와 저장소 파일 하나를 공유하고,
+        참조 수가 0이 된 blob은 collect_garbage()가 파일과 함께 지운다.
+        """
+        self._execute_script(f"""
+            CREATE TABLE IF NOT EXISTS blobs (
+                digest TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                ref_count INTEGER NOT NULL DEFAULT 0
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_blobs_ref_count ON blobs (ref_count);
+
+            CREATE TABLE IF NOT EXISTS attachments (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                post_id INTEGER NOT NULL,
+                filename TEXT NOT NULL,
+                digest TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at INTEGER DEFAULT ({SQL_NOW_MS})
+            );
+            CREATE INDEX IF NOT EXISTS idx_attachments_post ON attachments (post_id, id);
+
+            CREATE TRIGGER IF NOT EXISTS attachments_insert
+            AFTER INSERT ON attachments
+            BEGIN
+                INSERT INTO blobs (digest, size, ref_count) VALUES (NEW.digest, NEW.size, 1)
+                ON CONFLICT (digest) DO UPDATE SET ref_count = ref_count + 1;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS attachments_delete
+            AFTER DELETE ON attachments
+            BEGIN
+                UPDATE blobs SET ref_count = ref_count - 1 WHERE digest = OLD.digest;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS posts_attachments_delete
+            AFTER DELETE ON posts
+            {self.ARCHIVING_GUARD}
+            BEGIN
+                DELETE FROM attachments WHERE post_id = OLD.id;
+            END;
+        """)
+
+    def _create_archive_tables(self):
+        """연도별 아카이브 목록 (옮긴 게시글의 id 범위와 수를 함께 기록해 필요한 파일만 ATTACH)"""
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS archives (
+                year INTEGER PRIMARY KEY,
+                filename TEXT NOT NULL,
+                min_id INTEGER,
+                max_id INTEGER,
+                post_count INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+
+    def _create_sync_tables(self):
+        """다른 board.db와 주고받을 변경 기록 (sync_clock: 이 DB의 노드 id와 HLC,
+        change_log: 게시글 uid별 마지막 변경, sync_peers: 다른 DB에서 받아 온 위치)
+
+        게시글 작성/수정/삭제와 태그 변경은 트리거가 change_log에 기록하므로
+        어느 경로로 쓰든(GUI, CLI, 서버) 빠짐없이 동기화 대상이 된다.
+        uid별로 한 행만 두고 다시 기록할 때 seq를 새로 받으므로 seq 순서가 곧 보낼 순서다.
+        """
+        cursor = self.connection.cursor()
+        cursor.execute("PRAGMA table_info(posts)")
+        if "uid" not in [row["name"] for row in cursor.fetchall()]:
+            cursor.execute("ALTER TABLE posts ADD COLUMN uid TEXT")
+
+        tick = f"""
+            UPDATE sync_clock
+            SET counter = CASE WHEN {SQL_NOW_MS} <= physical THEN counter + 1 ELSE 0 END,
+                physical = max(physical, {SQL_NOW_MS})
+            WHERE id = 1
+        """
+        hlc = f"(SELECT printf('{HLC_SQL_FORMAT}', physical, counter, node_id) FROM sync_clock WHERE id = 1)"
+        self._execute_script(f"""
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_posts_uid ON posts (uid);
+
+            CREATE TABLE IF NOT EXISTS sync_clock (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                node_id TEXT NOT NULL,
+                physical INTEGER NOT NULL DEFAULT 0,
+                counter INTEGER NOT NULL DEFAULT 0
+            );
+            INSERT OR IGNORE INTO sync_clock (id, node_id) VALUES (1, lower(hex(randomblob(16))));
+
+            CREATE TABLE IF NOT EXISTS change_log (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                uid TEXT NOT NULL UNIQUE,
+                post_id INTEGER,
+                hlc TEXT NOT NULL,
+                deleted INTEGER NOT NULL DEFAULT 0
+            );
+
+            CREATE TABLE IF NOT EXISTS sync_peers (
+                node_id TEXT PRIMARY KEY,
+                pulled_seq INTEGER NOT NULL DEFAULT 0
+            );
+
+            -- 새 글에 uid 부여 (다른 DB에서 받은 글은 uid를 가지고 들어옴)
+            CREATE TRIGGER IF NOT EXISTS posts_sync_insert
+            AFTER INSERT ON posts
+            BEGIN
+                UPDATE posts SET uid = lower(hex(randomblob(16))) WHERE id = NEW.id AND uid IS NULL;
+                {tick} AND {self.SYNC_GUARD};
+                INSERT OR REPLACE INTO change_log (uid, post_id, hlc, deleted)
+                SELECT uid, id, {hlc}, 0 FROM posts WHERE id = NEW.id AND {self.SYNC_GUARD};
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS posts_sync_update
+            AFTER UPDATE OF title, content ON posts
+            WHEN {self.SYNC_GUARD}
+            BEGIN
+                {tick};
+                INSERT OR REPLACE INTO change_log (uid, post_id, hlc, deleted)
+                VALUES (NEW.uid, NEW.id, {hlc}, 0);
+            END;
+
+            -- 삭제는 tombstone으로 남겨 다른 DB에도 전달
+            CREATE TRIGGER IF NOT EXISTS posts_sync_delete
+            AFTER DELETE ON posts
+            WHEN OLD.uid IS NOT NULL AND {self.SYNC_GUARD}
+            BEGIN
+                {tick};
+                INSERT OR REPLACE INTO change_log (uid, post_id, hlc, deleted)
+                VALUES (OLD.uid, OLD.id, {hlc}, 1);
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS post_tags_sync_insert
+            AFTER INSERT ON post_tags
+            WHEN {self.SYNC_GUARD}
+            BEGIN
+                {tick};
+                INSERT OR REPLACE INTO change_log (uid, post_id, hlc, deleted)
+                SELECT uid, id, {hlc}, 0 FROM posts WHERE id = NEW.post_id AND uid IS NOT NULL;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS post_tags_sync_delete
+            AFTER DELETE ON post_tags
+            WHEN {self.SYNC_GUARD}
+            BEGIN
+                {tick};
+                INSERT OR REPLACE INTO change_log (uid, post_id, hlc, deleted)
+                SELECT uid, id, {hlc}, 0 FROM posts WHERE id = OLD.post_id AND uid IS NOT NULL;
+            END;
+        """)
+
+        # 기존 게시글에 uid를 붙이고 수정 시각을 HLC로 삼아 기록 (MIGRATION_BATCH_SIZE씩 커밋)
+        cursor.execute("SELECT COUNT(*) FROM posts WHERE uid IS NULL")
+        total, done = cursor.fetchone()[0], 0
+        while True:
+            cursor.execute("SELECT id FROM posts WHERE uid IS NULL LIMIT ?", (self.MIGRATION_BATCH_SIZE,))
+            post_ids = [row["id"] for row in cursor.fetchall()]
+            if not post_ids:
+                break
+            placeholders = ", ".join("?" * len(post_ids))
+            cursor.execute(
+                f"UPDATE posts SET uid = lower(hex(randomblob(16))) WHERE id IN ({placeholders})", post_ids
+            )
+            cursor.execute(f"""
+                INSERT OR IGNORE INTO change_log (uid, post_id, hlc, deleted)
+                SELECT p.uid, p.id, printf('{HLC_SQL_FORMAT}', coalesce(p.updated_at, p.created_at, 0), 0, c.node_id), 0
+                FROM posts AS p, sync_clock AS c
+                WHERE c.id = 1 AND p.id IN ({placeholders})
+            """, post_ids)
+            self.connection.commit()
+            done += len(post_ids)
+            self._report_migration("sync_uids", done, total)
+
+    def _create_read_state_tables(self):
+        """독자별 읽음 상태 (읽은 id 상한 + 그 위 구간을 인코딩한 BLOB, 독자당 한 행)"""
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS read_state (
+                reader TEXT PRIMARY KEY,
+                read_upto INTEGER NOT NULL DEFAULT 0,
+                ranges BLOB NOT NULL DEFAULT x''
+            ) WITHOUT ROWID
+        """)
+
+    @staticmethod
+    def create_draft_table(connection: sqlite3.Connection):
+        """임시 저장본 테이블 (board.db 스키마의 일부, DraftRepository가 따로 연 DB에도 사용)"""
+        cursor = connection.cursor()
+        cursor.execute(f"""
+            CREATE TABLE IF NOT EXISTS drafts (
+                key TEXT PRIMARY KEY,
+                title TEXT NOT NULL DEFAULT '',
+                content TEXT NOT NULL DEFAULT '',
+                author TEXT NOT NULL DEFAULT '',
+                tags TEXT NOT NULL DEFAULT '',
+                updated_at INTEGER DEFAULT ({SQL_NOW_MS})
+            )
+        """)
+
+        # 태그 컬럼이 없던 기존 DB 변환
+        cursor.execute("PRAGMA table_info(drafts)")
+        if "tags" not in [row[1] for row in cursor.fetchall()]:
+            cursor.execute("ALTER TABLE drafts ADD COLUMN tags TEXT NOT NULL DEFAULT ''")
+
+        # localtime 문자열로 저장하던 기존 일시를 epoch ms로 변환 (행이 적어 한 번에 처리)
+        cursor.execute(
+            f"UPDATE drafts SET updated_at = {sql_local_text_to_ms('updated_at')} "
+            f"WHERE typeof(updated_at) = 'text'"
+        )
+
+    def _year_start_ms(self, year: int) -> int:
+        return int(datetime(year, 1, 1, tzinfo=timezone.utc).timestamp() * 1000)
+
+    def _archives(self) -> list[sqlite3.Row]:
+        """최근 연도부터 아카이브 목록 (archives 테이블이 없는 DB면 빈 목록)"""
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("SELECT year, filename, min_id, max_id, post_count FROM archives ORDER BY year DESC")
+            return cursor.fetchall()
+        except sqlite3.OperationalError:
+            return []
+
+    def _attach_archive(self, year: int, filename: str, create: bool = False) -> str:
+        """아카이브 파일을 필요할 때 ATTACH하고 스키마 이름 반환
+
+        MAX_ATTACHED_ARCHIVES개를 넘으면 가장 오래 쓰지 않은 아카이브를 DETACH한다.
+        """
+        alias = f"archive_{year}"
+        if year in self._attached_archives:
+            self._attached_archives.move_to_end(year)
+            return alias
+        if len(self._attached_archives) >= self.MAX_ATTACHED_ARCHIVES:
+            _, oldest = self._attached_archives.popitem(last=False)
+            self.connection.execute(f"DETACH DATABASE {oldest}")
+
+        path = os.path.join(self.archive_dir, filename)
+        if self.read_only:
+            path = Path(path).resolve().as_uri() + "?mode=ro"
+        self.connection.execute(f"ATTACH DATABASE ? AS {alias}", (path,))
+        self._attached_archives[year] = alias
+
+        if create:
+            self.connection.executescript(f"""
+                CREATE TABLE IF NOT EXISTS {alias}.posts (
+                    id INTEGER PRIMARY KEY,
+                    title TEXT NOT NULL,
+                    content TEXT NOT NULL,
+                    author TEXT NOT NULL,
+                    created_at INTEGER,
+                    updated_at INTEGER,
+                    comment_count INTEGER NOT NULL DEFAULT 0,
+                    view_count INTEGER NOT NULL DEFAULT 0
+                );
+                CREATE INDEX IF NOT EXISTS {alias}.idx_posts_created_at
+                ON posts (created_at DESC, id DESC);
+            """)
+        return alias
+
+    def _sources(self) -> Iterator[tuple[str, bool]]:
+        """(스키마 이름, 아카이브 여부)를 최신 파일부터 순서대로 (아카이브는 꺼낼 때 ATTACH)
+
+        아카이브마다 연도가 겹치지 않고 hot DB에는 그보다 새 글만 있으므로
+        이 순서대로 이어 붙인 결과가 전체 최신순이 된다.
+        """
+        yield "main", False
+        for archive in self._archives():
+            yield self._attach_archive(archive["year"], archive["filename"]), True
+
+    def _select_across(self, where: str = "", params: tuple = (), offset: int = 0, limit: int = -1,
+                       columns: Optional[str] = None) -> list[Post]:
+        """hot DB부터 오래된 아카이브 순으로 조건에 맞는 게시글을 최신순 offset/limit 조회
+
+        앞쪽 파일에서 limit을 채우면 뒤쪽 아카이브는 ATTACH하지 않는다. limit=-1이면 전체.
+        """
+        columns = columns or self.LIST_COLUMNS
+        posts = []
+        cursor = self.connection.cursor()
+        for alias, archived in self._sources():
+            conditions = [where] if where else []
+            if archived:
+                conditions.append(self.NOT_IN_HOT)
+            where_sql = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+            remaining = -1 if limit < 0 else limit - len(posts)
+            cursor.execute(f"""
+                SELECT {columns}
+                FROM {alias}.posts AS p
+                {where_sql}
+                ORDER BY created_at DESC, id DESC
+                LIMIT ? OFFSET ?
+            """, (*params, remaining, offset))
+            rows = cursor.fetchall()
+            if rows:
+                offset = 0
+            elif offset:
+                # 이 파일에서 건너뛴 만큼 offset을 줄이고 다음 파일로
+                cursor.execute(f"SELECT COUNT(*) FROM {alias}.posts AS p {where_sql}", params)
+                offset -= cursor.fetchone()[0]
+            posts.extend(self._row_to_post(row, archived) for row in rows)
+            if 0 <= limit <= len(posts):
+                break
+        return posts
+
+    def archive_batch(self, before_year: int, batch_size: int = 500) -> int:
+        """before_year(UTC 기준) 이전에 작성된 게시글을 batch_size개까지 연도별 아카이브 파일로 옮김
+
+        아카이브에 복사해 커밋한 다음 hot DB에서 지워 커밋하므로 중간에 중단되어도
+        게시글이 사라지지 않는다 (양쪽에 남은 행은 hot DB 쪽을 읽고 다음 실행 때 정리).
+        복사한 뒤 수정/댓글/조회수 반영으로 바뀐 게시글은 지우지 않고 다음 실행으로 미룬다.
+        태그/댓글/첨부/집계는 hot DB에 그대로 두며, 옮긴 게시글은 읽기 전용이 된다.
+        옮긴 게시글 수 반환
+        """
+        return self._archive_batch(before_year, batch_size, None)[0]
+
+    def iter_archive_batches(self, before_year: int, batch_size: int = 500) -> Iterator[int]:
+        """before_year 이전 게시글을 (created_at, id) 순 키셋으로 batch_size개씩 옮기며 배치마다 옮긴 수를 냄
+
+        바뀐 글만 남아 한 배치에서 옮긴 수가 0이어도 그 다음 범위부터 계속한다.
+        """
+        after = None
+        while True:
+            moved, after = self._archive_batch(before_year, batch_size, after)
+            if after is None:
+                return
+            yield moved
+
+    def _archive_batch(self, before_year: int, batch_size: int,
+                       after: Optional[tuple[int, int]]) -> tuple[int, Optional[tuple[int, int]]]:
+        """after 다음의 (created_at, id)부터 한 배치를 옮기고 (옮긴 수, 이번 배치의 마지막 키) 반환
+
+        옮길 후보가 없으면 마지막 키는 None
+        """
+        if self.in_memory:
+            raise ValueError("메모리 DB는 아카이브할 수 없습니다.")
+        self.flush_views()
+        after_sql = "" if after is None else " AND (created_at, id) > (?, ?)"
+        after_params = () if after is None else tuple(after)
+        cursor = self.connection.cursor()
+        cursor.execute(
+            f"SELECT created_at FROM posts WHERE created_at < ?{after_sql} ORDER BY created_at, id LIMIT 1",
+            (self._year_start_ms(before_year), *after_params)
+        )
+        oldest = cursor.fetchone()
+        if not oldest:
+            return 0, None
+        year = datetime.fromtimestamp(oldest["created_at"] / 1000, tz=timezone.utc).year
+        year_end = min(self._year_start_ms(year + 1), self._year_start_ms(before_year))
+
+        cursor.execute(
+            "INSERT OR IGNORE INTO archives (year, filename) VALUES (?, ?)",
+            (year, f"{Path(self.db_path).stem}-archive-{year}.db")
+        )
         self.connection.commit()
+        cursor.execute("SELECT filename FROM archives WHERE year = ?", (year,))
+        alias = self._attach_archive(year, cursor.fetchone()["filename"], create=True)
+
+        cursor.execute(
+            f"SELECT id, created_at FROM posts WHERE created_at < ?{after_sql} ORDER BY created_at, id LIMIT ?",
+            (year_end, *after_params, batch_size)
+        )
+        rows = cursor.fetchall()
+        post_ids = [row["id"] for row in rows]
+        last_key = (rows[-1]["created_at"], rows[-1]["id"])
+        placeholders = ", ".join("?" * len(post_ids))
+        try:
+            cursor.execute(f"""
+                INSERT OR REPLACE INTO {alias}.posts ({self.ARCHIVE_COLUMNS})
+                SELECT {self.ARCHIVE_COLUMNS} FROM main.posts WHERE id IN ({placeholders})
+            """, post_ids)
+            self.connection.commit()
+
+            # 같은 트랜잭션 안에서만 표시를 켜 두어 다른 연결의 삭제에는 영향 없음
+            cursor.execute("INSERT INTO maintenance_flags (name) VALUES ('archiving')")
+            # 쓰기 트랜잭션 안에서 복사본과 같은 글만 골라 지우므로 범위는 실제로 옮긴 글로 계산
+            cursor.execute(f"""
+                SELECT id FROM main.posts
+                WHERE id IN ({placeholders})
+                  AND EXISTS (
+                      SELECT 1 FROM {alias}.posts AS a
+                      WHERE a.id = posts.id
+                        AND a.updated_at IS posts.updated_at
+                        AND a.comment_count = posts.comment_count
+                        AND a.view_count = posts.view_count
+                  )
+            """, post_ids)
+            moved_ids = [row["id"] for row in cursor.fetchall()]
+            if moved_ids:
+                cursor.execute(
+                    f"DELETE FROM main.posts WHERE id IN ({', '.join('?' * len(moved_ids))})", moved_ids
+                )
+                cursor.execute("""
+                    UPDATE archives
+                    SET post_count = post_count + ?,
+                        min_id = min(coalesce(min_id, ?), ?),
+                        max_id = max(coalesce(max_id, ?), ?)
+                    WHERE year = ?
+                """, (len(moved_ids), min(moved_ids), min(moved_ids), max(moved_ids), max(moved_ids), year))
+            cursor.execute("DELETE FROM maintenance_flags WHERE name = 'archiving'")
+            self.connection.commit()
+        except Exception:
+            self.connection.rollback()
+            raise
+        return len(moved_ids), last_key
+
+    def archive_before(self, before_year: int, batch_size: int = 500) -> int:
+        """before_year 이전 게시글을 모두 아카이브로 옮기고 옮긴 수 반환"""
+        return sum(self.iter_archive_batches(before_year, batch_size))
+
+    def _row_to_attachment(self, row: sqlite3.Row) -> Attachment:
+        return Attachment(
+            id=row["id"],
+            post_id=row["post_id"],
+            filename=row["filename"],
+            digest=row["digest"],
+            size=row["size"],
+            created_at=from_ms(row["created_at"]),
+        )
+
+    def _row_to_comment(self, row: sqlite3.Row) -> Comment:
+        return Comment(
+            id=row["id"],
+            post_id=row["post_id"],
+            parent_id=row["parent_id"],
+            author=row["author"],
+            content=row["content"],
+            depth=row["depth"],
+            path=row["path"],
+            created_at=from_ms(row["created_at"]),
+        )
+
+    def _subtree_range(self, path: str) -> tuple[str, str]:
+        # '/' 다음 문자가 '0'이므로 [path, path의 마지막 '/'를 '0'으로 바꾼 값) 이 하위 트리 전체
+        return path, path[:-1] + "0"
 
-    def _row_to_post(self, row: sqlite3.Row) -> Post:
+    def _set_tags(self, cursor: sqlite3.Cursor, post_id: int, tags: list[str]):
+        """게시글의 태그를 tags로 교체 (바뀐 태그만 추가/삭제, 커밋은 호출하는 쪽에서)"""
+        tags = normalize_tags(tags)
+        cursor.executemany("INSERT OR IGNORE INTO tags (name) VALUES (?)", [(tag,) for tag in tags])
+        tag_ids = self._get_tag_ids(cursor, tags)
+
+        cursor.execute("SELECT tag_id FROM post_tags WHERE post_id = ?", (post_id,))
+        current = {row["tag_id"] for row in cursor.fetchall()}
+        wanted = set(tag_ids.values())
+
+        cursor.executemany(
+            "DELETE FROM post_tags WHERE tag_id = ? AND post_id = ?",
+            [(tag_id, post_id) for tag_id in current - wanted]
+        )
+        cursor.executemany(
+            "INSERT INTO post_tags (tag_id, post_id) VALUES (?, ?)",
+            [(tag_id, post_id) for tag_id in wanted - current]
+        )
+
+    def _get_tag_ids(self, cursor: sqlite3.Cursor, tags: list[str]) -> dict[str, int]:
+        if not tags:
+            return {}
+        placeholders = ", ".join("?" * len(tags))
+        cursor.execute(f"SELECT id, name FROM tags WHERE name IN ({placeholders})", tags)
+        return {row["name"]: row["id"] for row in cursor.fetchall()}
+
+    def _attach_tags(self, posts: list[Post]) -> list[Post]:
+        """게시글 목록의 태그를 한 번의 조회로 채움 (페이지 단위 목록용)"""
+        if not posts:
+            return posts
+        by_id = {post.id: post for post in posts}
+        for post in posts:
+            post.tags = []
+        placeholders = ", ".join("?" * len(by_id))
+        cursor = self.connection.cursor()
+        cursor.execute(f"""
+            SELECT pt.post_id, t.name
+            FROM post_tags pt
+            JOIN tags t ON t.id = pt.tag_id
+            WHERE pt.post_id IN ({placeholders})
+            ORDER BY t.name
+        """, list(by_id))
+        for row in cursor.fetchall():
+            by_id[row["post_id"]].tags.append(row["name"])
+        return posts
+
+    def _row_to_post(self, row: sqlite3.Row, archived: bool = False) -> Post:
         return Post(
             id=row["id"],
             title=row["title"],
             content=row["content"] if "content" in row.keys() else "",
             author=row["author"],
-            created_at=datetime.fromisoformat(row["created_at"]) if row["created_at"] else None,
-            updated_at=datetime.fromisoformat(row["updated_at"]) if row["updated_at"] else None,
+            created_at=from_ms(row["created_at"]),
+            updated_at=from_ms(row["updated_at"]),
+            comment_count=row["comment_count"] if "comment_count" in row.keys() else 0,
+            # 아직 반영되지 않은 조회수도 더해서 보여줌
+            view_count=(row["view_count"] if "view_count" in row.keys() else 0)
+                       + self.view_counter.pending(row["id"]),
+            archived=archived,
         )
 
-    def _validate_post_data(self, title: str, content: str) -> tuple[str, str]:
-        title = title.strip()
-        content = content.strip()
-        if not title:
-            raise ValueError("제목은 필수입니다.")
-        if not content:
-            raise ValueError("내용은 필수입니다.")
-        return title, content
-
     def create(self, post: Post) -> int:
-        title, content = self._validate_post_data(post.title, post.content)
+        title, content = validate_post_fields(post.title, post.content)
         author = post.author.strip() if post.author.strip() else "익명"
 
         cursor = self.connection.cursor()
-        cursor.execute(
-            "INSERT INTO posts (title, content, author) VALUES (?, ?, ?)",
-            (title, content, author)
-        )
-        self.connection.commit()
-        return cursor.lastrowid
+        try:
+            cursor.execute(
+                f"INSERT INTO posts (title, content, author, created_at, updated_at) "
+                f"VALUES (?, ?, ?, {SQL_NOW_MS}, {SQL_NOW_MS})",
+                (title, content, author)
+            )
+            post_id = cursor.lastrowid
+            if post.tags:
+                self._set_tags(cursor, post_id, post.tags)
+            self.connection.commit()
+        except Exception:
+            self.connection.rollback()
+            raise
+        return post_id
+
+    def create_many(self, posts: list[Post]) -> list[int]:
+        """여러 게시글을 한 트랜잭션으로 생성 (하나라도 유효하지 않으면 전부 취소)"""
+        rows = []
+        for post in posts:
+            title, content = validate_post_fields(post.title, post.content)
+            author = post.author.strip() if post.author.strip() else "익명"
+            rows.append((title, content, author, post.tags))
+
+        cursor = self.connection.cursor()
+        post_ids = []
+        try:
+            for title, content, author, tags in rows:
+                cursor.execute(
+                    f"INSERT INTO posts (title, content, author, created_at, updated_at) "
+                    f"VALUES (?, ?, ?, {SQL_NOW_MS}, {SQL_NOW_MS})",
+                    (title, content, author)
+                )
+                post_ids.append(cursor.lastrowid)
+                if tags:
+                    self._set_tags(cursor, cursor.lastrowid, tags)
+            self.connection.commit()
+        except Exception:
+            self.connection.rollback()
+            raise
+        return post_ids
+
+    def count(self) -> int:
+        cursor = self.connection.cursor()
+        cursor.execute("SELECT post_count FROM board_stats WHERE id = 1")
+        row = cursor.fetchone()
+        return row["post_count"] if row else 0
 
     def get_all(self) -> list[Post]:
+        return self._select_across()
+
+    def get_page(self, page: int = 1, page_size: int = 50) -> list[Post]:
+        """최신순 페이지 조회 (page는 1부터, 오래된 페이지는 해당 연도 아카이브까지 이어서 조회)"""
+        posts = self._select_across(offset=(max(page, 1) - 1) * page_size, limit=page_size)
+        return self._attach_tags(posts)
+
+    def iter_all(self, batch_size: int = 500, include_content: bool = False) -> Iterator[Post]:
+        """최신순으로 batch_size씩 끊어 읽는 제너레이터 (hot DB 다음 아카이브 순)
+
+        OFFSET 대신 마지막 행의 (created_at, id) 이후를 조회하므로
+        게시글 수와 무관하게 배치마다 일정한 비용으로 읽는다.
+        """
+        columns = f"{self.LIST_COLUMNS}, content" if include_content else self.LIST_COLUMNS
+        for alias, archived in self._sources():
+            last = None
+            while True:
+                conditions = [self.NOT_IN_HOT] if archived else []
+                params = []
+                if last is not None:
+                    conditions.append("(created_at, id) < (?, ?)")
+                    params.extend(last)
+                where_sql = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+                cursor = self.connection.cursor()
+                cursor.execute(f"""
+                    SELECT {columns}
+                    FROM {alias}.posts AS p
+                    {where_sql}
+                    ORDER BY created_at DESC, id DESC
+                    LIMIT ?
+                """, (*params, batch_size))
+                rows = cursor.fetchall()
+                if not rows:
+                    break
+                for row in rows:
+                    yield self._row_to_post(row, archived)
+                last = (rows[-1]["created_at"], rows[-1]["id"])
+
+    def search(self, keyword: str, page: int = 1, page_size: int = 50) -> list[Post]:
+        """제목/내용에 keyword가 포함된 게시글을 최신순으로 조회"""
+        pattern = "%" + keyword.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        posts = self._select_across(
+            "(title LIKE ? ESCAPE '\\' OR content LIKE ? ESCAPE '\\')", (pattern, pattern),
+            offset=(max(page, 1) - 1) * page_size, limit=page_size
+        )
+        return self._attach_tags(posts)
+
+    def get_by_tags(self, tags: list[str], match_all: bool = False,
+                    page: int = 1, page_size: Optional[int] = 50) -> list[Post]:
+        """태그 중 하나라도(match_all=False) 또는 모두(match_all=True) 가진 게시글을 최신순으로 조회
+
+        get_all()과 같은 (created_at, id) 역순이며, post_tags의 (tag_id, created_at, post_id)
+        인덱스만 역순으로 훑으므로 게시글 수가 많아도 페이지 하나를 찾는 비용은 결과 범위에 비례한다.
+        page_size=None이면 전체를 반환한다.
+        """
+        limit = -1 if page_size is None else page_size
+        offset = 0 if page_size is None else (max(page, 1) - 1) * page_size
+        keys = self._tag_post_keys(tags, match_all, None, limit, offset)
+        return self._attach_tags(self._get_by_ids([post_id for _, post_id in keys]))
+
+    def iter_by_tags(self, tags: list[str], match_all: bool = False, batch_size: int = 500) -> Iterator[Post]:
+        """get_by_tags()와 같은 순서로 batch_size씩 끊어 읽는 제너레이터
+
+        OFFSET 대신 마지막 행의 (created_at, id) 이후를 조회하므로 배치마다 비용이 일정하고,
+        읽는 도중 글이 추가/삭제되어도 이미 돌려준 글을 다시 돌려주거나 건너뛰지 않는다.
+        """
+        last = None
+        while True:
+            keys = self._tag_post_keys(tags, match_all, last, batch_size, 0)
+            if not keys:
+                return
+            yield from self._attach_tags(self._get_by_ids([post_id for _, post_id in keys]))
+            last = keys[-1]
+
+    def _tag_post_keys(self, tags: list[str], match_all: bool, after: Optional[tuple[int, int]],
+                       limit: int, offset: int) -> list[tuple[int, int]]:
+        """태그 조건에 맞는 (created_at, post_id)를 최신순으로 (after가 있으면 그 다음부터)"""
         cursor = self.connection.cursor()
-        cursor.execute("""
-            SELECT id, title, author, created_at, updated_at
+        tags = normalize_tags(tags)
+        tag_ids = list(self._get_tag_ids(cursor, tags).values())
+        if not tag_ids or (match_all and len(tag_ids) < len(tags)):
+            return []
+
+        after_sql = "" if after is None else " AND (pt.created_at, pt.post_id) < (?, ?)"
+        after_params = () if after is None else tuple(after)
+        if match_all:
+            # 게시글 수가 가장 적은 태그를 기준으로 훑고 나머지 태그는 기본키로 확인
+            placeholders = ", ".join("?" * len(tag_ids))
+            cursor.execute(
+                f"SELECT id FROM tags WHERE id IN ({placeholders}) ORDER BY post_count, id",
+                tag_ids
+            )
+            base_id, *other_ids = [row["id"] for row in cursor.fetchall()]
+            conditions = "".join(
+                " AND EXISTS (SELECT 1 FROM post_tags x WHERE x.tag_id = ? AND x.post_id = pt.post_id)"
+                for _ in other_ids
+            )
+            cursor.execute(f"""
+                SELECT pt.created_at, pt.post_id
+                FROM post_tags pt
+                WHERE pt.tag_id = ?{after_sql}{conditions}
+                ORDER BY pt.created_at DESC, pt.post_id DESC
+                LIMIT ? OFFSET ?
+            """, (base_id, *after_params, *other_ids, limit, offset))
+        else:
+            # 태그별로 필요한 만큼만 역순으로 읽어 합친 뒤 페이지를 자름
+            # (같은 글은 태그마다 같은 (created_at, post_id)이므로 UNION에서 하나로 합쳐짐)
+            per_tag_limit = -1 if limit < 0 else offset + limit
+            subqueries = " UNION ".join(f"""
+                SELECT * FROM (
+                    SELECT pt.created_at, pt.post_id FROM post_tags pt
+                    WHERE pt.tag_id = ?{after_sql}
+                    ORDER BY pt.created_at DESC, pt.post_id DESC
+                    LIMIT ?
+                )""" for _ in tag_ids
+            )
+            params = []
+            for tag_id in tag_ids:
+                params.extend((tag_id, *after_params, per_tag_limit))
+            cursor.execute(f"""
+                SELECT created_at, post_id FROM ({subqueries})
+                ORDER BY created_at DESC, post_id DESC
+                LIMIT ? OFFSET ?
+            """, (*params, limit, offset))
+        return [(row["created_at"], row["post_id"]) for row in cursor.fetchall()]
+
+    def _get_by_ids(self, post_ids: list[int]) -> list[Post]:
+        """post_ids 순서대로 게시글 조회 (본문 제외)"""
+        if not post_ids:
+            return []
+        placeholders = ", ".join("?" * len(post_ids))
+        cursor = self.connection.cursor()
+        cursor.execute(f"""
+            SELECT {self.LIST_COLUMNS}
             FROM posts
-            ORDER BY created_at DESC, id DESC
-        """)
-        return [self._row_to_post(row) for row in cursor.fetchall()]
+            WHERE id IN ({placeholders})
+        """, post_ids)
+        by_id = {row["id"]: self._row_to_post(row) for row in cursor.fetchall()}
 
-    def get_by_id(self, post_id: int) -> Optional[Post]:
+        # hot DB에 없는 id는 id 범위가 겹치는 아카이브에서만 찾음
+        missing = [post_id for post_id in post_ids if post_id not in by_id]
+        for archive in self._archives() if missing else []:
+            if archive["min_id"] is None:
+                continue
+            in_range = [post_id for post_id in missing if archive["min_id"] <= post_id <= archive["max_id"]]
+            if not in_range:
+                continue
+            alias = self._attach_archive(archive["year"], archive["filename"])
+            placeholders = ", ".join("?" * len(in_range))
+            cursor.execute(f"""
+                SELECT {self.LIST_COLUMNS}
+                FROM {alias}.posts
+                WHERE id IN ({placeholders})
+            """, in_range)
+            by_id.update((row["id"], self._row_to_post(row, archived=True)) for row in cursor.fetchall())
+            missing = [post_id for post_id in missing if post_id not in by_id]
+            if not missing:
+                break
+        return [by_id[post_id] for post_id in post_ids if post_id in by_id]
+
+    def get_tags(self, limit: Optional[int] = None) -> list[Tag]:
+        """게시글 수가 많은 순으로 태그 조회 (집계된 post_count 사용)"""
         cursor = self.connection.cursor()
         cursor.execute("""
-            SELECT id, title, content, author, created_at, updated_at
+            SELECT name, post_count
+            FROM tags
+            WHERE post_count > 0
+            ORDER BY post_count DESC, name
+            LIMIT ?
+        """, (-1 if limit is None else limit,))
+        return [Tag(name=row["name"], post_count=row["post_count"]) for row in cursor.fetchall()]
+
+    def get_by_id(self, post_id: int) -> Optional[Post]:
+        cursor = self.connection.cursor()
+        cursor.execute(f"""
+            SELECT {self.LIST_COLUMNS}, content
             FROM posts
             WHERE id = ?
         """, (post_id,))
         row = cursor.fetchone()
-        return self._row_to_post(row) if row else None
+        if row:
+            return self._attach_tags([self._row_to_post(row)])[0]
+
+        for archive in self._archives():
+            if archive["min_id"] is None or not archive["min_id"] <= post_id <= archive["max_id"]:
+                continue
+            alias = self._attach_archive(archive["year"], archive["filename"])
+            cursor.execute(f"""
+                SELECT {self.LIST_COLUMNS}, content
+                FROM {alias}.posts
+                WHERE id = ?
+            """, (post_id,))
+            row = cursor.fetchone()
+            if row:
+                return self._attach_tags([self._row_to_post(row, archived=True)])[0]
+        return None
 
     def update(self, post: Post) -> bool:
-        title, content = self._validate_post_data(post.title, post.content)
+        """post.tags가 None이면 태그는 그대로 둠"""
+        title, content = validate_post_fields(post.title, post.content)
+
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute("""
+                UPDATE posts
+                SET title = ?, content = ?
+                WHERE id = ?
+            """, (title, content, post.id))
+            updated = cursor.rowcount > 0 # 실제로 수정된 행이 있으면 True
+            if updated and post.tags is not None:
+                self._set_tags(cursor, post.id, post.tags)
+            self.connection.commit()
+        except Exception:
+            self.connection.rollback()
+            raise
+        if updated:
+            self._notify_changed([post.id])
+        return updated
 
+    def delete(self, post_id: int) -> bool:
+        """게시글 삭제 (첨부파일도 함께 지우고, 다른 글이 쓰지 않는 파일은 저장소에서 제거)"""
         cursor = self.connection.cursor()
+        try:
+            # 트리거로 집계/태그/댓글/첨부/변경 기록까지 함께 쓰므로 실패하면 모두 되돌림
+            cursor.execute("DELETE FROM posts WHERE id = ?", (post_id,))
+            deleted = cursor.rowcount > 0 # 실제로 삭제된 행이 있으면 True
+            self.connection.commit()
+        except Exception:
+            self.connection.rollback()
+            raise
+        if deleted:
+            self._notify_changed([post_id])
+            self.collect_garbage()
+        return deleted
+
+    def add_change_listener(self, listener: Callable[[int], None]):
+        self.change_listeners.append(listener)
+
+    def _notify_changed(self, post_ids: list[int]):
+        for post_id in post_ids:
+            for listener in self.change_listeners:
+                listener(post_id)
+
+    # === 조회수 ===
+
+    def record_view(self, post_id: int):
+        """조회수 1 증가 (메모리에만 쌓고 flush_views() 때 DB에 반영)"""
+        self.view_counter.add(post_id)
+
+    def flush_views(self) -> int:
+        """쌓인 조회수를 한 트랜잭션으로 반영하고 반영한 조회 수 반환
+
+        값을 덮어쓰지 않고 view_count + 증가분으로 갱신하므로
+        같은 DB를 여러 프로그램이 함께 열어도 서로의 조회수를 지우지 않는다.
+        실패하면 증가분을 버퍼에 되돌려 다음에 다시 시도한다.
+        """
+        pending = self.view_counter.take()
+        if not pending:
+            return 0
+        try:
+            self.connection.executemany(
+                "UPDATE posts SET view_count = view_count + ? WHERE id = ?",
+                [(count, post_id) for post_id, count in sorted(pending.items())]
+            )
+            self.connection.commit()
+        except Exception:
+            self.connection.rollback()
+            self.view_counter.restore(pending)
+            raise
+        return sum(pending.values())
+
+    # === 읽음 표시 ===
+
+    def get_read_set(self, reader: str) -> ReadSet:
+        cursor = self.connection.cursor()
+        cursor.execute("SELECT read_upto, ranges FROM read_state WHERE reader = ?", (reader,))
+        row = cursor.fetchone()
+        return ReadSet.from_bytes(row["read_upto"], row["ranges"]) if row else ReadSet()
+
+    def _save_read_set(self, cursor: sqlite3.Cursor, reader: str, read_set: ReadSet):
         cursor.execute("""
-            UPDATE posts
-            SET title = ?, content = ?
-            WHERE id = ?
-        """, (title, content, post.id))
+            INSERT INTO read_state (reader, read_upto, ranges) VALUES (?, ?, ?)
+            ON CONFLICT (reader) DO UPDATE SET read_upto = excluded.read_upto, ranges = excluded.ranges
+        """, (reader, read_set.read_upto, read_set.to_bytes()))
+
+    def mark_read(self, reader: str, post_ids: list[int]):
+        """post_ids를 reader가 읽은 것으로 표시 (같은 독자를 여러 연결이 갱신해도 잃지 않도록 쓰기 잠금 안에서)"""
+        cursor = self.connection.cursor()
         self.connection.commit()
-        return cursor.rowcount > 0 # 실제로 수정된 행이 있으면 True
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            read_set = self.get_read_set(reader)
+            for post_id in post_ids:
+                read_set.add(post_id)
+            self._save_read_set(cursor, reader, read_set)
+            self.connection.commit()
+        except Exception:
+            self.connection.rollback()
+            raise
 
-    def delete(self, post_id: int) -> bool:
+    def mark_all_read(self, reader: str):
+        """지금까지 작성된 글을 모두 읽은 것으로 표시"""
+        cursor = self.connection.cursor()
+        self.connection.commit()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            cursor.execute("SELECT coalesce(max(id), 0) FROM posts")
+            max_id = cursor.fetchone()[0]
+            archive_max_ids = [archive["max_id"] or 0 for archive in self._archives()]
+            read_set = self.get_read_set(reader)
+            read_set.mark_upto(max([max_id, *archive_max_ids]))
+            self._save_read_set(cursor, reader, read_set)
+            self.connection.commit()
+        except Exception:
+            self.connection.rollback()
+            raise
+
+    def is_read(self, reader: str, post_ids: list[int]) -> dict[int, bool]:
+        """목록 한 화면 분량의 읽음 여부를 한 번의 조회로 확인"""
+        return self.get_read_set(reader).contains_many(post_ids)
+
+    def unread_count(self, reader: str) -> int:
+        """reader가 읽지 않은 게시글 수
+
+        read_upto보다 큰 id만 세고 읽은 구간에 든 글을 빼므로 id 범위 조회만 한다.
+        아카이브는 read_upto보다 큰 id를 가진 파일만 연다.
+        """
+        read_set = self.get_read_set(reader)
+        ranges = read_set.ranges
+        cursor = self.connection.cursor()
+        sources = [("main", False)] + [
+            (self._attach_archive(archive["year"], archive["filename"]), True)
+            for archive in self._archives()
+            if archive["max_id"] is not None and archive["max_id"] > read_set.read_upto
+        ]
+        unread = 0
+        for alias, archived in sources:
+            not_in_hot = f"AND {self.NOT_IN_HOT}" if archived else ""
+            cursor.execute(
+                f"SELECT COUNT(*) FROM {alias}.posts AS p WHERE p.id > ? {not_in_hot}", (read_set.read_upto,)
+            )
+            unread += cursor.fetchone()[0]
+            for start in range(0, len(ranges), self.READ_RANGE_BATCH_SIZE):
+                batch = ranges[start:start + self.READ_RANGE_BATCH_SIZE]
+                values = ", ".join("(?, ?)" for _ in batch)
+                cursor.execute(f"""
+                    WITH r (first_id, last_id) AS (VALUES {values})
+                    SELECT COUNT(*) FROM r JOIN {alias}.posts AS p ON p.id BETWEEN r.first_id AND r.last_id
+                    WHERE true {not_in_hot}
+                """, [value for pair in batch for value in pair])
+                unread -= cursor.fetchone()[0]
+        return unread
+
+    # === 첨부파일 ===
+
+    def add_attachment(self, post_id: int, filename: str, stream: BinaryIO) -> Attachment:
+        """stream 내용을 저장소에 나눠 쓰고 게시글에 첨부 (같은 내용이 있으면 파일은 재사용)"""
+        filename = os.path.basename(filename.strip())
+        if not filename:
+            raise ValueError("파일 이름은 필수입니다.")
+
+        cursor = self.connection.cursor()
+        cursor.execute("SELECT 1 FROM posts WHERE id = ?", (post_id,))
+        if not cursor.fetchone():
+            raise ValueError("게시글을 찾을 수 없습니다.")
+
+        digest, size = self.blobs.put(stream)
+        try:
+            cursor.execute(
+                f"INSERT INTO attachments (post_id, filename, digest, size, created_at) "
+                f"VALUES (?, ?, ?, ?, {SQL_NOW_MS})",
+                (post_id, filename, digest, size)
+            )
+            attachment_id = cursor.lastrowid
+            # 그 사이 collect_garbage()가 같은 내용의 파일을 지웠으면 취소
+            if not self.blobs.exists(digest):
+                raise ValueError("첨부파일 저장 중 충돌이 발생했습니다. 다시 시도해주세요.")
+            self.connection.commit()
+        except Exception:
+            self.connection.rollback()
+            # 방금 저장한 파일을 참조하는 행이 없으면 저장소에서도 제거
+            cursor.execute("SELECT 1 FROM blobs WHERE digest = ?", (digest,))
+            if not cursor.fetchone():
+                self.blobs.remove(digest)
+            raise
+        return self.get_attachment(attachment_id)
+
+    def add_attachment_file(self, post_id: int, file_path: str) -> Attachment:
+        with open(file_path, "rb") as stream:
+            return self.add_attachment(post_id, os.path.basename(file_path), stream)
+
+    def get_attachment(self, attachment_id: int) -> Optional[Attachment]:
+        cursor = self.connection.cursor()
+        cursor.execute(f"SELECT {self.ATTACHMENT_COLUMNS} FROM attachments WHERE id = ?", (attachment_id,))
+        row = cursor.fetchone()
+        return self._row_to_attachment(row) if row else None
+
+    def get_attachments(self, post_id: int) -> list[Attachment]:
+        cursor = self.connection.cursor()
+        cursor.execute(f"""
+            SELECT {self.ATTACHMENT_COLUMNS}
+            FROM attachments
+            WHERE post_id = ?
+            ORDER BY id
+        """, (post_id,))
+        return [self._row_to_attachment(row) for row in cursor.fetchall()]
+
+    def attachment_path(self, attachment: Attachment) -> str:
+        """저장소 안의 파일 경로 (읽기 전용으로만 사용)"""
+        return self.blobs.path(attachment.digest)
+
+    def save_attachment(self, attachment_id: int, destination: BinaryIO) -> bool:
+        """첨부파일 내용을 destination에 나눠 복사"""
+        attachment = self.get_attachment(attachment_id)
+        if not attachment:
+            return False
+        self.blobs.copy_to(attachment.digest, destination)
+        return True
+
+    def read_attachment_preview(self, attachment_id: int, limit: int = 4096) -> Optional[bytes]:
+        """앞부분 limit바이트 (mmap으로 필요한 부분만 읽음)"""
+        attachment = self.get_attachment(attachment_id)
+        if not attachment:
+            return None
+        return self.blobs.read_preview(attachment.digest, limit)
+
+    def delete_attachment(self, attachment_id: int) -> bool:
+        cursor = self.connection.cursor()
+        cursor.execute("DELETE FROM attachments WHERE id = ?", (attachment_id,))
+        self.connection.commit()
+        deleted = cursor.rowcount > 0
+        if deleted:
+            self.collect_garbage()
+        return deleted
+
+    def collect_garbage(self) -> int:
+        """참조 수가 0이 된 blob을 지우고 지운 개수 반환
+
+        쓰기 잠금을 잡은 채로 파일까지 지운 뒤 커밋하므로, 다른 연결이 같은 내용을
+        첨부하는 중이면 add_attachment()가 파일이 없어진 것을 확인하고 취소한다.
+        """
+        cursor = self.connection.cursor()
+        self.connection.commit()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            cursor.execute("SELECT digest FROM blobs WHERE ref_count <= 0")
+            digests = [row["digest"] for row in cursor.fetchall()]
+            cursor.execute("DELETE FROM blobs WHERE ref_count <= 0")
+            for digest in digests:
+                self.blobs.remove(digest)
+            self.connection.commit()
+        except Exception:
+            self.connection.rollback()
+            raise
+        return len(digests)
+
+    # === 댓글 ===
+
+    def add_comment(self, post_id: int, content: str, author: str = "",
+                    parent_id: Optional[int] = None) -> int:
+        content = content.strip()
+        if not content:
+            raise ValueError("내용은 필수입니다.")
+        author = author.strip() if author.strip() else "익명"
+
+        cursor = self.connection.cursor()
+        cursor.execute("SELECT 1 FROM posts WHERE id = ?", (post_id,))
+        if not cursor.fetchone():
+            raise ValueError("게시글을 찾을 수 없습니다.")
+        if parent_id is not None:
+            cursor.execute("SELECT post_id FROM comments WHERE id = ?", (parent_id,))
+            parent = cursor.fetchone()
+            if not parent or parent["post_id"] != post_id:
+                raise ValueError("답글을 달 댓글을 찾을 수 없습니다.")
+
+        cursor.execute(
+            f"INSERT INTO comments (post_id, parent_id, author, content, created_at) "
+            f"VALUES (?, ?, ?, ?, {SQL_NOW_MS})",
+            (post_id, parent_id, author, content)
+        )
+        self.connection.commit()
+        return cursor.lastrowid
+
+    def get_comments(self, post_id: int, after_path: Optional[str] = None,
+                     limit: Optional[int] = None) -> list[Comment]:
+        """게시글의 댓글을 스레드 순서로 조회
+
+        after_path를 주면 그 댓글 다음부터 limit개를 읽으므로(키셋 페이지)
+        긴 스레드도 앞부분부터 조금씩 나눠 읽을 수 있다.
+        """
+        cursor = self.connection.cursor()
+        cursor.execute(f"""
+            SELECT {self.COMMENT_COLUMNS}
+            FROM comments
+            WHERE post_id = ? AND path > ?
+            ORDER BY path
+            LIMIT ?
+        """, (post_id, after_path or "", -1 if limit is None else limit))
+        return [self._row_to_comment(row) for row in cursor.fetchall()]
+
+    def get_comment_thread(self, comment_id: int) -> list[Comment]:
+        """댓글과 그 아래 모든 답글을 스레드 순서로 조회"""
+        cursor = self.connection.cursor()
+        cursor.execute("SELECT post_id, path FROM comments WHERE id = ?", (comment_id,))
+        root = cursor.fetchone()
+        if not root:
+            return []
+        start, end = self._subtree_range(root["path"])
+        cursor.execute(f"""
+            SELECT {self.COMMENT_COLUMNS}
+            FROM comments
+            WHERE post_id = ? AND path >= ? AND path < ?
+            ORDER BY path
+        """, (root["post_id"], start, end))
+        return [self._row_to_comment(row) for row in cursor.fetchall()]
+
+    def delete_comment(self, comment_id: int) -> bool:
+        """댓글과 그 아래 답글 모두 삭제"""
+        cursor = self.connection.cursor()
+        cursor.execute("SELECT post_id, path FROM comments WHERE id = ?", (comment_id,))
+        root = cursor.fetchone()
+        if not root:
+            return False
+        start, end = self._subtree_range(root["path"])
+        cursor.execute(
+            "DELETE FROM comments WHERE post_id = ? AND path >= ? AND path < ?",
+            (root["post_id"], start, end)
+        )
+        self.connection.commit()
+        return True
+
+    def get_stats(self, author_limit: int = 10, day_limit: int = 30) -> BoardStats:
+        """집계 테이블만 읽으므로 게시글 수와 무관하게 일정한 시간에 조회"""
+        cursor = self.connection.cursor()
+        cursor.execute("SELECT post_count, author_count FROM board_stats WHERE id = 1")
+        totals = cursor.fetchone()
+
+        cursor.execute("""
+            SELECT author, post_count, last_activity
+            FROM author_stats
+            ORDER BY post_count DESC, author
+            LIMIT ?
+        """, (author_limit,))
+        authors = [
+            AuthorStats(
+                author=row["author"],
+                post_count=row["post_count"],
+                last_activity=from_ms(row["last_activity"]),
+            )
+            for row in cursor.fetchall()
+        ]
+
+        cursor.execute("""
+            SELECT day, post_count
+            FROM daily_stats
+            ORDER BY day DESC
+            LIMIT ?
+        """, (day_limit,))
+        daily = [
+            DailyStats(day=date.fromisoformat(row["day"]), post_count=row["post_count"])
+            for row in cursor.fetchall()
+        ]
+
+        return BoardStats(
+            total_posts=totals["post_count"] if totals else 0,
+            total_authors=totals["author_count"] if totals else 0,
+            authors=authors,
+            daily=daily,
+        )
+
+    # === 동기화 ===
+
+    @property
+    def node_id(self) -> str:
+        """이 DB를 다른 DB와 구분하는 id (HLC가 같을 때 순서를 정하는 데도 쓰임)"""
+        cursor = self.connection.cursor()
+        cursor.execute("SELECT node_id FROM sync_clock WHERE id = 1")
+        return cursor.fetchone()["node_id"]
+
+    def reset_node_id(self):
+        """파일을 복사해 만든 DB처럼 다른 DB와 노드 id가 같을 때 새 id 발급"""
+        self.connection.execute("UPDATE sync_clock SET node_id = lower(hex(randomblob(16))) WHERE id = 1")
+        self.connection.commit()
+
+    def get_sync_watermark(self, node_id: str) -> int:
+        """node_id의 change_log에서 어디(seq)까지 받아 왔는지"""
+        cursor = self.connection.cursor()
+        cursor.execute("SELECT pulled_seq FROM sync_peers WHERE node_id = ?", (node_id,))
+        row = cursor.fetchone()
+        return row["pulled_seq"] if row else 0
+
+    def get_changes(self, after_seq: int = 0, limit: int = 500) -> list[PostChange]:
+        """after_seq 이후의 변경을 seq 순으로 limit개까지 (게시글은 현재 내용과 태그를 담음)
+
+        아카이브로 옮긴 글은 아카이브 파일의 내용을 담는다.
+        """
         cursor = self.connection.cursor()
-        cursor.execute("DELETE FROM posts WHERE id = ?", (post_id,))
+        cursor.execute("""
+            SELECT c.seq, c.uid, c.hlc, c.deleted, c.post_id, p.id, p.title, p.content, p.author, p.created_at
+            FROM change_log AS c
+            LEFT JOIN posts AS p ON p.id = c.post_id AND NOT c.deleted
+            WHERE c.seq > ?
+            ORDER BY c.seq
+            LIMIT ?
+        """, (after_seq, limit))
+        rows = [dict(row) for row in cursor.fetchall()]
+
+        # hot DB에 없는 글은 id 범위가 겹치는 아카이브에서 찾음
+        missing = {row["post_id"]: row for row in rows if not row["deleted"] and row["id"] is None}
+        for archive in self._archives() if missing else []:
+            if archive["min_id"] is None:
+                continue
+            in_range = [post_id for post_id in missing if archive["min_id"] <= post_id <= archive["max_id"]]
+            if not in_range:
+                continue
+            alias = self._attach_archive(archive["year"], archive["filename"])
+            cursor.execute(f"""
+                SELECT id, title, content, author, created_at
+                FROM {alias}.posts
+                WHERE id IN ({", ".join("?" * len(in_range))})
+            """, in_range)
+            for found in cursor.fetchall():
+                missing.pop(found["id"]).update(dict(found))
+            if not missing:
+                break
+
+        tags: dict[int, list[str]] = {row["id"]: [] for row in rows if row["id"] is not None}
+        if tags:
+            placeholders = ", ".join("?" * len(tags))
+            cursor.execute(f"""
+                SELECT pt.post_id, t.name
+                FROM post_tags pt
+                JOIN tags t ON t.id = pt.tag_id
+                WHERE pt.post_id IN ({placeholders})
+                ORDER BY t.name
+            """, list(tags))
+            for row in cursor.fetchall():
+                tags[row["post_id"]].append(row["name"])
+
+        return [
+            PostChange(
+                seq=row["seq"],
+                uid=row["uid"],
+                hlc=row["hlc"],
+                deleted=bool(row["deleted"]),
+                title=row["title"],
+                content=row["content"],
+                author=row["author"],
+                created_at=row["created_at"],
+                tags=tags.get(row["id"]),
+            )
+            for row in rows
+        ]
+
+    def apply_changes(self, node_id: str, changes: list[PostChange], advance_watermark: bool = True) -> int:
+        """node_id의 DB에서 받은 변경을 한 트랜잭션으로 반영하고 반영한 수 반환
+
+        같은 게시글(uid)은 HLC가 더 큰 쪽이 이기므로(last-writer-wins) 어느 방향으로,
+        몇 번을 주고받아도 양쪽 결과가 같다. 태그는 게시글 내용과 함께 통째로 덮어쓴다.
+        내용을 받지 못한 글과 이쪽에서 아카이브된 글은 반영을 미루고, 받은 위치(watermark)는
+        처음 미룬 변경 직전까지만 옮겨 다음 동기화 때 다시 받는다.
+        advance_watermark=False이면 받은 위치를 옮기지 않는다 (앞 배치에서 미룬 변경이 있을 때).
+        """
+        now_ms = int(datetime.now(timezone.utc).timestamp() * 1000)
+        applied = 0
+        deferred_seq = None
+        removed = False
+        changed_ids = []
+        cursor = self.connection.cursor()
+        try:
+            # 반영하는 변경은 다시 기록하지 않고 받은 HLC를 그대로 change_log에 남김
+            cursor.execute("INSERT INTO maintenance_flags (name) VALUES ('syncing')")
+            cursor.execute("SELECT physical, counter FROM sync_clock WHERE id = 1")
+            clock = cursor.fetchone()
+            physical, counter = clock["physical"], clock["counter"]
+
+            for change in changes:
+                cursor.execute("SELECT post_id, hlc, deleted FROM change_log WHERE uid = ?", (change.uid,))
+                local = cursor.fetchone()
+                if local and local["hlc"] >= change.hlc:
+                    continue
+                if not change.deleted and change.title is None:
+                    deferred_seq = deferred_seq or change.seq
+                    continue
+
+                post_id = None
+                if local and not local["deleted"]:
+                    cursor.execute("SELECT id FROM posts WHERE id = ?", (local["post_id"],))
+                    if not cursor.fetchone():
+                        deferred_seq = deferred_seq or change.seq
+                        continue
+                    post_id = local["post_id"]
+
+                if change.deleted:
+                    if post_id:
+                        cursor.execute("DELETE FROM posts WHERE id = ?", (post_id,))
+                        removed = True
+                        changed_ids.append(post_id)
+                elif post_id:
+                    cursor.execute(
+                        "UPDATE posts SET title = ?, content = ? WHERE id = ?",
+                        (change.title, change.content, post_id)
+                    )
+                    self._set_tags(cursor, post_id, change.tags or [])
+                    changed_ids.append(post_id)
+                else:
+                    cursor.execute(
+                        f"INSERT INTO posts (uid, title, content, author, created_at, updated_at) "
+                        f"VALUES (?, ?, ?, ?, ?, {SQL_NOW_MS})",
+                        (change.uid, change.title, change.content, change.author, change.created_at)
+                    )
+                    post_id = cursor.lastrowid
+                    self._set_tags(cursor, post_id, change.tags or [])
+
+                cursor.execute(
+                    "INSERT OR REPLACE INTO change_log (uid, post_id, hlc, deleted) VALUES (?, ?, ?, ?)",
+                    (change.uid, post_id, change.hlc, int(change.deleted))
+                )
+                physical, counter = receive(physical, counter, change.hlc, now_ms)
+                applied += 1
+
+            cursor.execute("UPDATE sync_clock SET physical = ?, counter = ? WHERE id = 1", (physical, counter))
+            if advance_watermark:
+                pulled_seq = max(
+                    (change.seq for change in changes if deferred_seq is None or change.seq < deferred_seq),
+                    default=0
+                )
+                cursor.execute("""
+                    INSERT INTO sync_peers (node_id, pulled_seq) VALUES (?, ?)
+                    ON CONFLICT (node_id) DO UPDATE SET pulled_seq = max(pulled_seq, excluded.pulled_seq)
+                """, (node_id, pulled_seq))
+            cursor.execute("DELETE FROM maintenance_flags WHERE name = 'syncing'")
+            self.connection.commit()
+        except Exception:
+            self.connection.rollback()
+            raise
+        self._notify_changed(changed_ids)
+        if removed:
+            self.collect_garbage()
+        return applied
+
+    # === 유지보수 ===
+
+    def integrity_check(self) -> list[str]:
+        cursor = self.connection.cursor()
+        cursor.execute("PRAGMA integrity_check")
+        return [row[0] for row in cursor.fetchall()]
+
+    def analyze(self):
+        self.connection.execute("ANALYZE")
+        self.connection.commit()
+
+    def vacuum(self):
         self.connection.commit()
-        return cursor.rowcount > 0 # 실제로 삭제된 행이 있으면 True
+        self.connection.execute("VACUUM")
 
     def close(self):
         if self.connection:
+            if not self.read_only:
+                try:
+                    self.flush_views()
+                except sqlite3.Error:
+                    # 다른 연결이 오래 잠그고 있으면 남은 조회수는 버림
+                    pass
             self.connection.close()
+        if self._temp_dir:
+            shutil.rmtree(self._temp_dir, ignore_errors=True)
+            self._temp_dir = None
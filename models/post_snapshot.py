@@ -0,0 +1,174 @@
+import sqlite3
+import os
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Iterator, Optional
+
+from .post_repository import PostRepository
+
+
+class PostSnapshot:
+    """라이브 DB의 특정 시점 읽기 전용 사본
+
+    내보내기/통계/검색처럼 오래 걸리는 읽기를 사본에서 처리해
+    게시글 작성/수정이 쓰는 라이브 DB와 경쟁하지 않도록 한다.
+
+    - refresh()는 sqlite3 backup API로 새 세대 파일을 만든 뒤 교체
+      (WAL 모드면 한 번의 읽기 트랜잭션으로 복사해 쓰기를 막지 않고,
+      그 외에는 pages 단위로 나눠 복사하며 사이사이 쓰기에 잠금을 양보)
+    - 마지막 사본 이후 라이브 DB에 커밋이 없으면 (PRAGMA data_version) 복사하지 않음.
+      backup API는 바뀐 페이지만 골라 복사할 수 없으므로 변경이 있으면 전체를 다시 복사한다
+    - reader()로 얻은 연결은 교체 중에도 자신의 세대를 계속 읽으며,
+      더 이상 읽는 곳이 없는 이전 세대 파일은 삭제
+    """
+
+    def __init__(self, db_path: str, snapshot_dir: Optional[str] = None,
+                 pages: int = 1024, step_sleep: float = 0.005):
+        self.db_path = db_path
+        self.snapshot_dir = snapshot_dir or os.path.join(
+            os.path.dirname(os.path.abspath(db_path)), ".snapshots"
+        )
+        self.pages = pages
+        self.step_sleep = step_sleep
+        self.taken_at: Optional[datetime] = None
+
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._generation = 0
+        self._current_path: Optional[str] = None
+        self._readers: dict[str, int] = {}
+        self._stop_event: Optional[threading.Event] = None
+        self._closed = False
+        # data_version은 연결마다 따로 세므로 변경 확인용 연결은 계속 열어 둠
+        self._source: Optional[sqlite3.Connection] = None
+        self._source_version: Optional[int] = None
+        self._thread: Optional[threading.Thread] = None
+        os.makedirs(self.snapshot_dir, exist_ok=True)
+
+    def _snapshot_path(self, generation: int) -> str:
+        name = os.path.splitext(os.path.basename(self.db_path))[0]
+        return os.path.join(self.snapshot_dir, f"{name}.snapshot-{os.getpid()}-{generation}.db")
+
+    def refresh(self) -> bool:
+        """라이브 DB를 새 세대 파일로 복사한 뒤 이후 reader()가 새 사본을 읽도록 교체
+
+        마지막 사본 이후 바뀐 것이 없으면 복사하지 않고 False 반환
+        """
+        with self._refresh_lock:
+            if self._closed:
+                raise ValueError("닫힌 사본입니다.")
+            if self._source is None:
+                self._source = sqlite3.connect(self.db_path, check_same_thread=False)
+            version = self._source.execute("PRAGMA data_version").fetchone()[0]
+            if self._current_path is not None and version == self._source_version:
+                return False
+
+            generation = self._generation + 1
+            path = self._snapshot_path(generation)
+            target = sqlite3.connect(path)
+            try:
+                journal_mode = self._source.execute("PRAGMA journal_mode").fetchone()[0]
+                if journal_mode == "wal":
+                    self._source.backup(target)
+                else:
+                    self._source.backup(target, pages=self.pages, sleep=self.step_sleep)
+            except Exception:
+                target.close()
+                self._remove_files(path)
+                raise
+            # 사본은 읽기 전용 연결로만 열리므로 WAL 파일 없이 읽히도록 변경
+            target.execute("PRAGMA journal_mode = DELETE")
+            target.close()
+
+            with self._lock:
+                previous = self._current_path
+                self._generation = generation
+                self._current_path = path
+                self._source_version = version
+                self._readers.setdefault(path, 0)
+                self.taken_at = datetime.now(timezone.utc)
+                self._release_if_unused(previous)
+            return True
+
+    def _acquire(self) -> Optional[str]:
+        """현재 사본의 읽는 곳 수를 늘리고 경로 반환 (close() 뒤에는 ValueError)"""
+        with self._lock:
+            if self._closed:
+                raise ValueError("닫힌 사본입니다.")
+            path = self._current_path
+            if path is not None:
+                self._readers[path] += 1
+            return path
+
+    @contextmanager
+    def reader(self) -> Iterator[PostRepository]:
+        """현재 사본을 읽는 읽기 전용 PostRepository (사본이 없으면 먼저 생성)"""
+        path = self._acquire()
+        if path is None:
+            self.refresh()
+            path = self._acquire()
+        try:
+            # 아카이브 파일은 라이브 DB 옆에 있는 것을 그대로 읽음
+            repository = PostRepository(path, read_only=True,
+                                        archive_dir=os.path.dirname(os.path.abspath(self.db_path)))
+            try:
+                yield repository
+            finally:
+                repository.close()
+        finally:
+            with self._lock:
+                self._readers[path] -= 1
+                if path != self._current_path:
+                    self._release_if_unused(path)
+
+    def _release_if_unused(self, path: Optional[str]):
+        if path and self._readers.get(path) == 0:
+            del self._readers[path]
+            self._remove_files(path)
+
+    def _remove_files(self, path: str):
+        for suffix in ("", "-journal", "-wal", "-shm"):
+            try:
+                os.remove(path + suffix)
+            except FileNotFoundError:
+                pass
+
+    # === 주기적 갱신 ===
+
+    def start(self, interval: float):
+        """interval초마다 백그라운드 스레드에서 refresh()"""
+        if self._thread:
+            return
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, args=(interval, self._stop_event),
+            name="post-snapshot", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self, interval: float, stop_event: threading.Event):
+        while not stop_event.wait(interval):
+            try:
+                self.refresh()
+            except sqlite3.Error:
+                # 다음 주기에 다시 시도
+                pass
+
+    def stop(self):
+        if self._thread:
+            self._stop_event.set()
+            self._thread.join()
+            self._thread = None
+
+    def close(self):
+        """진행 중인 refresh()가 끝나길 기다린 뒤 닫음 (읽는 중인 사본은 다 읽은 뒤 삭제)"""
+        self.stop()
+        with self._refresh_lock, self._lock:
+            self._closed = True
+            path, self._current_path = self._current_path, None
+            if path:
+                self._release_if_unused(path)
+            if self._source is not None:
+                self._source.close()
+                self._source = None
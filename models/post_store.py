@@ -0,0 +1,94 @@
+from typing import BinaryIO, Callable, Iterator, Optional, Protocol, runtime_checkable
+
+from .attachment import Attachment
+from .comment import Comment
+from .post import Post
+from .stats import BoardStats
+from .tag import Tag
+
+
+@runtime_checkable
+class PostStore(Protocol):
+    """PostController가 사용하는 게시글 저장소 인터페이스
+
+    SQLite를 쓰는 PostRepository와 메모리 안에서 처리하는 InMemoryPostRepository가
+    이 인터페이스를 구현하며, 두 구현은 tests/test_post_store.py의 같은 테스트를 통과해야 한다.
+    아카이브/동기화/유지보수처럼 SQLite 파일에만 있는 기능은 포함하지 않는다.
+    """
+
+    # === 게시글 ===
+
+    def count(self) -> int: ...
+
+    def get_all(self) -> list[Post]: ...
+
+    def get_page(self, page: int = 1, page_size: int = 50) -> list[Post]: ...
+
+    def iter_all(self, batch_size: int = 500, include_content: bool = False) -> Iterator[Post]: ...
+
+    def search(self, keyword: str, page: int = 1, page_size: int = 50) -> list[Post]: ...
+
+    def get_by_tags(self, tags: list[str], match_all: bool = False,
+                    page: int = 1, page_size: Optional[int] = 50) -> list[Post]: ...
+
+    def iter_by_tags(self, tags: list[str], match_all: bool = False, batch_size: int = 500) -> Iterator[Post]: ...
+
+    def get_tags(self, limit: Optional[int] = None) -> list[Tag]: ...
+
+    def get_by_id(self, post_id: int) -> Optional[Post]: ...
+
+    def create(self, post: Post) -> int: ...
+
+    def create_many(self, posts: list[Post]) -> list[int]: ...
+
+    def update(self, post: Post) -> bool: ...
+
+    def delete(self, post_id: int) -> bool: ...
+
+    def add_change_listener(self, listener: Callable[[int], None]): ...
+
+    def get_stats(self, author_limit: int = 10, day_limit: int = 30) -> BoardStats: ...
+
+    # === 조회수 / 읽음 표시 ===
+
+    def record_view(self, post_id: int): ...
+
+    def flush_views(self) -> int: ...
+
+    def mark_read(self, reader: str, post_ids: list[int]): ...
+
+    def mark_all_read(self, reader: str): ...
+
+    def is_read(self, reader: str, post_ids: list[int]) -> dict[int, bool]: ...
+
+    def unread_count(self, reader: str) -> int: ...
+
+    # === 댓글 ===
+
+    def add_comment(self, post_id: int, content: str, author: str = "",
+                    parent_id: Optional[int] = None) -> int: ...
+
+    def get_comments(self, post_id: int, after_path: Optional[str] = None,
+                     limit: Optional[int] = None) -> list[Comment]: ...
+
+    def get_comment_thread(self, comment_id: int) -> list[Comment]: ...
+
+    def delete_comment(self, comment_id: int) -> bool: ...
+
+    # === 첨부파일 ===
+
+    def add_attachment(self, post_id: int, filename: str, stream: BinaryIO) -> Attachment: ...
+
+    def add_attachment_file(self, post_id: int, file_path: str) -> Attachment: ...
+
+    def get_attachment(self, attachment_id: int) -> Optional[Attachment]: ...
+
+    def get_attachments(self, post_id: int) -> list[Attachment]: ...
+
+    def save_attachment(self, attachment_id: int, destination: BinaryIO) -> bool: ...
+
+    def read_attachment_preview(self, attachment_id: int, limit: int = 4096) -> Optional[bytes]: ...
+
+    def delete_attachment(self, attachment_id: int) -> bool: ...
+
+    def close(self): ...
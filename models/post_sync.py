@@ -0,0 +1,48 @@
+import os
+
+from .post_repository import PostRepository
+
+
+class PostSync:
+    """두 board.db 사이의 양방향 동기화
+
+    각 DB의 change_log에서 상대가 마지막으로 받아 간 seq 이후의 변경만 주고받고,
+    같은 게시글을 양쪽에서 고쳤으면 HLC가 더 큰 변경이 이긴다.
+    댓글/첨부/조회수는 각 DB에 그대로 두고 게시글(제목/내용/태그/삭제)만 맞춘다.
+    """
+
+    def __init__(self, repository: PostRepository, batch_size: int = 500):
+        self.repository = repository
+        self.batch_size = batch_size
+
+    def sync(self, other_db_path: str) -> dict:
+        """other_db_path의 변경을 받아 온 뒤 이쪽 변경을 보내고 각각 반영한 수 반환
+
+        경로를 잘못 적어 빈 게시판을 새로 만들지 않도록 있는 DB 파일만 연다.
+        """
+        if not os.path.isfile(other_db_path):
+            raise ValueError(f"동기화할 DB 파일이 없습니다: {other_db_path}")
+        other = PostRepository(other_db_path, create=False)
+        try:
+            if other.node_id == self.repository.node_id:
+                # 파일을 복사해 만든 DB (HLC 순서를 정할 수 있도록 상대 쪽 id를 새로 발급)
+                other.reset_node_id()
+            pulled = self._transfer(other, self.repository)
+            pushed = self._transfer(self.repository, other)
+        finally:
+            other.close()
+        return {"pulled": pulled, "pushed": pushed}
+
+    def _transfer(self, source: PostRepository, target: PostRepository) -> int:
+        node_id = source.node_id
+        after_seq = target.get_sync_watermark(node_id)
+        applied = 0
+        advance_watermark = True
+        while True:
+            changes = source.get_changes(after_seq, self.batch_size)
+            if not changes:
+                return applied
+            applied += target.apply_changes(node_id, changes, advance_watermark)
+            after_seq = changes[-1].seq
+            # 반영을 미룬 변경이 있으면 그 뒤 배치는 반영만 하고 받은 위치는 그대로 둠
+            advance_watermark = advance_watermark and target.get_sync_watermark(node_id) >= after_seq
@@ -0,0 +1,101 @@
+from bisect import bisect_right
+from typing import Iterable
+
+
+class ReadSet:
+    """독자 한 명이 읽은 게시글 id 집합
+
+    read_upto 이하의 id는 모두 읽은 것으로 보고, 그보다 큰 id만 연속 구간 목록으로 둔다.
+    게시글 id는 작성순으로 커지므로 차례로 읽은 글은 구간 하나로 합쳐지고,
+    앞쪽 구간이 read_upto에 닿으면 read_upto로 흡수되어 목록이 짧게 유지된다.
+    """
+
+    def __init__(self, read_upto: int = 0, ranges: Iterable[tuple[int, int]] = ()):
+        self.read_upto = read_upto
+        self._starts: list[int] = []
+        self._ends: list[int] = []
+        for start, end in ranges:
+            self._starts.append(start)
+            self._ends.append(end)
+        self._compact()
+
+    @property
+    def ranges(self) -> list[tuple[int, int]]:
+        """read_upto보다 큰 읽은 id 구간 (시작, 끝 포함)"""
+        return list(zip(self._starts, self._ends))
+
+    def __contains__(self, post_id: int) -> bool:
+        if post_id <= self.read_upto:
+            return True
+        index = bisect_right(self._starts, post_id) - 1
+        return index >= 0 and post_id <= self._ends[index]
+
+    def contains_many(self, post_ids: Iterable[int]) -> dict[int, bool]:
+        return {post_id: post_id in self for post_id in post_ids}
+
+    def add(self, post_id: int):
+        if post_id in self:
+            return
+        index = bisect_right(self._starts, post_id)
+        joins_previous = index > 0 and self._ends[index - 1] == post_id - 1
+        joins_next = index < len(self._starts) and self._starts[index] == post_id + 1
+        if joins_previous and joins_next:
+            self._ends[index - 1] = self._ends.pop(index)
+            self._starts.pop(index)
+        elif joins_previous:
+            self._ends[index - 1] = post_id
+        elif joins_next:
+            self._starts[index] = post_id
+        else:
+            self._starts.insert(index, post_id)
+            self._ends.insert(index, post_id)
+        self._compact()
+
+    def mark_upto(self, post_id: int):
+        """post_id 이하를 모두 읽은 것으로 표시"""
+        if post_id <= self.read_upto:
+            return
+        self.read_upto = post_id
+        index = bisect_right(self._ends, post_id)
+        del self._starts[:index]
+        del self._ends[:index]
+        self._compact()
+
+    def _compact(self):
+        while self._starts and self._starts[0] <= self.read_upto + 1:
+            self.read_upto = max(self.read_upto, self._ends[0])
+            del self._starts[0]
+            del self._ends[0]
+
+    # === 저장 형식 ===
+
+    def to_bytes(self) -> bytes:
+        """구간을 (앞 구간 끝과의 간격, 길이 - 1) varint 쌍으로 인코딩"""
+        data = bytearray()
+        previous = self.read_upto
+        for start, end in zip(self._starts, self._ends):
+            for value in (start - previous, end - start):
+                while value >= 0x80:
+                    data.append((value & 0x7F) | 0x80)
+                    value >>= 7
+                data.append(value)
+            previous = end
+        return bytes(data)
+
+    @classmethod
+    def from_bytes(cls, read_upto: int, data: bytes) -> "ReadSet":
+        values = []
+        value = shift = 0
+        for byte in data:
+            value |= (byte & 0x7F) << shift
+            shift += 7
+            if not byte & 0x80:
+                values.append(value)
+                value = shift = 0
+        ranges = []
+        previous = read_upto
+        for gap, length in zip(values[::2], values[1::2]):
+            start = previous + gap
+            previous = start + length
+            ranges.append((start, previous))
+        return cls(read_upto, ranges)
@@ -0,0 +1,47 @@
+import sys
+from collections import OrderedDict
+from datetime import datetime
+from typing import Optional
+
+
+class RenderCache:
+    """게시글 본문을 렌더링한 HTML 캐시
+
+    (게시글 id, 수정 시각)을 키로 하므로 수정된 글은 자연히 새로 렌더링되고,
+    전체 크기가 max_bytes를 넘으면 가장 오래 쓰지 않은 항목부터 버린다.
+    """
+
+    def __init__(self, max_bytes: int = 8 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self._entries: OrderedDict[tuple[int, datetime], str] = OrderedDict()
+
+    def get(self, post_id: int, updated_at: datetime) -> Optional[str]:
+        html = self._entries.get((post_id, updated_at))
+        if html is not None:
+            self._entries.move_to_end((post_id, updated_at))
+        return html
+
+    def put(self, post_id: int, updated_at: datetime, html: str):
+        # 한 글이 캐시보다 크면 넣지 않음 (다른 항목을 모두 밀어내지 않도록)
+        size = sys.getsizeof(html)
+        if size > self.max_bytes:
+            return
+        self.invalidate(post_id)
+        self._entries[(post_id, updated_at)] = html
+        self.size_bytes += size
+        while self.size_bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.size_bytes -= sys.getsizeof(evicted)
+
+    def invalidate(self, post_id: int):
+        """게시글의 이전 렌더링 결과 제거 (수정/삭제 시)"""
+        for key in [key for key in self._entries if key[0] == post_id]:
+            self.size_bytes -= sys.getsizeof(self._entries.pop(key))
+
+    def clear(self):
+        self._entries.clear()
+        self.size_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,43 @@
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Optional
+
+
+@dataclass
+class AuthorStats:
+    author: str = ""
+    post_count: int = 0
+    last_activity: Optional[datetime] = None
+
+
+@dataclass
+class DailyStats:
+    day: Optional[date] = None
+    post_count: int = 0
+
+
+@dataclass
+class BoardStats:
+    total_posts: int = 0
+    total_authors: int = 0
+    authors: list[AuthorStats] = field(default_factory=list)
+    daily: list[DailyStats] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        """JSON 직렬화용 dict"""
+        return {
+            "total_posts": self.total_posts,
+            "total_authors": self.total_authors,
+            "authors": [
+                {
+                    "author": author.author,
+                    "post_count": author.post_count,
+                    "last_activity": author.last_activity.isoformat() if author.last_activity else None,
+                }
+                for author in self.authors
+            ],
+            "daily": [
+                {"day": daily.day.isoformat(), "post_count": daily.post_count}
+                for daily in self.daily
+            ],
+        }
@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class Tag:
+    name: str = ""
+    post_count: int = 0
+
+
+def parse_tags(text: str) -> list[str]:
+    """쉼표로 구분한 입력을 태그 목록으로 변환 (정규화는 저장소에서 normalize_tags()로)"""
+    return [tag.strip() for tag in text.split(",") if tag.strip()]
+
+
+def normalize_tags(tags: list[str]) -> list[str]:
+    """앞뒤 공백과 '#' 제거, 빈 태그와 중복 제거 (입력 순서 유지)"""
+    normalized = []
+    for tag in tags:
+        tag = tag.strip().lstrip("#").strip()
+        if tag and tag not in normalized:
+            normalized.append(tag)
+    return normalized
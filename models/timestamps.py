@@ -0,0 +1,37 @@
+"""일시 저장 형식: UTC 기준 epoch 밀리초 정수
+
+DB에는 정수로 저장해 정렬/비교를 정수 인덱스로 처리하고,
+읽을 때는 문자열 파싱 없이 UTC datetime으로 바꾼다.
+로컬 시각 변환은 화면에 표시할 때만 한다 (datetime.astimezone()).
+"""
+from datetime import datetime, timezone
+from typing import Optional
+
+# 현재 시각 (SQL 식, 트리거/INSERT에서 사용)
+SQL_NOW_MS = "CAST(round((julianday('now') - 2440587.5) * 86400000) AS INTEGER)"
+
+
+def sql_local_day(column: str) -> str:
+    """epoch ms 컬럼의 로컬 날짜 (YYYY-MM-DD, 일별 통계 키)"""
+    return f"date({column} / 1000, 'unixepoch', 'localtime')"
+
+
+def sql_local_text_to_ms(column: str) -> str:
+    """localtime ISO 문자열로 저장된 기존 값을 epoch ms로 바꾸는 SQL 식 (이미 정수면 그대로)"""
+    return (
+        f"CASE WHEN typeof({column}) = 'text' "
+        f"THEN CAST(round((julianday({column}, 'utc') - 2440587.5) * 86400000) AS INTEGER) "
+        f"ELSE {column} END"
+    )
+
+
+def from_ms(value: Optional[int]) -> Optional[datetime]:
+    """epoch ms → UTC datetime"""
+    if value is None:
+        return None
+    return datetime.fromtimestamp(value / 1000, tz=timezone.utc)
+
+
+def format_local(value: Optional[datetime], fmt: str = "%Y-%m-%d %H:%M:%S") -> str:
+    """화면 표시용 로컬 시각 문자열"""
+    return value.astimezone().strftime(fmt) if value else ""
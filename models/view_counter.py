@@ -0,0 +1,38 @@
+import threading
+
+
+class ViewCounter:
+    """게시글 조회수 증가분을 메모리에 모아 두는 버퍼
+
+    조회할 때마다 UPDATE/커밋하지 않고 증가분만 쌓아 두었다가
+    PostRepository.flush_views()가 한 트랜잭션으로 반영한다.
+    """
+
+    def __init__(self):
+        self._pending: dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def add(self, post_id: int, count: int = 1):
+        with self._lock:
+            self._pending[post_id] = self._pending.get(post_id, 0) + count
+
+    def pending(self, post_id: int) -> int:
+        """아직 DB에 반영되지 않은 증가분"""
+        with self._lock:
+            return self._pending.get(post_id, 0)
+
+    def take(self) -> dict[int, int]:
+        """쌓인 증가분을 꺼내고 버퍼를 비움"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            return pending
+
+    def restore(self, pending: dict[int, int]):
+        """반영에 실패한 증가분을 다시 버퍼에 합침"""
+        with self._lock:
+            for post_id, count in pending.items():
+                self._pending[post_id] = self._pending.get(post_id, 0) + count
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._pending)
@@ -0,0 +1,136 @@
+"""server.py 부하 테스트
+
+    python scripts/load_test.py --url http://127.0.0.1:8000 --concurrency 200 --requests 5000
+    python scripts/load_test.py --spawn --concurrency 200   # 임시 DB로 서버를 직접 띄워서 측정
+
+동시에 여러 스레드가 목록/조회/작성/수정 요청을 섞어 보내고
+처리량과 지연 시간 분포(p50/p95/p99)를 출력한다.
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def request(url: str, method: str = "GET", data: dict = None, headers: dict = None) -> tuple[int, dict]:
+    body = json.dumps(data).encode("utf-8") if data is not None else None
+    req = urllib.request.Request(url, data=body, method=method, headers=headers or {})
+    if body is not None:
+        req.add_header("Content-Type", "application/json")
+    try:
+        with urllib.request.urlopen(req, timeout=30) as response:
+            raw = response.read()
+            return response.status, json.loads(raw) if raw else {}
+    except urllib.error.HTTPError as e:
+        return e.code, {}
+
+
+def percentile(values: list[float], ratio: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * ratio))]
+
+
+def run(base_url: str, concurrency: int, total_requests: int, write_ratio: float) -> dict:
+    # 조회 대상 게시글 준비
+    post_ids = []
+    for i in range(20):
+        status, post = request(f"{base_url}/posts", "POST", {
+            "title": f"부하 테스트 {i}", "content": "내용", "author": "load_test",
+        })
+        post_ids.append(post["id"])
+    post_ids_lock = threading.Lock()
+
+    latencies = []
+    statuses = Counter()
+    lock = threading.Lock()
+
+    def one_request(index: int):
+        rng = random.Random(index)
+        with post_ids_lock:
+            post_id = rng.choice(post_ids)
+        roll = rng.random()
+        started = time.perf_counter()
+        if roll < write_ratio / 2:
+            status, post = request(f"{base_url}/posts", "POST", {
+                "title": f"부하 테스트 {index}", "content": "내용", "author": "load_test",
+            })
+            if status == 201:
+                with post_ids_lock:
+                    post_ids.append(post["id"])
+        elif roll < write_ratio:
+            status, _ = request(f"{base_url}/posts/{post_id}", "PUT", {"content": f"수정 {index}"})
+        elif roll < 0.6:
+            status, _ = request(f"{base_url}/posts?page={rng.randint(1, 5)}&page_size=50")
+        else:
+            status, _ = request(f"{base_url}/posts/{post_id}")
+        elapsed = time.perf_counter() - started
+        with lock:
+            latencies.append(elapsed)
+            statuses[status] += 1
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(one_request, range(total_requests)))
+    duration = time.perf_counter() - started
+
+    return {
+        "requests": total_requests,
+        "concurrency": concurrency,
+        "duration_s": round(duration, 3),
+        "throughput_rps": round(total_requests / duration, 1),
+        "latency_ms": {
+            "mean": round(statistics.mean(latencies) * 1000, 2),
+            "p50": round(percentile(latencies, 0.50) * 1000, 2),
+            "p95": round(percentile(latencies, 0.95) * 1000, 2),
+            "p99": round(percentile(latencies, 0.99) * 1000, 2),
+            "max": round(max(latencies) * 1000, 2),
+        },
+        "statuses": dict(statuses),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="server.py 부하 테스트")
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--spawn", action="store_true", help="임시 DB로 서버를 직접 실행")
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--write-ratio", type=float, default=0.1, help="쓰기 요청 비율 (기본값: 0.1)")
+    args = parser.parse_args()
+
+    server = None
+    base_url = args.url.rstrip("/")
+    if args.spawn:
+        from server import BoardServer
+        db_path = os.path.join(tempfile.mkdtemp(), "load_test.db")
+        server = BoardServer(("127.0.0.1", 0), db_path)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    try:
+        result = run(base_url, args.concurrency, args.requests, args.write_ratio)
+    finally:
+        if server:
+            server.shutdown()
+            server.server_close()
+
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    errors = sum(count for status, count in result["statuses"].items() if status >= 500)
+    sys.exit(1 if errors else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,312 @@
+"""board.db 동시 접근 스트레스/장시간(soak) 테스트
+
+    python scripts/stress_test.py --processes 4 --threads 4 --duration 30
+    python scripts/stress_test.py --db shared/board.db --wal --duration 3600 --report-interval 60
+
+여러 프로세스(각각 여러 스레드)가 같은 DB 파일에 작성/수정/삭제/목록 요청을 섞어 보내고,
+끝난 뒤 불변 조건을 확인하고 구간별 처리량과 지연 시간 분포(p50/p99)를 출력한다.
+- 잃어버린 수정 없음: 스레드마다 자기가 만든 글만 고치며, 마지막으로 성공한 수정본이 DB에 남아 있어야 함
+- updated_at 단조 증가: 수정 후 다시 읽은 updated_at이 이전에 읽은 값보다 작아지지 않아야 하고,
+  끝난 뒤 DB에 남은 updated_at도 마지막으로 읽은 값보다 작지 않아야 함
+- 잠금 오류 없음: "database is locked"가 PostController.error_occurred나 작업 결과로 새어 나오지 않아야 함
+- 집계 일치: count()(board_stats)가 실제 게시글 수와 같아야 함
+불변 조건을 어기면 종료 코드 1로 끝난다.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models import Post, PostRepository  # noqa: E402
+
+# 작업별 비율 (나머지는 목록 조회)
+WORKLOAD = {"create": 0.2, "update": 0.3, "delete": 0.05}
+LOCKED_MESSAGES = ("database is locked", "database table is locked")
+
+
+def percentile(values: list[float], ratio: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * ratio))]
+
+
+class WorkerResult:
+    """스레드 하나의 측정값과 자기가 만든 글의 마지막 상태 (프로세스 간 전달용으로 dict로 변환)"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.records: list[tuple[float, str, float, bool]] = []   # (시작 시각, 작업, 지연 시간, 성공)
+        self.errors: Counter = Counter()
+        self.violations: list[str] = []
+        self.revisions: dict[int, int] = {}     # post_id → 마지막으로 성공한 수정 번호
+        self.updated_at: dict[int, datetime] = {}  # post_id → 마지막으로 읽은 updated_at
+        self.deleted: list[int] = []
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "records": self.records,
+            "errors": dict(self.errors),
+            "violations": self.violations,
+            "revisions": self.revisions,
+            "updated_at": self.updated_at,
+            "deleted": self.deleted,
+        }
+
+
+def run_worker(db_path: str, name: str, seed: int, deadline: float) -> dict:
+    """deadline(time.time())까지 PostRepository로 작성/수정/삭제/목록 작업을 반복"""
+    rng = random.Random(seed)
+    result = WorkerResult(name)
+    try:
+        repository = PostRepository(db_path)
+    except sqlite3.Error as e:
+        result.errors[f"open: {e}"] += 1
+        return result.to_dict()
+    last_updated = result.updated_at
+    try:
+        while time.time() < deadline:
+            roll = rng.random()
+            started = time.time()
+            op = "list"
+            try:
+                if roll < WORKLOAD["create"] or not result.revisions:
+                    op = "create"
+                    post_id = repository.create(Post(title=name, content="rev 0", author=name))
+                    result.revisions[post_id] = 0
+                elif roll < WORKLOAD["create"] + WORKLOAD["update"]:
+                    op = "update"
+                    post_id = rng.choice(list(result.revisions))
+                    revision = result.revisions[post_id] + 1
+                    if not repository.update(Post(id=post_id, title=name, content=f"rev {revision}")):
+                        result.violations.append(f"{name}: 자기가 만든 글 {post_id}를 찾을 수 없음")
+                    result.revisions[post_id] = revision
+                    post = repository.get_by_id(post_id)
+                    if post and post_id in last_updated and post.updated_at < last_updated[post_id]:
+                        result.violations.append(f"{name}: 글 {post_id}의 updated_at이 뒤로 감")
+                    if post:
+                        last_updated[post_id] = post.updated_at
+                elif roll < WORKLOAD["create"] + WORKLOAD["update"] + WORKLOAD["delete"]:
+                    op = "delete"
+                    post_id = rng.choice(list(result.revisions))
+                    if repository.delete(post_id):
+                        del result.revisions[post_id]
+                        last_updated.pop(post_id, None)
+                        result.deleted.append(post_id)
+                else:
+                    repository.get_page(rng.randint(1, 3), 50)
+                ok = True
+            except sqlite3.Error as e:
+                ok = False
+                result.errors[f"{op}: {e}"] += 1
+            result.records.append((started, op, time.time() - started, ok))
+    finally:
+        repository.close()
+    return result.to_dict()
+
+
+def run_controller(db_path: str, name: str, seed: int, deadline: float) -> dict:
+    """PostController를 거쳐 작성/조회/수정하며 error_occurred로 나온 메시지를 모음
+
+    화면 없이 QCoreApplication만 만들어 쓰므로 프로세스의 메인 스레드에서 실행한다.
+    """
+    from PySide6.QtCore import QCoreApplication
+    from controllers import PostController
+
+    app = QCoreApplication.instance() or QCoreApplication([])  # noqa: F841
+    rng = random.Random(seed)
+    result = WorkerResult(name)
+    try:
+        repository = PostRepository(db_path)
+    except sqlite3.Error as e:
+        result.errors[f"open: {e}"] += 1
+        return result.to_dict()
+    controller = PostController(repository, reader=name)
+    controller.error_occurred.connect(lambda message: result.errors.update([f"controller: {message}"]))
+    try:
+        while time.time() < deadline:
+            roll = rng.random()
+            started = time.time()
+            errors_before = sum(result.errors.values())
+            if roll < 0.3:
+                op = "ctl_create"
+                controller.create_post(name, "controller", name)
+            else:
+                recent = repository.get_page(1, 20)
+                mine = [post for post in recent if post.author == name]
+                if roll < 0.6 and mine:
+                    op = "ctl_update"
+                    post = rng.choice(mine)
+                    controller.update_post(post.id, name, f"controller {started}")
+                elif recent:
+                    op = "ctl_view"
+                    controller.load_post(rng.choice(recent).id, count_view=True)
+                else:
+                    continue
+            ok = sum(result.errors.values()) == errors_before
+            result.records.append((started, op, time.time() - started, ok))
+    finally:
+        controller.close()
+        repository.close()
+    return result.to_dict()
+
+
+def run_process(db_path: str, process_index: int, threads: int, deadline: float,
+                seed: int, with_controller: bool) -> list[dict]:
+    """한 프로세스 안에서 threads개의 스레드 (with_controller면 메인 스레드에서 PostController도) 실행"""
+    results = [None] * threads
+
+    def target(index: int):
+        results[index] = run_worker(
+            db_path, f"stress-{process_index}-{index}", seed * 1000 + process_index * 100 + index, deadline
+        )
+
+    workers = [threading.Thread(target=target, args=(i,)) for i in range(threads)]
+    for worker in workers:
+        worker.start()
+    if with_controller:
+        results.append(run_controller(db_path, f"stress-{process_index}-ctl", seed * 1000 + process_index, deadline))
+    for worker in workers:
+        worker.join()
+    return results
+
+
+def check_invariants(db_path: str, results: list[dict]) -> list[str]:
+    """모든 작업이 끝난 뒤 DB 최종 상태를 각 스레드가 기억하는 상태와 비교"""
+    violations = [violation for result in results for violation in result["violations"]]
+    for result in results:
+        for message, count in result["errors"].items():
+            if any(locked in message for locked in LOCKED_MESSAGES):
+                violations.append(f"{result['name']}: {message} ({count}회)")
+
+    repository = PostRepository(db_path)
+    try:
+        for result in results:
+            for post_id, revision in result["revisions"].items():
+                post = repository.get_by_id(int(post_id))
+                if post is None:
+                    violations.append(f"{result['name']}: 글 {post_id}가 사라짐")
+                elif post.content != f"rev {revision}":
+                    violations.append(
+                        f"{result['name']}: 글 {post_id}의 수정이 사라짐 (기대 rev {revision}, 실제 {post.content!r})"
+                    )
+            for post_id, updated_at in result["updated_at"].items():
+                post = repository.get_by_id(int(post_id))
+                if post and post.updated_at < updated_at:
+                    violations.append(f"{result['name']}: 글 {post_id}의 최종 updated_at이 마지막으로 읽은 값보다 이전")
+            for post_id in result["deleted"]:
+                if repository.get_by_id(post_id) is not None:
+                    violations.append(f"{result['name']}: 삭제한 글 {post_id}가 남아 있음")
+        actual = repository.connection.execute("SELECT COUNT(*) FROM posts").fetchone()[0]
+        if repository.count() != actual:
+            violations.append(f"집계된 게시글 수 {repository.count()}와 실제 {actual}가 다름")
+    finally:
+        repository.close()
+    return violations
+
+
+def summarize(records: list[tuple[float, str, float, bool]], started: float, interval: float) -> dict:
+    """전체 및 interval초 구간별 처리량과 지연 시간 분포"""
+    def latency_ms(latencies: list[float]) -> dict:
+        return {
+            "mean": round(statistics.mean(latencies) * 1000, 2) if latencies else 0.0,
+            "p50": round(percentile(latencies, 0.50) * 1000, 2),
+            "p99": round(percentile(latencies, 0.99) * 1000, 2),
+            "max": round(max(latencies, default=0.0) * 1000, 2),
+        }
+
+    buckets: dict[int, list] = {}
+    by_op: dict[str, list[float]] = {}
+    for record_started, op, latency, ok in records:
+        buckets.setdefault(int((record_started - started) // interval), []).append((latency, ok))
+        by_op.setdefault(op, []).append(latency)
+
+    return {
+        "operations": {
+            op: {"count": len(latencies), "latency_ms": latency_ms(latencies)}
+            for op, latencies in sorted(by_op.items())
+        },
+        "timeline": [
+            {
+                "from_s": round(index * interval, 1),
+                "throughput_ops": round(len(bucket) / interval, 1),
+                "failed": sum(1 for _, ok in bucket if not ok),
+                "latency_ms": latency_ms([latency for latency, _ in bucket]),
+            }
+            for index, bucket in sorted(buckets.items())
+        ],
+    }
+
+
+def run(db_path: str, processes: int = 4, threads: int = 4, duration: float = 30.0,
+        report_interval: float = 5.0, seed: int = 0, wal: bool = False, with_controller: bool = True) -> dict:
+    """스트레스 테스트를 실행하고 결과 dict 반환 ("violations"가 비어 있으면 통과)"""
+    repository = PostRepository(db_path)
+    if wal:
+        repository.enable_wal()
+    repository.close()
+
+    started = time.time()
+    deadline = started + duration
+    # Qt를 쓰는 프로세스가 있으므로 fork 대신 새 인터프리터로 시작
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=processes, mp_context=context) as executor:
+        futures = [
+            executor.submit(run_process, db_path, index, threads, deadline, seed, with_controller)
+            for index in range(processes)
+        ]
+        results = [result for future in futures for result in future.result()]
+    elapsed = time.time() - started
+
+    records = [tuple(record) for result in results for record in result["records"]]
+    errors = Counter()
+    for result in results:
+        errors.update(result["errors"])
+    report = {
+        "processes": processes,
+        "threads": threads,
+        "duration_s": round(elapsed, 3),
+        "requests": len(records),
+        "throughput_ops": round(len(records) / elapsed, 1),
+        "errors": dict(errors.most_common(10)),
+    }
+    report.update(summarize(records, started, report_interval))
+    report["violations"] = check_invariants(db_path, results)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="board.db 동시 접근 스트레스 테스트")
+    parser.add_argument("--db", help="대상 DB 파일 (기본값: 임시 파일)")
+    parser.add_argument("--processes", type=int, default=4)
+    parser.add_argument("--threads", type=int, default=4, help="프로세스당 스레드 수")
+    parser.add_argument("--duration", type=float, default=30.0, help="실행 시간(초)")
+    parser.add_argument("--report-interval", type=float, default=5.0, help="구간별 통계 간격(초)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--wal", action="store_true", help="WAL 모드로 전환한 뒤 실행")
+    parser.add_argument("--no-controller", action="store_true", help="PostController 작업을 섞지 않음")
+    args = parser.parse_args()
+
+    db_path = args.db or os.path.join(tempfile.mkdtemp(), "stress_test.db")
+    report = run(db_path, args.processes, args.threads, args.duration, args.report_interval,
+                 args.seed, args.wal, not args.no_controller)
+
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    sys.exit(1 if report["violations"] else 0)
+
+
+if __name__ == "__main__":
+    main()
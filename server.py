@@ -0,0 +1,422 @@
+"""DDE 게시판 로컬 HTTP/JSON 서버
+
+데스크톱 앱을 띄우지 않고 다른 도구에서 게시판을 읽고 쓸 수 있도록
+PostRepository를 HTTP로 노출한다 (표준 라이브러리만 사용, PySide6 불필요).
+
+    python server.py --db board.db --port 8000
+
+    GET    /posts?page=1&page_size=50   목록 (최신순, &tags=a,b&match=all 로 태그 필터)
+    GET    /posts/<id>                  조회
+    (목록/조회에 &reader=이름을 붙이면 목록은 글마다 읽음 여부와 읽지 않은 글 수를 포함하고,
+     조회한 글은 그 독자가 읽은 것으로 표시)
+    POST   /posts                       작성 {"title", "content", "author", "tags"}
+    PUT    /posts/<id>                  수정 {"title", "content", "tags"}
+    DELETE /posts/<id>                  삭제
+    GET    /search?q=키워드&page=1       제목/내용 검색
+    GET    /stats                       게시판 통계
+    GET    /tags                        태그별 게시글 수
+
+- 조회 응답에는 updated_at과 댓글/조회 수 기반 ETag가 붙으며 If-None-Match가 같으면 304를 반환
+- PUT/DELETE에 If-Match를 보내면 다른 곳에서 먼저 수정된 경우 412를 반환
+- 아카이브된 게시글에 대한 PUT/DELETE는 409를 반환
+- 읽기는 읽기 전용 연결 풀, 쓰기는 단일 쓰기 연결(잠금으로 직렬화)을 사용하며
+  DB를 WAL 모드로 전환해 읽기와 쓰기가 서로 막지 않도록 한다 (WAL은 같은 컴퓨터의 공유
+  메모리를 쓰므로 --db는 로컬 디스크에 있어야 한다).
+- --snapshot-interval을 주면 검색/통계처럼 무거운 읽기는 주기적으로 갱신되는
+  읽기 전용 사본(PostSnapshot)에서 처리한다.
+- --archive-keep-years를 주면 그보다 오래된 게시글을 한 시간마다 백그라운드에서
+  연도별 아카이브 파일로 옮긴다 (PostArchiver, 아카이브된 글은 읽기 전용).
+"""
+import argparse
+import hashlib
+import json
+import queue
+import re
+import threading
+from contextlib import contextmanager
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs, urlsplit
+
+from controllers import validate_post_data
+from models import Post, PostArchiver, PostRepository, PostSnapshot, parse_tags
+
+MAX_PAGE_SIZE = 500
+MAX_BODY_SIZE = 10 * 1024 * 1024
+ARCHIVE_INTERVAL = 3600
+ARCHIVED_MESSAGE = "아카이브된 게시글은 읽기 전용입니다."
+
+
+class HttpError(Exception):
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class ReaderPool:
+    """읽기 전용 PostRepository 연결 풀"""
+
+    def __init__(self, db_path: str, size: int):
+        self._repositories = queue.Queue()
+        for _ in range(size):
+            self._repositories.put(PostRepository(db_path, read_only=True, check_same_thread=False))
+
+    @contextmanager
+    def acquire(self):
+        repository = self._repositories.get()
+        try:
+            yield repository
+        finally:
+            self._repositories.put(repository)
+
+    def close(self):
+        while not self._repositories.empty():
+            self._repositories.get_nowait().close()
+
+
+class BoardServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+    def __init__(self, address: tuple[str, int], db_path: str, readers: int = 8,
+                 snapshot_interval: Optional[float] = None, archive_keep_years: Optional[int] = None):
+        # 쓰기 연결이 스키마를 먼저 만든 뒤 읽기 연결을 연다
+        self.writer = PostRepository(db_path, check_same_thread=False)
+        self.writer.enable_wal()
+        self.write_lock = threading.Lock()
+        self.readers = ReaderPool(db_path, readers)
+        self.snapshot = None
+        if snapshot_interval:
+            self.snapshot = PostSnapshot(db_path)
+            self.snapshot.refresh()
+            self.snapshot.start(snapshot_interval)
+        self.archiver = None
+        if archive_keep_years:
+            self.archiver = PostArchiver(db_path, keep_years=archive_keep_years)
+            self.archiver.start(ARCHIVE_INTERVAL)
+        super().__init__(address, BoardRequestHandler)
+
+    @contextmanager
+    def heavy_reader(self):
+        """무거운 읽기용 연결 (사본이 있으면 사본, 없으면 읽기 풀)"""
+        if self.snapshot:
+            with self.snapshot.reader() as repository:
+                yield repository
+        else:
+            with self.readers.acquire() as repository:
+                yield repository
+
+    @contextmanager
+    def write(self):
+        with self.write_lock:
+            yield self.writer
+
+    def server_close(self):
+        super().server_close()
+        if self.archiver:
+            self.archiver.stop()
+        if self.snapshot:
+            self.snapshot.close()
+        self.readers.close()
+        self.writer.close()
+
+
+def post_etag(post: Post) -> str:
+    """응답에 담기는 댓글/조회 수도 포함 (댓글/조회는 updated_at을 바꾸지 않음)"""
+    updated_at = post.updated_at.isoformat() if post.updated_at else ""
+    return f'"{post.id}-{updated_at}-{post.comment_count}-{post.view_count}"'
+
+
+def list_etag(posts: list[Post], total: Optional[int], read: Optional[dict[int, bool]] = None,
+              unread_count: Optional[int] = None) -> str:
+    digest = hashlib.sha1(str(total).encode())
+    for post in posts:
+        digest.update(post_etag(post).encode())
+    if read is not None:
+        # 독자별 목록은 읽음 상태가 바뀌어도 다른 응답
+        digest.update(f"{unread_count}:".encode())
+        digest.update(bytes(read[post.id] for post in posts))
+    return f'"{digest.hexdigest()}"'
+
+
+class BoardRequestHandler(BaseHTTPRequestHandler):
+    server: BoardServer
+    protocol_version = "HTTP/1.1"
+
+    ROUTE_POSTS = re.compile(r"^/posts/?$")
+    ROUTE_POST = re.compile(r"^/posts/(\d+)/?$")
+    ROUTE_SEARCH = re.compile(r"^/search/?$")
+    ROUTE_STATS = re.compile(r"^/stats/?$")
+    ROUTE_TAGS = re.compile(r"^/tags/?$")
+
+    def log_message(self, format, *args):
+        # 요청마다 stderr에 기록하지 않음 (부하 시 병목)
+        pass
+
+    # === 응답 ===
+
+    def send_json(self, status: HTTPStatus, data=None, headers: Optional[dict] = None):
+        body = b"" if data is None else json.dumps(data, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        if data is not None:
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def send_error_json(self, status: HTTPStatus, message: str):
+        # 읽지 않은 요청 본문이 남아 있을 수 있으므로 연결을 닫음
+        self.close_connection = True
+        self.send_json(status, {"error": message}, headers={"Connection": "close"})
+
+    def send_with_etag(self, data: dict, etag: str):
+        if etag in self.if_none_match():
+            self.send_json(HTTPStatus.NOT_MODIFIED, headers={"ETag": etag})
+        else:
+            self.send_json(HTTPStatus.OK, data, headers={"ETag": etag})
+
+    # === 요청 파싱 ===
+
+    def if_none_match(self) -> list[str]:
+        value = self.headers.get("If-None-Match", "")
+        return [tag.strip() for tag in value.split(",") if tag.strip()]
+
+    def check_if_match(self, post: Post):
+        expected = self.headers.get("If-Match")
+        if expected and expected.strip() not in ("*", post_etag(post)):
+            raise HttpError(HTTPStatus.PRECONDITION_FAILED, "다른 곳에서 먼저 수정된 게시글입니다.")
+
+    def read_json(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_BODY_SIZE:
+            raise HttpError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "요청 본문이 너무 큽니다.")
+        try:
+            data = json.loads(self.rfile.read(length) or b"{}")
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            raise HttpError(HTTPStatus.BAD_REQUEST, "JSON 형식 오류")
+        if not isinstance(data, dict):
+            raise HttpError(HTTPStatus.BAD_REQUEST, "JSON 객체가 필요합니다.")
+        return data
+
+    def query_int(self, query: dict, name: str, default: int, maximum: Optional[int] = None) -> int:
+        try:
+            value = int(query.get(name, [default])[0])
+        except ValueError:
+            raise HttpError(HTTPStatus.BAD_REQUEST, f"{name}는 정수여야 합니다.")
+        if value < 1:
+            raise HttpError(HTTPStatus.BAD_REQUEST, f"{name}는 1 이상이어야 합니다.")
+        return min(value, maximum) if maximum else value
+
+    def dispatch(self, method: str):
+        url = urlsplit(self.path)
+        try:
+            if self.ROUTE_POSTS.match(url.path):
+                if method == "GET":
+                    return self.list_posts(parse_qs(url.query))
+                if method == "POST":
+                    return self.create_post()
+            elif match := self.ROUTE_POST.match(url.path):
+                post_id = int(match.group(1))
+                if method == "GET":
+                    return self.get_post(post_id, parse_qs(url.query))
+                if method == "PUT":
+                    return self.update_post(post_id)
+                if method == "DELETE":
+                    return self.delete_post(post_id)
+            elif self.ROUTE_SEARCH.match(url.path):
+                if method == "GET":
+                    return self.search_posts(parse_qs(url.query))
+            elif self.ROUTE_STATS.match(url.path):
+                if method == "GET":
+                    return self.get_stats()
+            elif self.ROUTE_TAGS.match(url.path):
+                if method == "GET":
+                    return self.get_tags()
+            else:
+                raise HttpError(HTTPStatus.NOT_FOUND, "없는 경로입니다.")
+            raise HttpError(HTTPStatus.METHOD_NOT_ALLOWED, "지원하지 않는 메서드입니다.")
+        except HttpError as e:
+            self.send_error_json(e.status, e.message)
+        except ValueError as e:
+            self.send_error_json(HTTPStatus.BAD_REQUEST, str(e))
+        except Exception as e:
+            self.send_error_json(HTTPStatus.INTERNAL_SERVER_ERROR, str(e))
+
+    def do_GET(self):
+        self.dispatch("GET")
+
+    def do_POST(self):
+        self.dispatch("POST")
+
+    def do_PUT(self):
+        self.dispatch("PUT")
+
+    def do_DELETE(self):
+        self.dispatch("DELETE")
+
+    # === 처리 ===
+
+    def list_posts(self, query: dict):
+        page = self.query_int(query, "page", 1)
+        page_size = self.query_int(query, "page_size", 50, MAX_PAGE_SIZE)
+        tags = parse_tags(query.get("tags", [""])[0])
+        match_all = query.get("match", ["any"])[0] == "all"
+        reader = query.get("reader", [""])[0].strip()
+        with self.server.readers.acquire() as repository:
+            if tags:
+                # 태그 필터의 전체 개수는 세지 않음 (결과 범위만 읽기 위함)
+                posts = repository.get_by_tags(tags, match_all, page, page_size)
+                total = None
+            else:
+                posts = repository.get_page(page, page_size)
+                total = repository.count()
+            if reader:
+                read = repository.is_read(reader, [post.id for post in posts])
+                unread_count = repository.unread_count(reader)
+        data = {
+            "page": page,
+            "page_size": page_size,
+            "total": total,
+            "posts": [post.to_dict(include_content=False) for post in posts],
+        }
+        if reader:
+            for post_data in data["posts"]:
+                post_data["read"] = read[post_data["id"]]
+            data["unread_count"] = unread_count
+            self.send_with_etag(data, list_etag(posts, total, read, unread_count))
+            return
+        self.send_with_etag(data, list_etag(posts, total))
+
+    def get_post(self, post_id: int, query: dict):
+        with self.server.readers.acquire() as repository:
+            post = repository.get_by_id(post_id)
+        if not post:
+            raise HttpError(HTTPStatus.NOT_FOUND, "게시글을 찾을 수 없습니다.")
+        reader = query.get("reader", [""])[0].strip()
+        if reader:
+            with self.server.write() as repository:
+                repository.mark_read(reader, [post_id])
+        self.send_with_etag(post.to_dict(), post_etag(post))
+
+    def search_posts(self, query: dict):
+        keyword = query.get("q", [""])[0]
+        if not keyword.strip():
+            raise HttpError(HTTPStatus.BAD_REQUEST, "검색어를 입력해주세요.")
+        page = self.query_int(query, "page", 1)
+        page_size = self.query_int(query, "page_size", 50, MAX_PAGE_SIZE)
+        with self.server.heavy_reader() as repository:
+            posts = repository.search(keyword, page, page_size)
+        self.send_json(HTTPStatus.OK, {
+            "q": keyword,
+            "page": page,
+            "page_size": page_size,
+            "posts": [post.to_dict(include_content=False) for post in posts],
+        })
+
+    def get_stats(self):
+        with self.server.heavy_reader() as repository:
+            stats = repository.get_stats()
+        self.send_json(HTTPStatus.OK, stats.to_dict())
+
+    def get_tags(self):
+        with self.server.readers.acquire() as repository:
+            tags = repository.get_tags()
+        self.send_json(HTTPStatus.OK, {
+            "tags": [{"name": tag.name, "post_count": tag.post_count} for tag in tags],
+        })
+
+    def read_tags(self, data: dict) -> Optional[list[str]]:
+        tags = data.get("tags")
+        if tags is None:
+            return None
+        if not isinstance(tags, list) or not all(isinstance(tag, str) for tag in tags):
+            raise HttpError(HTTPStatus.BAD_REQUEST, "tags는 문자열 목록이어야 합니다.")
+        return tags
+
+    def create_post(self):
+        data = self.read_json()
+        title, content = data.get("title", ""), data.get("content", "")
+        error = validate_post_data(title, content)
+        if error:
+            raise HttpError(HTTPStatus.BAD_REQUEST, error)
+
+        tags = self.read_tags(data)
+
+        with self.server.write() as repository:
+            post_id = repository.create(
+                Post(title=title, content=content, author=data.get("author", ""), tags=tags)
+            )
+            post = repository.get_by_id(post_id)
+        self.send_json(
+            HTTPStatus.CREATED, post.to_dict(),
+            headers={"ETag": post_etag(post), "Location": f"/posts/{post_id}"},
+        )
+
+    def update_post(self, post_id: int):
+        data = self.read_json()
+        tags = self.read_tags(data)
+        with self.server.write() as repository:
+            post = repository.get_by_id(post_id)
+            if not post:
+                raise HttpError(HTTPStatus.NOT_FOUND, "게시글을 찾을 수 없습니다.")
+            self.check_if_match(post)
+
+            title = data.get("title", post.title)
+            content = data.get("content", post.content)
+            error = validate_post_data(title, content)
+            if error:
+                raise HttpError(HTTPStatus.BAD_REQUEST, error)
+
+            if not repository.update(Post(id=post_id, title=title, content=content, tags=tags)):
+                raise HttpError(HTTPStatus.CONFLICT, ARCHIVED_MESSAGE)
+            post = repository.get_by_id(post_id)
+        self.send_json(HTTPStatus.OK, post.to_dict(), headers={"ETag": post_etag(post)})
+
+    def delete_post(self, post_id: int):
+        with self.server.write() as repository:
+            post = repository.get_by_id(post_id)
+            if not post:
+                raise HttpError(HTTPStatus.NOT_FOUND, "게시글을 찾을 수 없습니다.")
+            self.check_if_match(post)
+            if not repository.delete(post_id):
+                raise HttpError(HTTPStatus.CONFLICT, ARCHIVED_MESSAGE)
+        self.send_json(HTTPStatus.NO_CONTENT)
+
+
+def main(argv: Optional[list[str]] = None):
+    parser = argparse.ArgumentParser(description="DDE 게시판 로컬 HTTP/JSON 서버")
+    parser.add_argument("--db", default="board.db", help="DB 파일 경로 (기본값: board.db)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--readers", type=int, default=8, help="읽기 연결 수 (기본값: 8)")
+    parser.add_argument(
+        "--snapshot-interval", type=float,
+        help="검색/통계를 이 주기(초)로 갱신되는 읽기 전용 사본에서 처리"
+    )
+    parser.add_argument(
+        "--archive-keep-years", type=int,
+        help="최근 이 햇수(올해 포함)보다 오래된 게시글을 연도별 아카이브 파일로 이동"
+    )
+    args = parser.parse_args(argv)
+
+    server = BoardServer(
+        (args.host, args.port), args.db,
+        readers=args.readers, snapshot_interval=args.snapshot_interval,
+        archive_keep_years=args.archive_keep_years
+    )
+    print(f"Serving {args.db} on http://{args.host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,13 @@
+import pytest
+
+
+# PySide6 테스트를 위한 QApplication 인스턴스 (Qt가 필요 없는 테스트는 PySide6를 불러오지 않음)
+@pytest.fixture(scope="session")
+def app():
+    """테스트용 QApplication 생성"""
+    from PySide6.QtWidgets import QApplication
+
+    application = QApplication.instance()
+    if application is None:
+        application = QApplication([])
+    yield application
@@ -0,0 +1,268 @@
+import pytest
+import os
+import json
+import subprocess
+import sys
+import cli
+from models import Post, PostRepository
+
+
+class TestCli:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path, capsys):
+        """메모리 DB와 출력 캡처 준비 (파일 동작을 보는 테스트만 임시 DB 파일 사용)"""
+        self.repository = PostRepository(":memory:")
+        self.db_path = str(tmp_path / "test.db")
+        self.tmp_path = tmp_path
+        self.capsys = capsys
+        yield
+        self.repository.close()
+
+    def run(self, *args) -> tuple[int, str]:
+        """메모리 DB로 명령 실행"""
+        exit_code = cli.run(self.repository, cli.parse_args(["--db", ":memory:", *args]))
+        return exit_code, self.read_output()
+
+    def run_file(self, *args) -> tuple[int, str]:
+        """임시 DB 파일을 열어 명령 실행 (main과 같은 경로)"""
+        exit_code = cli.main(["--db", self.db_path, *args])
+        return exit_code, self.read_output()
+
+    def read_output(self) -> str:
+        captured = self.capsys.readouterr()
+        self.last_error = captured.err
+        return captured.out
+
+    def create_posts(self, count: int, repository: PostRepository = None) -> list[int]:
+        repository = repository or self.repository
+        return [
+            repository.create(Post(title=f"제목{i}", content=f"내용{i}", author="작성자"))
+            for i in range(count)
+        ]
+
+    def test_does_not_import_pyside6(self):
+        """CLI 모듈은 PySide6 없이 동작"""
+        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        result = subprocess.run(
+            [sys.executable, "-c", "import sys, cli; print('PySide6' in sys.modules)"],
+            cwd=project_root, capture_output=True, text=True,
+        )
+
+        assert result.stdout.strip() == "False"
+
+    def test_create_and_show(self):
+        """create 후 show로 JSON 조회"""
+        exit_code, output = self.run("create", "--title", "제목", "--content", "내용", "--author", "작성자")
+        post_id = json.loads(output)["id"]
+
+        exit_code, output = self.run("show", str(post_id))
+
+        assert exit_code == 0
+        assert json.loads(output)["content"] == "내용"
+
+    def test_create_empty_title_fails(self):
+        """빈 제목은 Controller와 같은 검증 메시지로 실패"""
+        exit_code, output = self.run("create", "--title", " ", "--content", "내용")
+
+        assert exit_code == 1
+        assert output == ""
+        assert json.loads(self.last_error)["error"] == "제목을 입력해주세요."
+
+    def test_create_from_file(self):
+        """JSON Lines 파일로 일괄 작성"""
+        input_path = self.tmp_path / "posts.jsonl"
+        input_path.write_text(
+            "\n".join(json.dumps({"title": f"제목{i}", "content": "내용"}) for i in range(3)),
+            encoding="utf-8",
+        )
+
+        exit_code, output = self.run("create", "--from-file", str(input_path))
+
+        assert exit_code == 0
+        assert json.loads(output)["created"] == 3
+
+    def test_list_paginated(self):
+        """list는 페이지 단위로 최신순 조회"""
+        post_ids = self.create_posts(5)
+
+        exit_code, output = self.run("list", "--page", "2", "--page-size", "2")
+        result = json.loads(output)
+
+        assert result["total"] == 5
+        assert [post["id"] for post in result["posts"]] == [post_ids[2], post_ids[1]]
+
+    def test_list_stream(self):
+        """list --stream은 게시글마다 한 줄씩 출력"""
+        post_ids = self.create_posts(5)
+
+        exit_code, output = self.run("list", "--stream", "--batch-size", "2")
+        lines = output.splitlines()
+
+        assert [json.loads(line)["id"] for line in lines] == list(reversed(post_ids))
+
+    def test_update(self):
+        """update는 지정한 항목만 수정"""
+        post_id = self.create_posts(1)[0]
+
+        exit_code, output = self.run("update", str(post_id), "--title", "수정된 제목")
+        result = json.loads(output)
+
+        assert result["title"] == "수정된 제목"
+        assert result["content"] == "내용0"
+
+    def test_delete_reports_missing(self):
+        """delete는 없는 게시글을 따로 알려주고 실패 코드 반환"""
+        post_id = self.create_posts(1)[0]
+
+        exit_code, output = self.run("delete", str(post_id), "9999")
+        result = json.loads(output)
+
+        assert exit_code == 1
+        assert result == {"deleted": [post_id], "archived": [], "not_found": [9999]}
+
+    def test_archived_post_is_read_only(self):
+        """아카이브된 글은 delete에서 없는 글과 따로 알리고 update는 읽기 전용 오류"""
+        repository = PostRepository(self.db_path)
+        post_id = self.create_posts(1, repository)[0]
+        created_at = repository._year_start_ms(2020)
+        repository.connection.execute(
+            "UPDATE posts SET created_at = ?, updated_at = ? WHERE id = ?", (created_at, created_at, post_id)
+        )
+        repository.connection.commit()
+        repository.archive_before(2021)
+        repository.close()
+
+        exit_code, output = self.run_file("delete", str(post_id), "9999")
+
+        assert exit_code == 1
+        assert json.loads(output) == {"deleted": [], "archived": [post_id], "not_found": [9999]}
+
+        exit_code, output = self.run_file("update", str(post_id), "--title", "수정된 제목")
+
+        assert exit_code == 1
+        assert "읽기 전용" in self.last_error
+
+    def test_search(self):
+        """search는 제목/내용 검색"""
+        self.create_posts(3)
+
+        exit_code, output = self.run("search", "제목1")
+
+        assert [post["title"] for post in json.loads(output)["posts"]] == ["제목1"]
+
+    def test_stats(self):
+        """stats는 집계 결과 출력"""
+        self.create_posts(2)
+
+        exit_code, output = self.run("stats")
+
+        assert json.loads(output)["total_posts"] == 2
+
+    def test_maintenance_migrate_reports_progress(self):
+        """이전 버전 DB는 열 때 변환하며 진행 상황은 stderr에, 결과 버전은 stdout에"""
+        repository = PostRepository(self.db_path)
+        self.create_posts(2, repository)
+        repository.connection.executescript("UPDATE posts SET uid = NULL; PRAGMA user_version = 2;")
+        repository.close()
+
+        exit_code, output = self.run_file("maintenance", "migrate")
+
+        assert json.loads(output) == {
+            "task": "migrate", "ok": True, "schema_version": PostRepository.SCHEMA_VERSION
+        }
+        assert json.loads(self.last_error.splitlines()[-1]) == {"migrating": "sync_uids", "done": 2, "total": 2}
+
+    def test_maintenance_integrity_check(self):
+        """maintenance integrity-check"""
+        exit_code, output = self.run("maintenance", "integrity-check")
+
+        assert json.loads(output)["ok"] is True
+
+    def test_maintenance_archive(self):
+        """maintenance archive는 --before-year 이전 글을 옮긴 수를 출력"""
+        repository = PostRepository(self.db_path)
+        self.create_posts(2, repository)
+        repository.close()
+
+        exit_code, output = self.run_file("maintenance", "archive", "--before-year", "2000")
+
+        assert exit_code == 0
+        assert json.loads(output)["moved"] == 0
+
+        exit_code, output = self.run_file("maintenance", "archive")
+
+        assert exit_code == 1
+
+    def test_sync(self):
+        """sync는 다른 DB와 주고받은 변경 수를 출력하고 양쪽 게시글을 맞춤"""
+        self.create_posts(2)
+        other_path = str(self.tmp_path / "other.db")
+        other = PostRepository(other_path)
+        other.create(Post(title="다른 DB 글", content="내용", author="작성자"))
+        other.close()
+
+        exit_code, output = self.run("sync", other_path)
+
+        assert exit_code == 0
+        result = json.loads(output)
+        assert (result["pulled"], result["pushed"]) == (1, 2)
+        other = PostRepository(other_path)
+        assert other.count() == 3
+        other.close()
+
+    def test_create_with_tags_and_filter(self):
+        """--tags로 작성하고 list --tags로 거르기"""
+        self.run("create", "--title", "공지글", "--content", "내용", "--tags", "공지,중요")
+        self.run("create", "--title", "일반글", "--content", "내용")
+
+        exit_code, output = self.run("list", "--tags", "공지")
+
+        assert [post["title"] for post in json.loads(output)["posts"]] == ["공지글"]
+
+    def test_list_tags_stream(self):
+        """list --tags --stream은 거른 결과 전체를 한 줄씩 출력 (--content는 거부)"""
+        for i in range(3):
+            self.run("create", "--title", f"공지{i}", "--content", "내용", "--tags", "공지")
+        self.run("create", "--title", "일반글", "--content", "내용")
+
+        exit_code, output = self.run("list", "--tags", "공지", "--stream", "--batch-size", "2")
+
+        assert [json.loads(line)["title"] for line in output.splitlines()] == ["공지2", "공지1", "공지0"]
+        with pytest.raises(SystemExit):
+            self.run("list", "--tags", "공지", "--stream", "--content")
+
+    def test_create_from_file_rejects_bad_tags(self):
+        """JSON Lines의 tags가 문자열 목록이 아니면 줄 번호와 함께 실패"""
+        input_path = self.tmp_path / "posts.jsonl"
+        input_path.write_text(
+            json.dumps({"title": "제목", "content": "내용", "tags": ["공지"]}) + "\n"
+            + json.dumps({"title": "제목", "content": "내용", "tags": "abc"}) + "\n",
+            encoding="utf-8",
+        )
+
+        exit_code, output = self.run("create", "--from-file", str(input_path))
+
+        assert exit_code == 1
+        assert json.loads(self.last_error)["error"] == "2번째 줄: tags는 문자열 목록이어야 합니다."
+        assert json.loads(output)["failed_line"] == 2
+
+    def test_create_from_file_failure_reports_created_ids(self, monkeypatch):
+        """뒤쪽 줄이 잘못되면 앞 줄까지 저장하고 만든 id와 실패한 줄을 출력"""
+        monkeypatch.setattr(cli, "BATCH_SIZE", 2)
+        input_path = self.tmp_path / "posts.jsonl"
+        input_path.write_text(
+            "\n".join(json.dumps({"title": f"제목{i}", "content": "내용"}) for i in range(3))
+            + "\n" + json.dumps({"title": " ", "content": "내용"}) + "\n"
+            + json.dumps({"title": "제목", "content": "내용"}) + "\n",
+            encoding="utf-8",
+        )
+
+        exit_code, output = self.run("create", "--from-file", str(input_path))
+        result = json.loads(output)
+
+        assert exit_code == 1
+        assert json.loads(self.last_error)["error"].startswith("4번째 줄: ")
+        assert result["created"] == 3
+        assert result["failed_line"] == 4
+        assert sorted(result["ids"]) == sorted(post.id for post in self.repository.get_all())
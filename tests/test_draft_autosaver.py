@@ -0,0 +1,191 @@
+import pytest
+import os
+from PySide6.QtWidgets import QApplication
+from models import Draft, DraftRepository, PostRepository
+from controllers import DocumentText, DraftAutosaver
+from views.create_page import CreatePage
+
+
+class TestDraftRepository:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        """임시 DB 생성"""
+        self.db_path = str(tmp_path / "test.db")
+        self.repository = DraftRepository(self.db_path)
+        yield
+        self.repository.close()
+        if os.path.exists(self.db_path):
+            os.remove(self.db_path)
+
+    def test_save_and_get(self):
+        """임시 저장본 저장 후 조회"""
+        self.repository.save(Draft(key="create", title="제목", content="내용", author="작성자", tags="공지"))
+
+        draft = self.repository.get("create")
+
+        assert draft.title == "제목"
+        assert draft.content == "내용"
+        assert draft.tags == "공지"
+        assert draft.updated_at is not None
+
+    def test_save_overwrites_same_key(self):
+        """같은 키로 저장하면 덮어씀"""
+        self.repository.save(Draft(key="create", title="처음"))
+        self.repository.save(Draft(key="create", title="나중"))
+
+        assert self.repository.get("create").title == "나중"
+
+    def test_save_empty_draft_deletes(self):
+        """빈 임시 저장본은 삭제로 처리"""
+        self.repository.save(Draft(key="create", title="제목"))
+        self.repository.save(Draft(key="create"))
+
+        assert self.repository.get("create") is None
+
+    def test_delete(self):
+        """임시 저장본 삭제"""
+        self.repository.save(Draft(key="edit:1", title="제목"))
+
+        assert self.repository.delete("edit:1") is True
+        assert self.repository.get("edit:1") is None
+
+    def test_board_db_skips_schema_statements(self, tmp_path, monkeypatch):
+        """PostRepository가 만든 board.db는 drafts 테이블까지 있으므로 열 때 DDL/변환을 실행하지 않음"""
+        db_path = str(tmp_path / "board.db")
+        PostRepository(db_path).close()
+        calls = []
+        monkeypatch.setattr(PostRepository, "create_draft_table", staticmethod(calls.append))
+
+        repository = DraftRepository(db_path)
+        repository.save(Draft(key="create", title="제목"))
+        draft = repository.get("create")
+        repository.close()
+
+        assert calls == []
+        assert draft.title == "제목"
+
+
+class TestDraftAutosaver:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, app, tmp_path):
+        """임시 DB와 DraftAutosaver 생성"""
+        self.db_path = str(tmp_path / "test.db")
+        self.repository = DraftRepository(self.db_path)
+        self.autosaver = DraftAutosaver(self.repository, interval_ms=60000)
+        yield
+        self.autosaver.close()
+        self.repository.close()
+        if os.path.exists(self.db_path):
+            os.remove(self.db_path)
+
+    def test_mark_dirty_does_not_write_immediately(self):
+        """변경 표시만으로는 DB에 기록하지 않음"""
+        self.autosaver.mark_dirty("create", lambda: Draft(key="create", title="제목"))
+        self.autosaver.wait()
+
+        assert self.repository.get("create") is None
+
+    def test_flush_coalesces_to_latest_snapshot(self):
+        """여러 번의 변경은 flush 시 마지막 상태 하나로 기록"""
+        snapshot_calls = []
+
+        def snapshot(title):
+            def make():
+                snapshot_calls.append(title)
+                return Draft(key="create", title=title)
+            return make
+
+        for title in ["가", "가나", "가나다"]:
+            self.autosaver.mark_dirty("create", snapshot(title))
+        self.autosaver.flush()
+        self.autosaver.wait()
+
+        assert snapshot_calls == ["가나다"]
+        assert self.repository.get("create").title == "가나다"
+
+    def test_load_includes_pending_changes(self):
+        """request_load는 대기 중인 변경을 기록한 뒤의 상태를 draft_loaded로 전달"""
+        loaded = []
+        self.autosaver.draft_loaded.connect(lambda key, draft: loaded.append((key, draft)))
+        self.autosaver.mark_dirty("create", lambda: Draft(key="create", content="내용"))
+
+        self.autosaver.request_load("create")
+        self.autosaver.wait()
+        QApplication.processEvents()
+
+        assert [(key, draft.content) for key, draft in loaded] == [("create", "내용")]
+
+    def test_discard_removes_pending_and_saved(self):
+        """discard는 대기 중인 변경과 저장된 임시 저장본을 모두 제거"""
+        self.repository.save(Draft(key="create", title="저장됨"))
+        self.autosaver.mark_dirty("create", lambda: Draft(key="create", title="대기"))
+
+        self.autosaver.discard("create")
+        self.autosaver.flush()
+        self.autosaver.wait()
+
+        assert self.repository.get("create") is None
+
+
+class TestDraftSnapshot:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, app, tmp_path):
+        self.repository = DraftRepository(str(tmp_path / "test.db"))
+        self.autosaver = DraftAutosaver(self.repository, interval_ms=60000)
+        self.page = CreatePage(controller=None, autosaver=self.autosaver)
+        yield
+        self.autosaver.close()
+        self.repository.close()
+
+    def test_document_text_rereads_only_after_edit(self):
+        """본문이 그대로면 이전에 읽은 문자열을 그대로 반환"""
+        content = DocumentText(self.page.content_input.document())
+        self.page.content_input.setPlainText("본문")
+
+        first = content.text()
+        assert content.text() is first
+        self.page.content_input.insertPlainText("!")
+        assert content.text() == "!본문"
+
+    def test_content_edit_is_unsaved_until_cleared(self):
+        """본문은 문서 revision으로 비교해 고치면 작성 중, 입력란을 비우면 다시 작성 전"""
+        assert self.page.has_unsaved_content() is False
+
+        self.page.content_input.setPlainText(" \n 내용")
+        assert self.page.has_unsaved_content() is True
+
+        self.page.clear_inputs()
+        assert self.page.has_unsaved_content() is False
+
+    def test_restored_draft_is_unsaved(self):
+        """복원한 임시 저장본은 작성 중인 내용으로 봄 (취소 시 확인 후 삭제)"""
+        self.repository.save(Draft(key="create", content="본문"))
+        self.page.restore_draft()
+        assert self.page.has_unsaved_content() is False
+
+        self.autosaver.wait()
+        QApplication.processEvents()
+        assert self.page.has_unsaved_content() is True
+
+    def test_restore_draft(self):
+        """임시 저장본은 쓰기 스레드에서 읽은 뒤 입력란에 복원"""
+        self.repository.save(Draft(key="create", title="저장됨", content="본문"))
+        self.page.restore_draft()
+        assert self.page.title_input.text() == ""
+
+        self.autosaver.wait()
+        QApplication.processEvents()
+        assert (self.page.title_input.text(), self.page.content_input.toPlainText()) == ("저장됨", "본문")
+
+    def test_restore_draft_does_not_overwrite_typing(self):
+        """임시 저장본을 읽는 사이 입력을 시작했으면 덮어쓰지 않음"""
+        self.repository.save(Draft(key="create", title="저장됨"))
+        self.page.restore_draft()
+        self.page.title_input.setText("입력 중")
+        self.autosaver.wait()
+        QApplication.processEvents()
+
+        assert self.page.title_input.text() == "입력 중"
@@ -0,0 +1,99 @@
+import pytest
+from PySide6.QtWidgets import QApplication
+from models import InMemoryPostRepository, Post
+from controllers import PostController
+from views.list_page import ListPage
+
+
+class TestListPage:
+    POST_COUNT = 1200
+
+    @pytest.fixture(autouse=True)
+    def setup(self, app):
+        """메모리 저장소에 조각 여러 개 분량의 글을 만들고 목록 페이지 생성"""
+        self.repository = InMemoryPostRepository()
+        self.post_ids = self.repository.create_many([
+            Post(title=f"글 {i}", content="내용", author="작성자", tags=["공지"] if i % 400 == 0 else None)
+            for i in range(self.POST_COUNT)
+        ])
+        self.controller = PostController(self.repository, reader="독자")
+        self.page = ListPage(self.controller)
+        self.opened = []
+        self.page.request_view.connect(self.opened.append)
+        yield
+        self.controller.close()
+        self.repository.close()
+
+    def wait_for_stream(self):
+        while self.controller.is_streaming_posts():
+            QApplication.processEvents()
+
+    def double_click(self, row: int):
+        self.page.on_row_double_clicked(self.page.table.model().index(row, 0))
+
+    def test_rows_are_built_chunk_by_chunk(self):
+        """첫 조각만 먼저 표시하고 나머지 조각은 이어 붙임"""
+        chunk_size = PostController.POST_CHUNK_SIZE
+        assert self.page.table.rowCount() == chunk_size
+        assert self.page.post_ids == self.post_ids[:-chunk_size - 1:-1]
+
+        self.wait_for_stream()
+
+        assert self.page.table.rowCount() == self.POST_COUNT
+        assert self.page.post_ids == self.post_ids[::-1]
+        assert self.page.table.item(self.POST_COUNT - 1, 0).text() == str(self.post_ids[0])
+
+    def test_shorter_list_trims_rows_and_ignores_stale_rows(self):
+        """새 목록이 짧으면 다 받은 뒤 남는 행을 지우고, 그 전까지 남은 이전 행은 열지 않음"""
+        self.wait_for_stream()
+        tagged = [post_id for i, post_id in enumerate(self.post_ids) if i % 400 == 0][::-1]
+
+        self.page.tag_filter_input.setText("공지")
+        self.page.refresh_posts()
+
+        assert self.page.post_ids == tagged
+        assert self.page.table.rowCount() == PostController.POST_CHUNK_SIZE
+        self.double_click(len(tagged))
+        self.double_click(0)
+        assert self.opened == [tagged[0]]
+
+        self.wait_for_stream()
+
+        assert self.page.table.rowCount() == len(tagged)
+        assert [self.page.table.item(row, 0).text() for row in range(len(tagged))] == [str(i) for i in tagged]
+
+    def test_unread_count_is_loaded_once_per_list(self, monkeypatch):
+        """읽음 여부는 조각의 글만 조회하고, 읽지 않은 글 수는 목록을 다 받은 뒤 한 번만 셈"""
+        self.wait_for_stream()
+        read_calls, count_calls = [], []
+        is_read, unread_count = self.repository.is_read, self.repository.unread_count
+
+        def counting_is_read(reader, post_ids):
+            read_calls.append(len(post_ids))
+            return is_read(reader, post_ids)
+
+        def counting_unread_count(reader):
+            count_calls.append(reader)
+            return unread_count(reader)
+
+        monkeypatch.setattr(self.repository, "is_read", counting_is_read)
+        monkeypatch.setattr(self.repository, "unread_count", counting_unread_count)
+
+        self.page.refresh_posts()
+        assert count_calls == []
+        self.wait_for_stream()
+
+        assert read_calls == [500, 500, 200]
+        assert len(count_calls) == 1
+        assert self.page.label_unread.text() == f"읽지 않은 글 {self.POST_COUNT}개"
+
+    def test_opening_post_unbolds_only_its_row(self):
+        """글을 읽으면 목록 전체를 다시 조회하지 않고 그 행만 굵게 표시를 풂"""
+        self.wait_for_stream()
+        assert self.page.table.item(0, 1).font().bold() is True
+
+        self.controller.load_post(self.post_ids[-1], count_view=True)
+
+        assert self.page.table.item(0, 1).font().bold() is False
+        assert self.page.table.item(1, 1).font().bold() is True
+        assert self.page.label_unread.text() == f"읽지 않은 글 {self.POST_COUNT - 1}개"
@@ -0,0 +1,64 @@
+import pytest
+from PySide6.QtWidgets import QApplication
+from models import DraftRepository, InMemoryPostRepository, Post
+from views import MainWindow
+
+
+class TestMemoryDiagnostics:
+    WARMUP_CYCLES = 3
+    CYCLES = 15
+    # 한 바퀴(목록 → 조회 → 수정 → 조회 → 목록)마다 허용하는 Python 할당 증가량
+    MAX_GROWTH_PER_CYCLE = 16 * 1024
+
+    @pytest.fixture(autouse=True)
+    def setup(self, app):
+        self.repository = InMemoryPostRepository()
+        self.post_ids = self.repository.create_many([
+            Post(title=f"글 {i}", content="본문 **굵게** " * 200, author="작성자", tags=["태그"])
+            for i in range(300)
+        ])
+        self.window = MainWindow(self.repository, DraftRepository(":memory:"), memory_diagnostics=True)
+        self.window.diagnostics.stream = None
+        yield
+        self.window.close()
+
+    def process_events(self):
+        """대기 중인 이벤트와 조각 단위 본문 렌더링/목록 전달을 모두 처리"""
+        app = QApplication.instance()
+        app.processEvents()
+        while self.window.controller.renderer.is_rendering() or self.window.controller.is_streaming_posts():
+            app.processEvents()
+
+    def run_page_cycles(self, post_id: int, cycles: int):
+        """목록 → 조회 → 수정 → 조회 → 목록을 cycles번 반복 (MainWindow가 목록으로 돌아올 때마다 측정)"""
+        for _ in range(cycles):
+            self.window.switch_to_view(post_id)
+            self.process_events()
+            self.window.switch_to_edit(post_id)
+            self.process_events()
+            self.window.edit_page.on_cancel_clicked()
+            self.process_events()
+            self.window.switch_to_list()
+            self.process_events()
+        return self.window.diagnostics.samples
+
+    def test_page_cycles_do_not_grow_memory(self):
+        """목록/조회/수정 페이지를 반복해서 오가도 Qt 객체 수와 Python 메모리가 늘지 않음"""
+        samples = self.run_page_cycles(self.post_ids[-1], self.WARMUP_CYCLES + self.CYCLES)
+        assert len(samples) == 1 + self.WARMUP_CYCLES + self.CYCLES
+
+        python_growth, qt_growth = self.window.diagnostics.growth_per_cycle(skip=1 + self.WARMUP_CYCLES)
+        assert qt_growth == {"list": 0, "view": 0, "edit": 0}
+        assert python_growth < self.MAX_GROWTH_PER_CYCLE, "\n".join(
+            self.window.diagnostics.format_sample(sample) for sample in samples[-3:]
+        )
+
+    def test_sample_reports_growth(self):
+        diagnostics = self.window.diagnostics
+        before = diagnostics.samples[-1]
+        self.window.list_page.on_posts_loaded([])
+        sample = diagnostics.sample("비운 목록")
+
+        assert sample.qt_objects["list"] < before.qt_objects["list"]
+        line = diagnostics.format_sample(sample, before)
+        assert line.startswith("[memory] 비운 목록: Python") and "list" in line
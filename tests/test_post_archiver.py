@@ -0,0 +1,45 @@
+import pytest
+from datetime import datetime, timezone
+from models import Post, PostArchiver, PostRepository
+
+
+class TestPostArchiver:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        """임시 DB 생성"""
+        self.db_path = str(tmp_path / "test.db")
+        self.repository = PostRepository(self.db_path)
+        yield
+        self.repository.close()
+
+    def create_post(self, year: int) -> int:
+        post_id = self.repository.create(Post(title=f"{year}년 글", content="내용", author="작성자"))
+        created_at = self.repository._year_start_ms(year)
+        self.repository.connection.execute(
+            "UPDATE posts SET created_at = ?, updated_at = ? WHERE id = ?", (created_at, created_at, post_id)
+        )
+        self.repository.connection.commit()
+        return post_id
+
+    def test_run_once_keeps_recent_years(self):
+        """keep_years 이내 글은 남기고 이전 글만 옮김"""
+        this_year = datetime.now(timezone.utc).year
+        old_id = self.create_post(this_year - 3)
+        recent_id = self.create_post(this_year - 1)
+        archiver = PostArchiver(self.db_path, keep_years=2, batch_size=1, pause=0)
+
+        assert archiver.run_once() == 1
+        assert self.repository.get_by_id(old_id).archived is True
+        assert self.repository.get_by_id(recent_id).archived is False
+        assert archiver.run_once() == 0
+
+    def test_start_and_stop(self):
+        """start() 직후 백그라운드에서 한 번 실행"""
+        old_id = self.create_post(datetime.now(timezone.utc).year - 5)
+        archiver = PostArchiver(self.db_path, keep_years=1, pause=0)
+
+        archiver.start(interval=60)
+        archiver.stop()
+
+        assert self.repository.get_by_id(old_id).archived is True
@@ -1,20 +1,9 @@
 import pytest
-import os
 from PySide6.QtWidgets import QApplication
-from models import Post, PostRepository
+from models import InMemoryPostRepository, Post, PostRepository, RenderCache
 from controllers import PostController
 
 
-# PySide6 테스트를 위한 QApplication 인스턴스
-@pytest.fixture(scope="session")
-def app():
-    """테스트용 QApplication 생성"""
-    application = QApplication.instance()
-    if application is None:
-        application = QApplication([])
-    yield application
-
-
 class SignalSpy:
     """Signal 발생을 추적하는 헬퍼 클래스"""
 
@@ -37,11 +26,10 @@ class SignalSpy:
 class TestPostController:
 
     @pytest.fixture(autouse=True)
-    def setup(self, app, tmp_path):
-        """임시 DB와 Controller 생성"""
-        self.db_path = str(tmp_path / "test.db")
-        self.repository = PostRepository(self.db_path)
-        self.controller = PostController(self.repository)
+    def setup(self, app):
+        """메모리 저장소와 Controller 생성 (SQLite 동작은 test_post_store.py에서 확인)"""
+        self.repository = InMemoryPostRepository()
+        self.controller = PostController(self.repository, reader="독자")
 
         # Signal Spy 설정
         self.posts_loaded_spy = SignalSpy()
@@ -49,6 +37,9 @@ class TestPostController:
         self.post_created_spy = SignalSpy()
         self.post_updated_spy = SignalSpy()
         self.post_deleted_spy = SignalSpy()
+        self.stats_loaded_spy = SignalSpy()
+        self.comments_loaded_spy = SignalSpy()
+        self.comment_added_spy = SignalSpy()
         self.error_spy = SignalSpy()
 
         self.controller.posts_loaded.connect(self.posts_loaded_spy.slot)
@@ -56,12 +47,13 @@ class TestPostController:
         self.controller.post_created.connect(self.post_created_spy.slot)
         self.controller.post_updated.connect(self.post_updated_spy.slot)
         self.controller.post_deleted.connect(self.post_deleted_spy.slot)
+        self.controller.stats_loaded.connect(self.stats_loaded_spy.slot)
+        self.controller.comments_loaded.connect(self.comments_loaded_spy.slot)
+        self.controller.comment_added.connect(self.comment_added_spy.slot)
         self.controller.error_occurred.connect(self.error_spy.slot)
 
         yield
         self.repository.close()
-        if os.path.exists(self.db_path):
-            os.remove(self.db_path)
 
     # === CREATE 테스트 ===
 
@@ -114,6 +106,89 @@ class TestPostController:
         posts = self.posts_loaded_spy.last_args[0]
         assert posts == []
 
+    def test_load_posts_filtered_by_tags(self):
+        """태그를 지정하면 해당 태그의 게시글만 로드"""
+        self.controller.create_post("제목1", "내용1", "작성자", ["공지"])
+        self.controller.create_post("제목2", "내용2", "작성자", ["질문"])
+
+        self.controller.load_posts(["공지"])
+
+        posts = self.posts_loaded_spy.last_args[0]
+        assert [post.title for post in posts] == ["제목1"]
+
+    def stream_events(self) -> list[tuple]:
+        events = []
+        self.controller.posts_load_started.connect(lambda token_id: events.append(("start", token_id)))
+        self.controller.posts_chunk_loaded.connect(
+            lambda token_id, posts: events.append(("chunk", token_id, [post.id for post in posts]))
+        )
+        self.controller.posts_load_finished.connect(
+            lambda token_id, cancelled: events.append(("finish", token_id, cancelled))
+        )
+        return events
+
+    def wait_for_stream(self):
+        while self.controller.is_streaming_posts():
+            QApplication.processEvents()
+
+    def test_stream_posts_in_chunks(self):
+        """첫 조각은 바로, 나머지는 이벤트 루프에서 chunk_size개씩 전달"""
+        post_ids = self.repository.create_many([Post(title=str(i), content="내용") for i in range(5)])
+        events = self.stream_events()
+
+        token = self.controller.stream_posts(chunk_size=2)
+        assert events == [("start", token.id), ("chunk", token.id, post_ids[:2:-1])]
+
+        self.wait_for_stream()
+        assert events[2:] == [
+            ("chunk", token.id, post_ids[2:0:-1]),
+            ("chunk", token.id, post_ids[:1]),
+            ("finish", token.id, False),
+        ]
+        assert self.posts_loaded_spy.called is False
+
+    def test_stream_posts_filtered_by_tags(self):
+        for i in range(3):
+            self.controller.create_post(f"공지{i}", "내용", "작성자", ["공지"])
+        self.controller.create_post("질문", "내용", "작성자", ["질문"])
+        events = self.stream_events()
+
+        token = self.controller.stream_posts(["공지"], chunk_size=2)
+        self.wait_for_stream()
+
+        assert [len(event[2]) for event in events if event[0] == "chunk"] == [2, 1]
+        assert events[-1] == ("finish", token.id, False)
+
+    def test_stream_posts_by_tags_ignores_concurrent_writes(self):
+        """태그 목록을 받는 도중 글이 추가/삭제되어도 이미 받은 글이 다시 오거나 남은 글이 빠지지 않음"""
+        post_ids = self.repository.create_many(
+            [Post(title=str(i), content="내용", tags=["공지"]) for i in range(6)]
+        )
+        events = self.stream_events()
+
+        self.controller.stream_posts(["공지"], chunk_size=2)
+        self.repository.create(Post(title="새 글", content="내용", tags=["공지"]))
+        self.repository.delete(post_ids[0])
+        self.wait_for_stream()
+
+        streamed = [post_id for event in events if event[0] == "chunk" for post_id in event[2]]
+        assert streamed == post_ids[:0:-1]
+
+    def test_stream_posts_cancel(self):
+        """취소하거나 새 목록을 요청하면 진행 중이던 목록은 더 보내지 않음"""
+        self.repository.create_many([Post(title=str(i), content="내용") for i in range(5)])
+        events = self.stream_events()
+
+        first = self.controller.stream_posts(chunk_size=2)
+        second = self.controller.stream_posts(chunk_size=2)
+        assert first.cancelled is True
+        assert events[2] == ("finish", first.id, True)
+
+        second.cancel()
+        self.wait_for_stream()
+        assert [event for event in events if event[1] == second.id][-1] == ("finish", second.id, True)
+        assert len([event for event in events if event[0] == "chunk"]) == 2
+
     def test_load_post_success(self):
         """단일 게시글 로드 성공"""
         post_id = self.repository.create(
@@ -194,3 +269,193 @@ class TestPostController:
 
         assert self.post_deleted_spy.called is False
         assert self.error_spy.called is True
+
+    def test_archived_post_is_read_only(self, tmp_path):
+        """SQLite에서 아카이브된 글의 수정/삭제는 반영되지 않고 error_occurred Signal 발생"""
+        repository = PostRepository(str(tmp_path / "test.db"))
+        controller = PostController(repository)
+        controller.post_updated.connect(self.post_updated_spy.slot)
+        controller.post_deleted.connect(self.post_deleted_spy.slot)
+        controller.error_occurred.connect(self.error_spy.slot)
+        post_id = repository.create(Post(title="제목", content="내용", author="작성자"))
+        created_at = repository._year_start_ms(2020)
+        repository.connection.execute(
+            "UPDATE posts SET created_at = ?, updated_at = ? WHERE id = ?", (created_at, created_at, post_id)
+        )
+        repository.connection.commit()
+        repository.archive_before(2021)
+
+        try:
+            controller.update_post(post_id, "수정", "내용")
+            controller.delete_post(post_id)
+
+            assert self.post_updated_spy.called is False
+            assert self.post_deleted_spy.called is False
+            assert self.error_spy.call_count == 2
+            assert repository.get_by_id(post_id).title == "제목"
+        finally:
+            controller.close()
+            repository.close()
+
+    # === STATS 테스트 ===
+
+    def test_load_stats_emits_signal_with_data(self):
+        """통계 로드 시 stats_loaded Signal에 집계 포함"""
+        self.repository.create(Post(title="제목", content="내용", author="작성자"))
+
+        self.controller.load_stats()
+
+        assert self.stats_loaded_spy.called is True
+        stats = self.stats_loaded_spy.last_args[0]
+        assert stats.total_posts == 1
+
+    # === COMMENT 테스트 ===
+
+    def test_add_comment_emits_signal(self):
+        """댓글 작성 성공 시 comment_added Signal 발생"""
+        post_id = self.repository.create(Post(title="제목", content="내용", author="작성자"))
+
+        self.controller.add_comment(post_id, "댓글", "작성자")
+
+        assert self.comment_added_spy.last_args == (post_id,)
+        assert self.error_spy.called is False
+
+    def test_add_comment_empty_emits_error(self):
+        """빈 댓글은 error_occurred Signal 발생"""
+        post_id = self.repository.create(Post(title="제목", content="내용", author="작성자"))
+
+        self.controller.add_comment(post_id, "  ", "작성자")
+
+        assert self.comment_added_spy.called is False
+        assert self.error_spy.called is True
+
+    def test_load_comments_reports_more_pages(self):
+        """한 페이지보다 많으면 다음 페이지가 있다고 알림"""
+        post_id = self.repository.create(Post(title="제목", content="내용", author="작성자"))
+        for i in range(3):
+            self.repository.add_comment(post_id, f"댓글{i}", "작성자")
+
+        self.controller.load_comments(post_id, limit=2)
+
+        loaded_post_id, comments, has_more = self.comments_loaded_spy.last_args
+        assert loaded_post_id == post_id
+        assert len(comments) == 2
+        assert has_more is True
+
+    # === ATTACHMENT 테스트 ===
+
+    def test_add_attachment_emits_changed(self, tmp_path):
+        """파일 첨부 성공 시 attachments_changed Signal 발생"""
+        post_id = self.repository.create(Post(title="제목", content="내용", author="작성자"))
+        file_path = tmp_path / "note.txt"
+        file_path.write_text("첨부 내용", encoding="utf-8")
+        changed_spy = SignalSpy()
+        loaded_spy = SignalSpy()
+        self.controller.attachments_changed.connect(changed_spy.slot)
+        self.controller.attachments_loaded.connect(loaded_spy.slot)
+
+        self.controller.add_attachment(post_id, str(file_path))
+        self.controller.load_attachments(post_id)
+
+        assert changed_spy.last_args == (post_id,)
+        assert [a.filename for a in loaded_spy.last_args[1]] == ["note.txt"]
+        assert self.error_spy.called is False
+
+    # === VIEW COUNT 테스트 ===
+
+    def test_load_post_count_view(self):
+        """count_view=True일 때만 조회수 증가"""
+        post_id = self.repository.create(Post(title="제목", content="내용", author="작성자"))
+
+        self.controller.load_post(post_id, count_view=True)
+        assert self.post_loaded_spy.last_args[0].view_count == 1
+
+        self.controller.load_post(post_id)
+        assert self.post_loaded_spy.last_args[0].view_count == 1
+
+        self.controller.close()
+        assert self.repository.flush_views() == 0
+        assert self.repository.get_by_id(post_id).view_count == 1
+
+    # === MARKDOWN RENDER 테스트 ===
+
+    def render(self, post_id: int) -> list[str]:
+        """렌더링이 끝날 때까지 이벤트를 처리하고 받은 HTML 조각 반환"""
+        chunks = []
+        self.controller.content_chunk_rendered.connect(lambda _, html: chunks.append(html))
+        self.controller.render_content(self.repository.get_by_id(post_id))
+        while self.controller.renderer.is_rendering():
+            QApplication.processEvents()
+        self.controller.content_chunk_rendered.disconnect()
+        return chunks
+
+    def test_render_content_in_chunks_then_from_cache(self):
+        """긴 본문은 여러 조각으로 렌더링하고, 같은 수정본은 캐시에서 한 번에 전달"""
+        content = "\n\n".join(f"**문단 {i}**" for i in range(10))
+        post_id = self.repository.create(Post(title="제목", content=content, author="작성자"))
+        self.controller.renderer.chunk_chars = 20
+
+        first = self.render(post_id)
+        cached = self.render(post_id)
+
+        assert len(first) > 1
+        assert "문단 9" in first[-1]
+        assert "font-weight:700" in first[0]
+        assert cached == ["".join(first)]
+
+    def test_update_invalidates_render_cache(self):
+        """수정하면 이전 렌더링 결과를 버리고 새 내용으로 렌더링"""
+        post_id = self.repository.create(Post(title="제목", content="예전 내용", author="작성자"))
+        self.render(post_id)
+
+        self.controller.update_post(post_id, "제목", "새 내용")
+
+        assert len(self.controller.render_cache) == 0
+        assert "새 내용" in "".join(self.render(post_id))
+
+    def test_render_cache_evicts_least_recently_used(self):
+        """크기 한도를 넘으면 가장 오래 쓰지 않은 결과부터 제거"""
+        post = self.repository.get_by_id(
+            self.repository.create(Post(title="제목", content="내용", author="작성자"))
+        )
+        html = "x" * 1000
+        cache = RenderCache(max_bytes=2500)
+        cache.put(1, post.updated_at, html)
+        cache.put(2, post.updated_at, html)
+        cache.get(1, post.updated_at)
+
+        cache.put(3, post.updated_at, html)
+
+        assert cache.get(1, post.updated_at) == html
+        assert cache.get(2, post.updated_at) is None
+        assert cache.size_bytes <= 2500
+
+    # === READ STATE 테스트 ===
+
+    def test_opening_post_marks_it_read(self):
+        """count_view=True로 연 글만 읽음 처리되고 목록용 읽음 상태에 반영"""
+        first = self.repository.create(Post(title="첫 글", content="내용", author="작성자"))
+        second = self.repository.create(Post(title="둘째 글", content="내용", author="작성자"))
+        read_spy = SignalSpy()
+        unread_spy = SignalSpy()
+        changed_spy = SignalSpy()
+        self.controller.read_state_loaded.connect(read_spy.slot)
+        self.controller.unread_count_loaded.connect(unread_spy.slot)
+        self.controller.read_state_changed.connect(changed_spy.slot)
+
+        self.controller.load_post(first)
+        self.controller.load_post(second, count_view=True)
+        self.controller.load_read_state([first, second])
+        self.controller.load_unread_count()
+
+        assert changed_spy.last_args == ([second],)
+        assert read_spy.last_args == ({first: False, second: True},)
+        assert unread_spy.last_args == (1,)
+
+        self.controller.mark_all_read()
+        self.controller.load_read_state([first, second])
+        self.controller.load_unread_count()
+
+        assert changed_spy.last_args == (None,)
+        assert read_spy.last_args == ({first: True, second: True},)
+        assert unread_spy.last_args == (0,)
@@ -1,5 +1,7 @@
 import pytest
+import io
 import os
+import sqlite3
 from models import Post, PostRepository
 
 
@@ -99,6 +101,59 @@ class TestPostRepository:
         post = self.repository.get_by_id(9999)
         assert post is None
 
+    def test_get_page(self):
+        """최신순 페이지 조회"""
+        ids = [
+            self.repository.create(Post(title=f"제목{i}", content="내용", author="작성자"))
+            for i in range(5)
+        ]
+
+        posts = self.repository.get_page(page=2, page_size=2)
+
+        assert [post.id for post in posts] == [ids[2], ids[1]]
+
+    def test_iter_all_streams_in_batches(self):
+        """배치 크기와 무관하게 전체 목록을 최신순으로 반환"""
+        ids = [
+            self.repository.create(Post(title=f"제목{i}", content="내용", author="작성자"))
+            for i in range(5)
+        ]
+
+        posts = list(self.repository.iter_all(batch_size=2))
+
+        assert [post.id for post in posts] == list(reversed(ids))
+
+    def test_search_escapes_wildcards(self):
+        """검색어의 %, _ 는 문자 그대로 검색"""
+        self.repository.create(Post(title="100% 완료", content="내용", author="작성자"))
+        self.repository.create(Post(title="1000 완료", content="내용", author="작성자"))
+
+        posts = self.repository.search("100%")
+
+        assert [post.title for post in posts] == ["100% 완료"]
+
+    def test_create_many_is_atomic(self):
+        """일괄 생성 중 하나라도 유효하지 않으면 아무것도 저장하지 않음"""
+        with pytest.raises(ValueError):
+            self.repository.create_many([
+                Post(title="제목", content="내용", author="작성자"),
+                Post(title="", content="내용", author="작성자"),
+            ])
+
+        assert self.repository.get_all() == []
+
+    def test_read_only_repository_reads_but_cannot_write(self):
+        """읽기 전용 연결은 조회만 가능"""
+        post_id = self.repository.create(Post(title="제목", content="내용", author="작성자"))
+        reader = PostRepository(self.db_path, read_only=True)
+
+        try:
+            assert reader.get_by_id(post_id).title == "제목"
+            with pytest.raises(sqlite3.OperationalError):
+                reader.create(Post(title="제목", content="내용", author="작성자"))
+        finally:
+            reader.close()
+
     # === UPDATE 테스트 ===
 
     def test_update_post_success(self):
@@ -148,3 +203,691 @@ class TestPostRepository:
         """존재하지 않는 게시글 삭제 시 False 반환"""
         result = self.repository.delete(9999)
         assert result is False
+
+    def test_delete_failure_rolls_back(self):
+        """삭제 중 트리거가 실패하면 트랜잭션을 되돌려 잠금을 잡은 채 남기지 않음"""
+        post_id = self.repository.create(Post(title="제목", content="내용", author="작성자"))
+        self.repository.connection.execute("""
+            CREATE TEMP TRIGGER fail_delete BEFORE DELETE ON posts
+            BEGIN SELECT RAISE(ABORT, '삭제 실패'); END
+        """)
+
+        with pytest.raises(sqlite3.IntegrityError):
+            self.repository.delete(post_id)
+
+        assert self.repository.connection.in_transaction is False
+        assert self.repository.get_by_id(post_id) is not None
+
+    # === STATS 테스트 ===
+
+    def test_get_stats_empty(self):
+        """게시글이 없을 때 통계는 0"""
+        stats = self.repository.get_stats()
+
+        assert stats.total_posts == 0
+        assert stats.total_authors == 0
+        assert stats.authors == []
+        assert stats.daily == []
+
+    def test_get_stats_counts_per_author(self):
+        """작성자별 게시글 수 집계"""
+        self.repository.create(Post(title="제목1", content="내용", author="작성자1"))
+        self.repository.create(Post(title="제목2", content="내용", author="작성자1"))
+        self.repository.create(Post(title="제목3", content="내용", author="작성자2"))
+
+        stats = self.repository.get_stats()
+
+        assert stats.total_posts == 3
+        assert stats.total_authors == 2
+        assert stats.authors[0].author == "작성자1"
+        assert stats.authors[0].post_count == 2
+        assert stats.authors[0].last_activity is not None
+        assert sum(daily.post_count for daily in stats.daily) == 3
+
+    def test_get_stats_after_delete(self):
+        """삭제 시 집계가 감소하고 게시글이 없는 작성자는 제거"""
+        post_id = self.repository.create(Post(title="제목1", content="내용", author="작성자1"))
+        self.repository.create(Post(title="제목2", content="내용", author="작성자2"))
+
+        self.repository.delete(post_id)
+        stats = self.repository.get_stats()
+
+        assert stats.total_posts == 1
+        assert stats.total_authors == 1
+        assert [a.author for a in stats.authors] == ["작성자2"]
+
+    def test_get_stats_backfills_existing_db(self, tmp_path):
+        """집계 테이블이 없던 기존 DB는 최초 연결 시 한 번 집계"""
+        db_path = str(tmp_path / "legacy.db")
+        connection = sqlite3.connect(db_path)
+        connection.execute("""
+            CREATE TABLE posts (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                title TEXT NOT NULL,
+                content TEXT NOT NULL,
+                author TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT (datetime('now', 'localtime')),
+                updated_at TIMESTAMP DEFAULT (datetime('now', 'localtime'))
+            )
+        """)
+        connection.execute("INSERT INTO posts (title, content, author) VALUES ('제목', '내용', '작성자')")
+        connection.commit()
+        connection.close()
+
+        repository = PostRepository(db_path)
+        stats = repository.get_stats()
+        repository.close()
+
+        assert stats.total_posts == 1
+        assert stats.total_authors == 1
+
+    def test_new_db_schema_is_created_in_one_transaction(self, tmp_path, monkeypatch):
+        """새 DB의 테이블/트리거는 한 트랜잭션으로 만들어 중간에 실패하면 아무것도 남지 않음"""
+        db_path = str(tmp_path / "new.db")
+
+        def failing_step(repository):
+            raise sqlite3.OperationalError("실패")
+
+        monkeypatch.setattr(PostRepository, "_create_read_state_tables", failing_step)
+        with pytest.raises(sqlite3.OperationalError):
+            PostRepository(db_path)
+
+        connection = sqlite3.connect(db_path)
+        tables = connection.execute("SELECT name FROM sqlite_master").fetchall()
+        version = connection.execute("PRAGMA user_version").fetchone()[0]
+        connection.close()
+
+        assert tables == []
+        assert version == 0
+
+    def test_timestamps_stored_as_epoch_ms(self):
+        """일시는 UTC epoch ms 정수로 저장되고 UTC datetime으로 읽힘"""
+        post_id = self.repository.create(Post(title="제목", content="내용", author="작성자"))
+
+        stored = self.repository.connection.execute(
+            "SELECT typeof(created_at), typeof(updated_at) FROM posts WHERE id = ?", (post_id,)
+        ).fetchone()
+        post = self.repository.get_by_id(post_id)
+
+        assert tuple(stored) == ("integer", "integer")
+        assert post.created_at.tzinfo is not None
+        assert post.created_at.utcoffset().total_seconds() == 0
+
+    def test_migrates_localtime_text_timestamps(self, tmp_path, monkeypatch):
+        """기존 DB의 localtime 문자열 일시를 배치로 나눠 epoch ms로 변환"""
+        db_path = str(tmp_path / "legacy.db")
+        connection = sqlite3.connect(db_path)
+        connection.execute("""
+            CREATE TABLE posts (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                title TEXT NOT NULL,
+                content TEXT NOT NULL,
+                author TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT (datetime('now', 'localtime')),
+                updated_at TIMESTAMP DEFAULT (datetime('now', 'localtime'))
+            )
+        """)
+        connection.executemany(
+            "INSERT INTO posts (title, content, author, created_at, updated_at) VALUES (?, ?, ?, ?, ?)",
+            [("제목", "내용", "작성자", f"2024-03-01 12:00:{i:02d}", "2024-03-02 08:30:00") for i in range(5)]
+        )
+        connection.commit()
+        connection.close()
+        monkeypatch.setattr(PostRepository, "MIGRATION_BATCH_SIZE", 2)
+
+        progress = []
+        repository = PostRepository(db_path, migration_progress=lambda *step: progress.append(step))
+        types = repository.connection.execute(
+            "SELECT DISTINCT typeof(created_at), typeof(updated_at) FROM posts"
+        ).fetchall()
+        post = repository.get_by_id(1)
+        stats = repository.get_stats()
+        repository.close()
+
+        assert [tuple(row) for row in types] == [("integer", "integer")]
+        assert post.created_at.astimezone().strftime("%Y-%m-%d %H:%M:%S") == "2024-03-01 12:00:00"
+        assert [(daily.day.isoformat(), daily.post_count) for daily in stats.daily] == [("2024-03-01", 5)]
+        assert [step for step in progress if step[0] == "timestamps:posts"] == [
+            ("timestamps:posts", 2, 5), ("timestamps:posts", 4, 5), ("timestamps:posts", 5, 5)
+        ]
+        assert progress[-1] == ("sync_uids", 5, 5)
+
+    def test_updated_at_is_indexed(self):
+        """수정순 조회는 updated_at 인덱스를 사용"""
+        plan = self.repository.connection.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM posts ORDER BY updated_at DESC, id DESC LIMIT 10"
+        ).fetchall()
+
+        assert any("idx_posts_updated_at" in row["detail"] for row in plan)
+
+    # === TAG 테스트 ===
+
+    def test_create_with_tags(self):
+        """태그와 함께 생성하면 정규화된 태그로 저장"""
+        post_id = self.repository.create(
+            Post(title="제목", content="내용", author="작성자", tags=[" 공지", "#질문", "공지", ""])
+        )
+
+        post = self.repository.get_by_id(post_id)
+
+        assert sorted(post.tags) == ["공지", "질문"]
+
+    def test_update_tags_none_keeps_tags(self):
+        """수정 시 tags가 None이면 태그 유지, 리스트면 교체"""
+        post_id = self.repository.create(Post(title="제목", content="내용", author="작성자", tags=["공지"]))
+
+        self.repository.update(Post(id=post_id, title="수정", content="내용"))
+        assert self.repository.get_by_id(post_id).tags == ["공지"]
+
+        self.repository.update(Post(id=post_id, title="수정", content="내용", tags=["질문"]))
+        assert self.repository.get_by_id(post_id).tags == ["질문"]
+
+    def test_get_by_tags_any(self):
+        """태그 중 하나라도 가진 글을 최신순으로 조회"""
+        id1 = self.repository.create(Post(title="1", content="내용", author="작성자", tags=["공지"]))
+        id2 = self.repository.create(Post(title="2", content="내용", author="작성자", tags=["질문"]))
+        self.repository.create(Post(title="3", content="내용", author="작성자", tags=["잡담"]))
+        id4 = self.repository.create(Post(title="4", content="내용", author="작성자", tags=["공지", "질문"]))
+
+        posts = self.repository.get_by_tags(["공지", "질문"])
+
+        assert [post.id for post in posts] == [id4, id2, id1]
+
+    def test_get_by_tags_all(self):
+        """모든 태그를 가진 글만 조회"""
+        self.repository.create(Post(title="1", content="내용", author="작성자", tags=["공지"]))
+        id2 = self.repository.create(Post(title="2", content="내용", author="작성자", tags=["공지", "질문"]))
+
+        posts = self.repository.get_by_tags(["공지", "질문"], match_all=True)
+
+        assert [post.id for post in posts] == [id2]
+
+    def test_get_by_tags_unknown_tag_with_match_all(self):
+        """없는 태그가 포함되면 match_all 결과는 비어 있음"""
+        self.repository.create(Post(title="1", content="내용", author="작성자", tags=["공지"]))
+
+        assert self.repository.get_by_tags(["공지", "없는태그"], match_all=True) == []
+
+    def test_get_by_tags_paginated(self):
+        """태그 조회 페이지 나누기"""
+        ids = [
+            self.repository.create(Post(title=f"{i}", content="내용", author="작성자", tags=["공지"]))
+            for i in range(5)
+        ]
+
+        posts = self.repository.get_by_tags(["공지"], page=2, page_size=2)
+
+        assert [post.id for post in posts] == [ids[2], ids[1]]
+
+    def test_tag_counts_follow_changes(self):
+        """태그별 게시글 수는 생성/수정/삭제에 따라 갱신"""
+        id1 = self.repository.create(Post(title="1", content="내용", author="작성자", tags=["공지", "질문"]))
+        self.repository.create(Post(title="2", content="내용", author="작성자", tags=["공지"]))
+
+        self.repository.update(Post(id=id1, title="1", content="내용", tags=["공지"]))
+        self.repository.delete(id1)
+
+        tags = self.repository.get_tags()
+
+        assert [(tag.name, tag.post_count) for tag in tags] == [("공지", 1)]
+
+    # === COMMENT 테스트 ===
+
+    def create_sample_post(self) -> int:
+        return self.repository.create(Post(title="제목", content="내용", author="작성자"))
+
+    def test_comments_in_thread_order(self):
+        """답글은 부모 바로 아래, 형제는 작성순으로 조회"""
+        post_id = self.create_sample_post()
+        first = self.repository.add_comment(post_id, "첫 댓글", "가")
+        second = self.repository.add_comment(post_id, "둘째 댓글", "나")
+        reply = self.repository.add_comment(post_id, "첫 댓글의 답글", "다", parent_id=first)
+        self.repository.add_comment(post_id, "답글의 답글", "라", parent_id=reply)
+
+        comments = self.repository.get_comments(post_id)
+
+        assert [c.content for c in comments] == ["첫 댓글", "첫 댓글의 답글", "답글의 답글", "둘째 댓글"]
+        assert [c.depth for c in comments] == [0, 1, 2, 0]
+        assert comments[3].id == second
+
+    def test_get_comments_keyset_page(self):
+        """after_path 다음부터 limit개씩 이어서 조회"""
+        post_id = self.create_sample_post()
+        for i in range(5):
+            self.repository.add_comment(post_id, f"댓글{i}", "작성자")
+
+        first_page = self.repository.get_comments(post_id, limit=2)
+        second_page = self.repository.get_comments(post_id, after_path=first_page[-1].path, limit=2)
+
+        assert [c.content for c in first_page] == ["댓글0", "댓글1"]
+        assert [c.content for c in second_page] == ["댓글2", "댓글3"]
+
+    def test_get_comment_thread_returns_subtree(self):
+        """댓글 하나의 하위 트리만 조회"""
+        post_id = self.create_sample_post()
+        first = self.repository.add_comment(post_id, "첫 댓글", "가")
+        self.repository.add_comment(post_id, "답글", "나", parent_id=first)
+        self.repository.add_comment(post_id, "다른 댓글", "다")
+
+        thread = self.repository.get_comment_thread(first)
+
+        assert [c.content for c in thread] == ["첫 댓글", "답글"]
+
+    def test_comment_count_denormalized_on_post(self):
+        """댓글 수는 게시글에 저장되고 수정일은 바뀌지 않음"""
+        post_id = self.create_sample_post()
+        updated_at = self.repository.get_by_id(post_id).updated_at
+        first = self.repository.add_comment(post_id, "첫 댓글", "가")
+        self.repository.add_comment(post_id, "답글", "나", parent_id=first)
+
+        assert self.repository.get_all()[0].comment_count == 2
+        assert self.repository.get_by_id(post_id).updated_at == updated_at
+
+    def test_delete_comment_removes_replies(self):
+        """댓글 삭제 시 답글도 함께 삭제되고 댓글 수 감소"""
+        post_id = self.create_sample_post()
+        first = self.repository.add_comment(post_id, "첫 댓글", "가")
+        self.repository.add_comment(post_id, "답글", "나", parent_id=first)
+        self.repository.add_comment(post_id, "다른 댓글", "다")
+
+        assert self.repository.delete_comment(first) is True
+        assert [c.content for c in self.repository.get_comments(post_id)] == ["다른 댓글"]
+        assert self.repository.get_by_id(post_id).comment_count == 1
+
+    def test_add_comment_reply_to_other_post_raises_error(self):
+        """다른 게시글의 댓글에는 답글을 달 수 없음"""
+        post_id = self.create_sample_post()
+        other_post_id = self.create_sample_post()
+        other_comment = self.repository.add_comment(other_post_id, "댓글", "가")
+
+        with pytest.raises(ValueError):
+            self.repository.add_comment(post_id, "답글", "나", parent_id=other_comment)
+
+    # === ATTACHMENT 테스트 ===
+
+    def test_add_attachment_streams_into_blob_store(self):
+        """첨부한 내용이 저장소에 그대로 저장되고 다시 읽힘"""
+        post_id = self.create_sample_post()
+        data = os.urandom(3 * 1024 * 1024 + 7)
+
+        attachment = self.repository.add_attachment(post_id, "screenshot.png", io.BytesIO(data))
+        destination = io.BytesIO()
+
+        assert attachment.size == len(data)
+        assert self.repository.save_attachment(attachment.id, destination) is True
+        assert destination.getvalue() == data
+        assert self.repository.read_attachment_preview(attachment.id, 16) == data[:16]
+        assert [a.filename for a in self.repository.get_attachments(post_id)] == ["screenshot.png"]
+
+    def test_same_content_is_stored_once(self):
+        """같은 내용은 게시글이 달라도 파일 하나를 공유"""
+        first_post = self.create_sample_post()
+        second_post = self.create_sample_post()
+
+        first = self.repository.add_attachment(first_post, "a.log", io.BytesIO(b"log line\n" * 100))
+        second = self.repository.add_attachment(second_post, "b.log", io.BytesIO(b"log line\n" * 100))
+
+        assert first.digest == second.digest
+        assert self.repository.attachment_path(first) == self.repository.attachment_path(second)
+
+    def test_delete_post_collects_unreferenced_blobs(self):
+        """게시글 삭제 시 다른 글이 쓰지 않는 첨부 파일만 제거"""
+        first_post = self.create_sample_post()
+        second_post = self.create_sample_post()
+        shared = self.repository.add_attachment(first_post, "shared.txt", io.BytesIO(b"shared"))
+        self.repository.add_attachment(second_post, "shared.txt", io.BytesIO(b"shared"))
+        only_first = self.repository.add_attachment(first_post, "only.txt", io.BytesIO(b"only"))
+
+        self.repository.delete(first_post)
+
+        assert os.path.exists(self.repository.attachment_path(shared))
+        assert not os.path.exists(self.repository.attachment_path(only_first))
+
+        self.repository.delete(second_post)
+
+        assert not os.path.exists(self.repository.attachment_path(shared))
+
+    def test_delete_attachment(self):
+        """첨부 삭제 시 목록과 저장소에서 제거"""
+        post_id = self.create_sample_post()
+        attachment = self.repository.add_attachment(post_id, "a.txt", io.BytesIO(b"data"))
+
+        assert self.repository.delete_attachment(attachment.id) is True
+        assert self.repository.get_attachments(post_id) == []
+        assert not os.path.exists(self.repository.attachment_path(attachment))
+        assert self.repository.delete_attachment(attachment.id) is False
+
+    def test_add_attachment_to_missing_post_raises_error(self):
+        """없는 게시글에는 첨부할 수 없음"""
+        with pytest.raises(ValueError):
+            self.repository.add_attachment(999, "a.txt", io.BytesIO(b"data"))
+
+    # === VIEW COUNT 테스트 ===
+
+    def test_record_view_is_buffered_until_flush(self):
+        """조회수는 버퍼에 쌓이고 목록에는 반영 전 증가분도 포함"""
+        post_id = self.create_sample_post()
+
+        self.repository.record_view(post_id)
+        self.repository.record_view(post_id)
+        stored = self.repository.connection.execute(
+            "SELECT view_count FROM posts WHERE id = ?", (post_id,)
+        ).fetchone()[0]
+
+        assert stored == 0
+        assert self.repository.get_all()[0].view_count == 2
+        assert self.repository.flush_views() == 2
+        assert self.repository.get_by_id(post_id).view_count == 2
+        assert self.repository.flush_views() == 0
+
+    def test_flush_views_adds_to_other_connections(self):
+        """같은 DB를 연 두 연결의 조회수가 서로 덮어쓰지 않고 합쳐짐"""
+        post_id = self.create_sample_post()
+        other = PostRepository(self.repository.db_path)
+        try:
+            self.repository.record_view(post_id)
+            other.record_view(post_id)
+            other.record_view(post_id)
+
+            self.repository.flush_views()
+            other.flush_views()
+        finally:
+            other.close()
+
+        assert self.repository.get_by_id(post_id).view_count == 3
+
+    def test_close_flushes_pending_views(self):
+        """close() 시 남은 조회수를 반영"""
+        post_id = self.create_sample_post()
+        self.repository.record_view(post_id)
+        self.repository.close()
+
+        self.repository = PostRepository(self.repository.db_path)
+
+        assert self.repository.get_by_id(post_id).view_count == 1
+
+    def test_view_count_does_not_change_updated_at(self):
+        """조회수 반영은 수정일을 바꾸지 않음"""
+        post_id = self.create_sample_post()
+        updated_at = self.repository.get_by_id(post_id).updated_at
+
+        self.repository.record_view(post_id)
+        self.repository.flush_views()
+
+        assert self.repository.get_by_id(post_id).updated_at == updated_at
+
+    # === ARCHIVE 테스트 ===
+
+    def create_post_in_year(self, year: int, title: str = "제목", tags=None) -> int:
+        post_id = self.repository.create(Post(title=title, content="내용", author="작성자", tags=tags))
+        created_at = self.repository._year_start_ms(year) + post_id
+        self.repository.connection.execute(
+            "UPDATE posts SET created_at = ?, updated_at = ? WHERE id = ?", (created_at, created_at, post_id)
+        )
+        self.repository.connection.commit()
+        return post_id
+
+    def test_archive_moves_old_posts_by_year(self, tmp_path):
+        """이전 연도 글은 연도별 파일로 옮겨지고 전체 목록 순서는 그대로"""
+        for year in (2021, 2021, 2022, 2024):
+            self.create_post_in_year(year)
+        before = [post.id for post in self.repository.get_all()]
+
+        moved = self.repository.archive_before(2024, batch_size=1)
+
+        assert moved == 3
+        assert os.path.exists(tmp_path / "test-archive-2021.db")
+        assert os.path.exists(tmp_path / "test-archive-2022.db")
+        assert self.repository.connection.execute("SELECT COUNT(*) FROM main.posts").fetchone()[0] == 1
+        assert [post.id for post in self.repository.get_all()] == before
+        assert [post.id for post in self.repository.iter_all(batch_size=2)] == before
+        assert [post.id for post in self.repository.get_page(2, 2)] == before[2:]
+        assert self.repository.count() == 4
+
+    def test_archive_continues_past_changed_batch(self, monkeypatch):
+        """복사 뒤 바뀌어 한 배치도 못 옮겨도 다음 범위는 계속 옮기고, 범위는 옮긴 글로만 계산"""
+        changed = self.create_post_in_year(2020)
+        moved_ids = [self.create_post_in_year(2020), self.create_post_in_year(2020)]
+        attach = self.repository._attach_archive
+
+        def attach_and_touch(year, filename, create=False):
+            # 아카이브로 복사한 직후 조회수가 바뀐 상태를 재현
+            alias = attach(year, filename, create=create)
+            self.repository.connection.execute(f"""
+                CREATE TEMP TRIGGER IF NOT EXISTS touch_after_copy AFTER INSERT ON {alias}.posts
+                WHEN NEW.id = {changed}
+                BEGIN
+                    UPDATE posts SET view_count = view_count + 1 WHERE id = NEW.id;
+                END
+            """)
+            return alias
+
+        monkeypatch.setattr(self.repository, "_attach_archive", attach_and_touch)
+
+        moved = self.repository.archive_before(2021, batch_size=1)
+
+        assert moved == 2
+        assert self.repository.get_by_id(changed).archived is False
+        assert all(self.repository.get_by_id(post_id).archived for post_id in moved_ids)
+        row = self.repository.connection.execute(
+            "SELECT post_count, min_id, max_id FROM archives WHERE year = 2020"
+        ).fetchone()
+        assert tuple(row) == (2, min(moved_ids), max(moved_ids))
+
+    def test_recent_page_does_not_attach_archives(self):
+        """hot DB만으로 채워지는 페이지는 아카이브를 ATTACH하지 않음"""
+        self.create_post_in_year(2020)
+        self.repository.create(Post(title="최근", content="내용", author="작성자"))
+        self.repository.archive_before(2021)
+        self.repository.close()
+        self.repository = PostRepository(self.db_path)
+
+        posts = self.repository.get_page(1, 1)
+
+        assert [post.title for post in posts] == ["최근"]
+        assert not self.repository._attached_archives
+
+    def test_archived_post_keeps_tags_comments_and_stats(self):
+        """아카이브된 글도 태그/댓글/집계를 유지하고 읽기 전용"""
+        post_id = self.create_post_in_year(2020, tags=["공지"])
+        self.repository.add_comment(post_id, "댓글", "작성자")
+        stats = self.repository.get_stats()
+
+        self.repository.archive_before(2021)
+        post = self.repository.get_by_id(post_id)
+
+        assert post.archived is True
+        assert post.tags == ["공지"]
+        assert post.comment_count == 1
+        assert len(self.repository.get_comments(post_id)) == 1
+        assert [p.id for p in self.repository.get_by_tags(["공지"])] == [post_id]
+        assert self.repository.get_stats() == stats
+        assert self.repository.update(Post(id=post_id, title="수정", content="내용")) is False
+
+    def test_tag_lists_follow_created_at_order(self):
+        """태그 목록도 get_all()처럼 (작성 시각, id) 역순 (id 순서와 달라도, 아카이브된 글도)"""
+        old = self.create_post_in_year(2020, title="옛글", tags=["공지"])
+        newer = self.create_post_in_year(2023, title="새글", tags=["공지", "질문"])
+        middle = self.create_post_in_year(2022, title="중간", tags=["질문"])
+        self.repository.archive_before(2021)
+
+        expected = [post.id for post in self.repository.get_all()]
+        assert expected == [newer, middle, old]
+        assert [p.id for p in self.repository.get_by_tags(["공지", "질문"])] == expected
+        assert [p.id for p in self.repository.iter_by_tags(["공지", "질문"], batch_size=1)] == expected
+        assert [p.id for p in self.repository.get_by_tags(["공지", "질문"], page=2, page_size=1)] == [middle]
+        assert [p.id for p in self.repository.iter_by_tags(["공지", "질문"], match_all=True)] == [newer]
+
+    def test_post_tag_times_filled_on_open(self):
+        """작성 시각이 없던 이전 버전 post_tags는 열 때 hot DB/아카이브 글의 작성 시각으로 채움"""
+        old = self.create_post_in_year(2020, tags=["공지"])
+        new = self.create_post_in_year(2023, tags=["공지"])
+        self.repository.archive_before(2021)
+        self.repository.connection.executescript("""
+            UPDATE post_tags SET created_at = NULL;
+            PRAGMA user_version = 3;
+        """)
+        self.repository.close()
+
+        self.repository = PostRepository(self.db_path)
+
+        assert self.repository.connection.execute(
+            "SELECT COUNT(*) FROM post_tags WHERE created_at IS NULL"
+        ).fetchone()[0] == 0
+        assert [p.id for p in self.repository.get_by_tags(["공지"])] == [new, old]
+
+    def test_rebuild_stats_includes_archives(self):
+        """집계를 다시 계산해도 아카이브된 글이 포함됨"""
+        self.create_post_in_year(2020)
+        self.repository.create(Post(title="최근", content="내용", author="작성자"))
+        self.repository.archive_before(2021)
+
+        self.repository.rebuild_stats()
+
+        assert self.repository.get_stats().total_posts == 2
+
+    def test_interrupted_archive_shows_post_once(self):
+        """복사만 되고 hot DB에서 지워지지 않은 글은 한 번만 조회되고 다음 실행 때 정리"""
+        post_id = self.create_post_in_year(2020)
+        self.repository.archive_before(2021)
+        # 아카이브 복사 후 hot DB 삭제 전에 중단된 상태를 재현
+        alias = self.repository._attach_archive(2020, "test-archive-2020.db")
+        self.repository.connection.execute(
+            f"INSERT INTO main.posts ({PostRepository.ARCHIVE_COLUMNS}) "
+            f"SELECT {PostRepository.ARCHIVE_COLUMNS} FROM {alias}.posts"
+        )
+        self.repository.connection.commit()
+
+        assert [post.id for post in self.repository.get_all()] == [post_id]
+        assert self.repository.get_by_id(post_id).archived is False
+
+        self.repository.archive_before(2021)
+
+        assert [post.id for post in self.repository.get_all()] == [post_id]
+        assert self.repository.get_by_id(post_id).archived is True
+
+    def test_search_reaches_archives(self):
+        """검색은 hot DB 다음 아카이브까지 이어서 조회"""
+        old_id = self.create_post_in_year(2020, title="오래된 공지")
+        new_id = self.repository.create(Post(title="새 공지", content="내용", author="작성자"))
+        self.repository.archive_before(2021)
+
+        assert [post.id for post in self.repository.search("공지")] == [new_id, old_id]
+        assert [post.id for post in self.repository.search("공지", page=2, page_size=1)] == [old_id]
+
+    # === CHANGE LOG 테스트 ===
+
+    def test_writes_are_logged_with_increasing_hlc(self):
+        """작성/수정/삭제가 uid별 한 행으로 기록되고 HLC는 계속 커짐"""
+        post_id = self.create_sample_post()
+        created = self.repository.get_changes()
+        self.repository.update(Post(id=post_id, title="수정", content="내용", tags=["공지"]))
+        updated = self.repository.get_changes()
+        self.repository.delete(post_id)
+        deleted = self.repository.get_changes()
+
+        assert len(created) == len(updated) == len(deleted) == 1
+        assert created[0].uid == updated[0].uid == deleted[0].uid
+        assert created[0].hlc < updated[0].hlc < deleted[0].hlc
+        assert created[0].seq < updated[0].seq < deleted[0].seq
+        assert (updated[0].title, updated[0].tags) == ("수정", ["공지"])
+        assert deleted[0].deleted is True
+        assert self.repository.get_changes(after_seq=deleted[0].seq) == []
+
+    def test_existing_posts_get_uid_on_open(self):
+        """uid가 없던 이전 버전 DB를 열면 기존 글에 uid를 붙여 변경으로 기록"""
+        post_id = self.create_sample_post()
+        self.repository.connection.executescript("""
+            UPDATE posts SET uid = NULL;
+            DELETE FROM change_log;
+            PRAGMA user_version = 2;
+        """)
+        self.repository.close()
+
+        self.repository = PostRepository(self.db_path)
+        changes = self.repository.get_changes()
+
+        assert len(changes) == 1
+        assert changes[0].uid
+        assert changes[0].hlc.endswith(self.repository.node_id)
+        assert self.repository.get_by_id(post_id) is not None
+
+    def test_change_listeners_are_called_after_update_and_delete(self):
+        """수정/삭제 후 change listener에 post_id 전달"""
+        post_id = self.create_sample_post()
+        changed = []
+        self.repository.add_change_listener(changed.append)
+
+        self.repository.update(Post(id=post_id, title="수정", content="내용"))
+        self.repository.update(Post(id=999, title="수정", content="내용"))
+        self.repository.delete(post_id)
+
+        assert changed == [post_id, post_id]
+
+    def test_apply_changes_keeps_newer_local_edit(self):
+        """이쪽 변경의 HLC가 더 크면 받은 변경은 무시"""
+        post_id = self.create_sample_post()
+        change = self.repository.get_changes()[0]
+        self.repository.update(Post(id=post_id, title="새 제목", content="내용"))
+        change.title = "예전 제목"
+
+        applied = self.repository.apply_changes("other", [change])
+
+        assert applied == 0
+        assert self.repository.get_by_id(post_id).title == "새 제목"
+        assert self.repository.get_sync_watermark("other") == change.seq
+
+    def test_archiving_is_not_logged_as_delete(self):
+        """아카이브로 옮긴 글은 삭제로 기록하지 않고 아카이브 파일의 내용과 태그로 전달"""
+        self.create_post_in_year(2020, title="옛글", tags=["공지"])
+
+        self.repository.archive_before(2021)
+        changes = self.repository.get_changes()
+
+        assert len(changes) == 1
+        assert changes[0].deleted is False
+        assert (changes[0].title, changes[0].content, changes[0].tags) == ("옛글", "내용", ["공지"])
+
+    # === READ STATE 테스트 ===
+
+    def test_mark_read_and_unread_count(self):
+        """읽은 글은 구간으로 저장되고 읽지 않은 글 수에서 빠짐"""
+        post_ids = self.repository.create_many(
+            [Post(title=f"제목{i}", content="내용", author="작성자") for i in range(10)]
+        )
+
+        self.repository.mark_read("독자", post_ids[:3] + post_ids[5:7])
+        read_set = self.repository.get_read_set("독자")
+
+        assert read_set.read_upto == post_ids[2]
+        assert read_set.ranges == [(post_ids[5], post_ids[6])]
+        assert self.repository.is_read("독자", post_ids[2:6]) == {
+            post_ids[2]: True, post_ids[3]: False, post_ids[4]: False, post_ids[5]: True,
+        }
+        assert self.repository.unread_count("독자") == 5
+        assert self.repository.unread_count("다른 독자") == 10
+
+        self.repository.delete(post_ids[3])
+        assert self.repository.unread_count("독자") == 4
+
+    def test_mark_all_read_covers_new_posts_only_after(self):
+        """모두 읽음 이후 작성된 글만 읽지 않은 글로 셈"""
+        self.create_sample_post()
+        self.repository.mark_all_read("독자")
+        new_id = self.create_sample_post()
+
+        assert self.repository.unread_count("독자") == 1
+        assert self.repository.is_read("독자", [new_id]) == {new_id: False}
+        assert self.repository.get_read_set("독자").ranges == []
+
+    def test_unread_count_includes_archives(self):
+        """아카이브된 글도 읽지 않은 글 수에 포함"""
+        old_id = self.create_post_in_year(2020)
+        self.create_sample_post()
+        self.repository.archive_before(2021)
+
+        assert self.repository.unread_count("독자") == 2
+
+        self.repository.mark_read("독자", [old_id])
+
+        assert self.repository.unread_count("독자") == 1
@@ -0,0 +1,98 @@
+import pytest
+import os
+from models import Post, PostRepository, PostSnapshot
+
+
+class TestPostSnapshot:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        """임시 DB와 사본 생성"""
+        self.db_path = str(tmp_path / "test.db")
+        self.snapshot_dir = str(tmp_path / "snapshots")
+        self.repository = PostRepository(self.db_path)
+        self.snapshot = PostSnapshot(self.db_path, snapshot_dir=self.snapshot_dir, pages=1)
+        yield
+        self.snapshot.close()
+        self.repository.close()
+
+    def create_post(self, title: str = "제목") -> int:
+        return self.repository.create(Post(title=title, content="내용", author="작성자"))
+
+    def test_reader_sees_point_in_time_copy(self):
+        """사본은 refresh 시점의 상태만 보여줌"""
+        self.create_post("첫번째")
+        self.snapshot.refresh()
+        self.create_post("두번째")
+
+        with self.snapshot.reader() as reader:
+            assert [post.title for post in reader.get_all()] == ["첫번째"]
+
+    def test_refresh_picks_up_new_posts(self):
+        """refresh 후에는 새 게시글이 보임"""
+        self.snapshot.refresh()
+        self.create_post()
+        self.snapshot.refresh()
+
+        with self.snapshot.reader() as reader:
+            assert reader.get_stats().total_posts == 1
+
+    def test_reader_keeps_generation_during_refresh(self):
+        """읽는 중에 refresh되어도 기존 사본을 끝까지 읽음"""
+        self.create_post("첫번째")
+        self.snapshot.refresh()
+
+        with self.snapshot.reader() as reader:
+            self.create_post("두번째")
+            self.snapshot.refresh()
+            assert len(reader.get_all()) == 1
+
+        with self.snapshot.reader() as reader:
+            assert len(reader.get_all()) == 2
+
+    def test_refresh_skips_unchanged_database(self):
+        """마지막 사본 이후 커밋이 없으면 다시 복사하지 않음"""
+        assert self.snapshot.refresh() is True
+        taken_at = self.snapshot.taken_at
+        assert taken_at.tzinfo is not None and taken_at.utcoffset().total_seconds() == 0
+
+        assert self.snapshot.refresh() is False
+        assert self.snapshot.taken_at == taken_at
+        self.create_post()
+        assert self.snapshot.refresh() is True
+
+    def test_unused_generations_are_removed(self):
+        """읽는 곳이 없는 이전 사본 파일은 삭제"""
+        for _ in range(3):
+            self.create_post()
+            self.snapshot.refresh()
+
+        assert len(os.listdir(self.snapshot_dir)) == 1
+
+    def test_reader_after_close(self):
+        """닫은 뒤에는 새 사본을 만들지 않고, 읽던 사본은 다 읽은 뒤 삭제"""
+        self.create_post()
+        with self.snapshot.reader() as reader:
+            self.snapshot.close()
+            assert len(reader.get_all()) == 1
+
+        assert os.listdir(self.snapshot_dir) == []
+        with pytest.raises(ValueError, match="닫힌 사본"):
+            with self.snapshot.reader():
+                pass
+
+    def test_reader_is_read_only(self):
+        """사본은 읽기 전용"""
+        with self.snapshot.reader() as reader:
+            with pytest.raises(Exception):
+                reader.create(Post(title="제목", content="내용", author="작성자"))
+
+    def test_refresh_from_wal_database(self):
+        """WAL 모드 DB도 사본 생성 가능"""
+        self.repository.enable_wal()
+        self.create_post()
+
+        self.snapshot.refresh()
+
+        with self.snapshot.reader() as reader:
+            assert len(reader.get_all()) == 1
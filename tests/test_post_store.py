@@ -0,0 +1,243 @@
+import io
+import os
+
+import pytest
+from models import InMemoryPostRepository, Post, PostRepository, PostStore
+
+
+@pytest.fixture(params=["sqlite", "sqlite_memory", "memory"])
+def store(request, tmp_path):
+    """PostStore 구현마다 같은 테스트를 실행"""
+    if request.param == "sqlite":
+        repository = PostRepository(str(tmp_path / "test.db"))
+    elif request.param == "sqlite_memory":
+        repository = PostRepository(":memory:")
+    else:
+        repository = InMemoryPostRepository()
+    yield repository
+    repository.close()
+
+
+def create(store, title="제목", content="내용", author="작성자", tags=None) -> int:
+    return store.create(Post(title=title, content=content, author=author, tags=tags))
+
+
+class TestPostStore:
+
+    def test_implements_protocol(self, store):
+        assert isinstance(store, PostStore)
+
+    # === 게시글 ===
+
+    def test_create_and_get_by_id(self, store):
+        """저장한 값을 그대로 읽고, 앞뒤 공백은 제거"""
+        post_id = create(store, "  제목  ", "  내용  ", "", tags=["#b", "a", "b", " "])
+
+        post = store.get_by_id(post_id)
+        assert (post.title, post.content, post.author) == ("제목", "내용", "익명")
+        assert post.tags == ["a", "b"]
+        assert post.created_at is not None and post.created_at == post.updated_at
+        assert store.get_by_id(post_id + 100) is None
+
+    def test_create_validates(self, store):
+        with pytest.raises(ValueError, match="제목은 필수입니다"):
+            create(store, title=" ")
+        with pytest.raises(ValueError, match="내용은 필수입니다"):
+            create(store, content="")
+        assert store.count() == 0
+
+    def test_create_many_is_all_or_nothing(self, store):
+        with pytest.raises(ValueError):
+            store.create_many([Post(title="1", content="내용"), Post(title="", content="내용")])
+        assert store.count() == 0
+
+        post_ids = store.create_many([Post(title=str(i), content="내용") for i in range(3)])
+        assert post_ids == sorted(post_ids) and store.count() == 3
+
+    def test_page_is_newest_first(self, store):
+        post_ids = [create(store, title=f"글 {i}", tags=["z", "a"]) for i in range(5)]
+
+        first = store.get_page(1, 2)
+        assert [post.id for post in first] == post_ids[::-1][:2]
+        assert first[0].tags == ["a", "z"] and first[0].content == ""
+        assert [post.id for post in store.get_page(3, 2)] == post_ids[:1]
+        assert store.get_page(4, 2) == []
+        assert [post.id for post in store.get_all()] == post_ids[::-1]
+        assert [post.id for post in store.iter_all(batch_size=2)] == post_ids[::-1]
+
+    def test_search(self, store):
+        """제목/내용 부분 일치, ASCII는 대소문자 무시, %와 _는 그대로 검색"""
+        hello = create(store, title="Hello 게시판")
+        percent = create(store, content="100% 완료")
+        create(store, content="100 완료")
+
+        assert [post.id for post in store.search("hello")] == [hello]
+        assert [post.id for post in store.search("게시판")] == [hello]
+        assert [post.id for post in store.search("%")] == [percent]
+        assert store.search("_") == []
+
+    def test_tags(self, store):
+        both = create(store, tags=["python", "qt"])
+        python = create(store, tags=["python"])
+        create(store, tags=["sqlite"])
+
+        assert [post.id for post in store.get_by_tags(["python", "qt"])] == [python, both]
+        assert [post.id for post in store.get_by_tags(["python", "qt"], match_all=True)] == [both]
+        assert store.get_by_tags(["python", "없음"], match_all=True) == []
+        assert [post.id for post in store.get_by_tags(["python"], page=2, page_size=1)] == [both]
+        assert [post.id for post in store.iter_by_tags(["python", "qt"], batch_size=1)] == [python, both]
+        assert [post.id for post in store.iter_by_tags(["qt", "python"], match_all=True)] == [both]
+        assert [(tag.name, tag.post_count) for tag in store.get_tags()] == [
+            ("python", 2), ("qt", 1), ("sqlite", 1)
+        ]
+        assert len(store.get_tags(limit=1)) == 1
+
+    def test_update(self, store):
+        post_id = create(store, tags=["a"])
+
+        assert store.update(Post(id=post_id, title="새 제목", content="새 내용")) is True
+        post = store.get_by_id(post_id)
+        assert (post.title, post.content, post.tags) == ("새 제목", "새 내용", ["a"])
+        assert post.updated_at >= post.created_at
+
+        store.update(Post(id=post_id, title="새 제목", content="새 내용", tags=["b"]))
+        assert store.get_by_id(post_id).tags == ["b"]
+        assert [tag.name for tag in store.get_tags()] == ["b"]
+        assert store.update(Post(id=post_id + 100, title="제목", content="내용")) is False
+
+    def test_delete_removes_related_data(self, store):
+        post_id = create(store, tags=["a"])
+        other_id = create(store)
+        store.add_comment(post_id, "댓글")
+        attachment = store.add_attachment(post_id, "a.txt", io.BytesIO(b"data"))
+
+        assert store.delete(post_id) is True
+        assert store.delete(post_id) is False
+        assert store.get_by_id(post_id) is None
+        assert store.count() == 1 and [post.id for post in store.get_all()] == [other_id]
+        assert store.get_tags() == [] and store.get_comments(post_id) == []
+        assert store.get_attachment(attachment.id) is None
+
+    def test_change_listener(self, store):
+        changed = []
+        store.add_change_listener(changed.append)
+        post_id = create(store)
+
+        store.update(Post(id=post_id, title="제목", content="수정"))
+        store.delete(post_id)
+        assert changed == [post_id, post_id]
+
+    def test_stats(self, store):
+        create(store, author="가")
+        create(store, author="나")
+        deleted = create(store, author="나")
+        store.delete(deleted)
+        create(store, author="나")
+
+        stats = store.get_stats()
+        assert (stats.total_posts, stats.total_authors) == (3, 2)
+        assert [(a.author, a.post_count) for a in stats.authors] == [("나", 2), ("가", 1)]
+        assert sum(day.post_count for day in stats.daily) == 3
+
+    # === 조회수 / 읽음 표시 ===
+
+    def test_views_are_buffered_until_flush(self, store):
+        post_id = create(store)
+        store.record_view(post_id)
+        store.record_view(post_id)
+
+        assert store.get_by_id(post_id).view_count == 2
+        assert store.flush_views() == 2
+        assert store.get_by_id(post_id).view_count == 2
+        assert store.flush_views() == 0
+
+    def test_read_state(self, store):
+        post_ids = [create(store) for _ in range(4)]
+        store.mark_read("독자", [post_ids[1], post_ids[3]])
+
+        assert store.is_read("독자", post_ids) == {
+            post_ids[0]: False, post_ids[1]: True, post_ids[2]: False, post_ids[3]: True
+        }
+        assert store.unread_count("독자") == 2
+        assert store.unread_count("다른 독자") == 4
+
+        store.mark_all_read("독자")
+        new_id = create(store)
+        assert store.unread_count("독자") == 1
+        assert store.is_read("독자", [new_id]) == {new_id: False}
+
+    # === 댓글 ===
+
+    def test_comment_threads(self, store):
+        post_id = create(store)
+        first = store.add_comment(post_id, "첫 댓글", "가")
+        second = store.add_comment(post_id, "둘째 댓글")
+        reply = store.add_comment(post_id, "답글", parent_id=first)
+
+        comments = store.get_comments(post_id)
+        assert [c.id for c in comments] == [first, reply, second]
+        assert [c.depth for c in comments] == [0, 1, 0]
+        assert comments[2].author == "익명"
+        assert [c.id for c in store.get_comments(post_id, after_path=comments[0].path, limit=1)] == [reply]
+        assert [c.id for c in store.get_comment_thread(first)] == [first, reply]
+        assert store.get_by_id(post_id).comment_count == 3
+
+        assert store.delete_comment(first) is True
+        assert [c.id for c in store.get_comments(post_id)] == [second]
+        assert store.get_by_id(post_id).comment_count == 1
+        assert store.delete_comment(first) is False
+
+    def test_comment_validation(self, store):
+        post_id = create(store)
+        other_comment = store.add_comment(create(store), "다른 글 댓글")
+
+        with pytest.raises(ValueError, match="내용은 필수입니다"):
+            store.add_comment(post_id, " ")
+        with pytest.raises(ValueError, match="게시글을 찾을 수 없습니다"):
+            store.add_comment(post_id + 100, "댓글")
+        with pytest.raises(ValueError, match="답글을 달 댓글을 찾을 수 없습니다"):
+            store.add_comment(post_id, "답글", parent_id=other_comment)
+
+    # === 첨부파일 ===
+
+    def test_attachments(self, store, tmp_path):
+        post_id = create(store)
+        file_path = tmp_path / "note.txt"
+        file_path.write_bytes(b"hello world")
+
+        first = store.add_attachment_file(post_id, str(file_path))
+        same = store.add_attachment(post_id, "copy.txt", io.BytesIO(b"hello world"))
+        assert (first.filename, first.size) == ("note.txt", 11)
+        assert first.digest == same.digest
+        assert [a.id for a in store.get_attachments(post_id)] == [first.id, same.id]
+        assert store.read_attachment_preview(first.id, limit=5) == b"hello"
+
+        destination = io.BytesIO()
+        assert store.save_attachment(same.id, destination) is True
+        assert destination.getvalue() == b"hello world"
+
+        assert store.delete_attachment(first.id) is True
+        assert store.read_attachment_preview(same.id) == b"hello world"
+        assert store.delete_attachment(first.id) is False
+        assert store.get_attachment(first.id) is None
+        assert store.read_attachment_preview(first.id) is None
+
+    def test_attachment_validation(self, store):
+        post_id = create(store)
+        with pytest.raises(ValueError, match="파일 이름은 필수입니다"):
+            store.add_attachment(post_id, " ", io.BytesIO(b""))
+        with pytest.raises(ValueError, match="게시글을 찾을 수 없습니다"):
+            store.add_attachment(post_id + 100, "a.txt", io.BytesIO(b""))
+
+
+def test_sqlite_memory_db_removes_attachments_on_close():
+    """:memory: DB의 첨부파일은 임시 디렉터리에 두고 닫을 때 함께 지움"""
+    repository = PostRepository(":memory:")
+    post_id = repository.create(Post(title="제목", content="내용"))
+    attachment = repository.add_attachment(post_id, "a.txt", io.BytesIO(b"data"))
+    path = repository.attachment_path(attachment)
+
+    with pytest.raises(ValueError, match="메모리 DB"):
+        repository.archive_batch(2100)
+    repository.close()
+    assert not os.path.exists(path)
@@ -0,0 +1,147 @@
+import pytest
+import os
+import shutil
+import time
+from models import Post, PostRepository, PostSync
+
+
+class TestPostSync:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        """동기화할 임시 DB 두 개 생성"""
+        self.tmp_path = tmp_path
+        self.local_path = str(tmp_path / "local.db")
+        self.other_path = str(tmp_path / "other.db")
+        self.local = PostRepository(self.local_path)
+        self.other = PostRepository(self.other_path)
+        yield
+        self.local.close()
+        self.other.close()
+
+    def sync(self) -> dict:
+        # PostSync가 상대 DB를 직접 열도록 잠시 닫아 둠
+        self.other.close()
+        result = PostSync(self.local, batch_size=2).sync(self.other_path)
+        self.other = PostRepository(self.other_path)
+        return result
+
+    def archive_post(self, repository: PostRepository, post_id: int):
+        """글을 2020년 작성으로 바꾸고 아카이브로 옮김"""
+        created_at = repository._year_start_ms(2020) + post_id
+        repository.connection.execute(
+            "UPDATE posts SET created_at = ?, updated_at = ? WHERE id = ?", (created_at, created_at, post_id)
+        )
+        repository.connection.commit()
+        assert repository.archive_before(2021) == 1
+
+    def snapshot(self, repository: PostRepository) -> list[tuple]:
+        return sorted(
+            (post.title, post.content, post.author, tuple(post.tags))
+            for post in (repository.get_by_id(p.id) for p in repository.get_all())
+        )
+
+    def test_new_posts_are_exchanged(self):
+        """양쪽에서 작성한 글이 모두 상대에게 전달"""
+        for i in range(3):
+            self.local.create(Post(title=f"로컬{i}", content="내용", author="작성자", tags=["로컬"]))
+        self.other.create(Post(title="원격", content="내용", author="작성자"))
+
+        result = self.sync()
+
+        assert result == {"pulled": 1, "pushed": 3}
+        assert len(self.snapshot(self.local)) == 4
+        assert self.snapshot(self.local) == self.snapshot(self.other)
+        assert self.other.count() == 4
+
+    def test_only_new_changes_are_sent(self):
+        """두 번째 동기화는 그 사이에 바뀐 것만 주고받음"""
+        self.local.create(Post(title="첫 글", content="내용", author="작성자"))
+        self.sync()
+        self.local.create(Post(title="둘째 글", content="내용", author="작성자"))
+
+        assert self.sync() == {"pulled": 0, "pushed": 1}
+        assert self.sync() == {"pulled": 0, "pushed": 0}
+
+    def test_conflicting_edits_converge_to_later_one(self):
+        """같은 글을 양쪽에서 고치면 나중(HLC가 큰) 수정으로 양쪽이 같아짐"""
+        post_id = self.local.create(Post(title="원본", content="내용", author="작성자"))
+        self.sync()
+        other_id = self.other.get_all()[0].id
+        self.other.update(Post(id=other_id, title="원격 수정", content="내용", tags=["원격"]))
+        time.sleep(0.01)
+        self.local.update(Post(id=post_id, title="로컬 수정", content="내용"))
+
+        self.sync()
+
+        assert self.local.get_by_id(post_id).title == "로컬 수정"
+        assert self.snapshot(self.local) == self.snapshot(self.other)
+
+    def test_delete_wins_over_older_edit(self):
+        """먼저 고친 글을 나중에 지우면 양쪽 모두에서 삭제"""
+        post_id = self.local.create(Post(title="원본", content="내용", author="작성자"))
+        self.sync()
+        self.other.update(Post(id=self.other.get_all()[0].id, title="원격 수정", content="내용"))
+        time.sleep(0.01)
+        self.local.delete(post_id)
+
+        self.sync()
+
+        assert self.local.get_all() == []
+        assert self.other.get_all() == []
+        assert self.other.count() == 0
+
+    def test_copied_database_gets_new_node_id(self):
+        """파일을 복사해 만든 DB와도 동기화 (상대 쪽 노드 id를 새로 발급)"""
+        post_id = self.local.create(Post(title="원본", content="내용", author="작성자"))
+        self.local.close()
+        self.other.close()
+        copy_path = str(self.tmp_path / "copy.db")
+        shutil.copy(self.local_path, copy_path)
+        self.local = PostRepository(self.local_path)
+        self.other = PostRepository(copy_path)
+        self.other_path = copy_path
+        self.other.create(Post(title="복사본 글", content="내용", author="작성자"))
+        self.local.update(Post(id=post_id, title="수정", content="내용"))
+
+        self.sync()
+
+        assert self.other.node_id != self.local.node_id
+        assert self.snapshot(self.local) == self.snapshot(self.other)
+        assert len(self.snapshot(self.local)) == 2
+
+    def test_missing_database_is_not_created(self):
+        """없는 경로로 동기화하면 빈 게시판을 만들지 않고 오류"""
+        missing_path = str(self.tmp_path / "typo.db")
+
+        with pytest.raises(ValueError, match="DB 파일이 없습니다"):
+            PostSync(self.local).sync(missing_path)
+
+        assert not os.path.exists(missing_path)
+
+    def test_archived_post_is_sent_with_content(self):
+        """보내는 쪽에서 아카이브된 글도 내용과 함께 전달"""
+        post_id = self.local.create(Post(title="옛글", content="내용", author="작성자", tags=["공지"]))
+        self.archive_post(self.local, post_id)
+
+        assert self.sync() == {"pulled": 0, "pushed": 1}
+        assert self.snapshot(self.other) == [("옛글", "내용", "작성자", ("공지",))]
+
+    def test_deferred_change_is_resent(self):
+        """이쪽에서 아카이브되어 반영하지 못한 변경은 받은 위치를 넘기지 않아 다음 동기화 때 다시 받음"""
+        post_id = self.local.create(Post(title="원본", content="내용", author="작성자"))
+        self.sync()
+        self.archive_post(self.local, post_id)
+        other_id = self.other.get_all()[0].id
+        self.other.update(Post(id=other_id, title="원격 수정", content="내용"))
+        for i in range(3):
+            self.other.create(Post(title=f"원격{i}", content="내용", author="작성자"))
+        edit_seq = self.other.get_changes()[0].seq
+
+        assert self.sync()["pulled"] == 3
+        assert self.local.get_sync_watermark(self.other.node_id) < edit_seq
+        assert self.local.get_by_id(post_id).title == "원본"
+
+        changes = self.other.get_changes(self.local.get_sync_watermark(self.other.node_id))
+        assert [change.title for change in changes][0] == "원격 수정"
+        assert self.sync()["pulled"] == 0
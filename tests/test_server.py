@@ -0,0 +1,230 @@
+import pytest
+import json
+import threading
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from server import BoardServer
+
+
+class TestBoardServer:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        """임시 DB로 localhost 서버 실행"""
+        self.db_path = str(tmp_path / "test.db")
+        self.server = BoardServer(("127.0.0.1", 0), self.db_path, readers=4)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        yield
+        self.server.shutdown()
+        self.server.server_close()
+
+    def request(self, path: str, method: str = "GET", data: dict = None, headers: dict = None):
+        """(status, headers, json) 반환"""
+        body = json.dumps(data).encode("utf-8") if data is not None else None
+        req = urllib.request.Request(self.base_url + path, data=body, method=method, headers=headers or {})
+        try:
+            with urllib.request.urlopen(req, timeout=10) as response:
+                raw = response.read()
+                return response.status, response.headers, json.loads(raw) if raw else None
+        except urllib.error.HTTPError as e:
+            raw = e.read()
+            return e.code, e.headers, json.loads(raw) if raw else None
+
+    def create(self, title: str = "제목", content: str = "내용", author: str = "작성자") -> dict:
+        status, headers, post = self.request(
+            "/posts", "POST", {"title": title, "content": content, "author": author}
+        )
+        assert status == 201
+        return post
+
+    def test_create_and_get(self):
+        """작성 후 조회"""
+        post = self.create()
+
+        status, headers, data = self.request(f"/posts/{post['id']}")
+
+        assert status == 200
+        assert data["content"] == "내용"
+        assert headers["ETag"]
+
+    def test_create_invalid_returns_400(self):
+        """유효하지 않은 입력은 400"""
+        status, headers, data = self.request("/posts", "POST", {"title": "", "content": "내용"})
+
+        assert status == 400
+        assert data["error"] == "제목을 입력해주세요."
+
+    def test_get_not_found(self):
+        """없는 게시글은 404"""
+        status, headers, data = self.request("/posts/9999")
+        assert status == 404
+
+    def test_list_paginated(self):
+        """목록은 최신순 페이지 조회"""
+        ids = [self.create(title=f"제목{i}")["id"] for i in range(5)]
+
+        status, headers, data = self.request("/posts?page=2&page_size=2")
+
+        assert data["total"] == 5
+        assert [post["id"] for post in data["posts"]] == [ids[2], ids[1]]
+
+    def test_list_with_reader_marks_unread(self):
+        """reader를 주면 목록에 읽음 여부가 붙고, 조회한 글은 읽은 것으로 바뀜"""
+        ids = [self.create(title=f"제목{i}")["id"] for i in range(3)]
+        status, headers, before = self.request("/posts?reader=me")
+
+        self.request(f"/posts/{ids[1]}?reader=me")
+        status, headers, after = self.request("/posts?reader=me", headers={"If-None-Match": headers["ETag"]})
+
+        assert before["unread_count"] == 3
+        assert status == 200
+        assert after["unread_count"] == 2
+        assert {post["id"]: post["read"] for post in after["posts"]} == {ids[0]: False, ids[1]: True, ids[2]: False}
+
+    def test_if_none_match_returns_304(self):
+        """ETag가 같으면 304"""
+        post = self.create()
+        status, headers, data = self.request(f"/posts/{post['id']}")
+
+        status, _, data = self.request(f"/posts/{post['id']}", headers={"If-None-Match": headers["ETag"]})
+
+        assert status == 304
+        assert data is None
+
+    def test_comment_changes_etag(self):
+        """댓글이 달리면 이전 ETag로 조회해도 새 댓글 수와 새 ETag로 200 (목록도)"""
+        post = self.create()
+        _, headers, _ = self.request(f"/posts/{post['id']}")
+        _, list_headers, _ = self.request("/posts")
+        with self.server.write() as repository:
+            repository.add_comment(post["id"], "댓글", "작성자")
+
+        status, new_headers, data = self.request(f"/posts/{post['id']}", headers={"If-None-Match": headers["ETag"]})
+
+        assert status == 200
+        assert data["comment_count"] == 1
+        assert new_headers["ETag"] != headers["ETag"]
+
+        status, new_list_headers, data = self.request("/posts", headers={"If-None-Match": list_headers["ETag"]})
+
+        assert status == 200
+        assert data["posts"][0]["comment_count"] == 1
+        assert new_list_headers["ETag"] != list_headers["ETag"]
+
+    def test_update_with_stale_if_match_returns_412(self):
+        """If-Match가 현재 ETag와 다르면 412"""
+        post = self.create()
+
+        status, headers, data = self.request(
+            f"/posts/{post['id']}", "PUT", {"title": "수정"}, headers={"If-Match": '"stale"'}
+        )
+
+        assert status == 412
+
+    def test_update(self):
+        """수정은 보낸 항목만 변경"""
+        post = self.create()
+
+        status, headers, data = self.request(f"/posts/{post['id']}", "PUT", {"title": "수정된 제목"})
+
+        assert status == 200
+        assert data["title"] == "수정된 제목"
+        assert data["content"] == "내용"
+
+    def test_delete(self):
+        """삭제 후 조회 시 404"""
+        post = self.create()
+
+        status, headers, data = self.request(f"/posts/{post['id']}", "DELETE")
+
+        assert status == 204
+        assert self.request(f"/posts/{post['id']}")[0] == 404
+
+    def archive(self, post_id: int):
+        """글을 2020년 작성으로 바꾸고 아카이브로 옮김"""
+        with self.server.write() as repository:
+            created_at = repository._year_start_ms(2020)
+            repository.connection.execute(
+                "UPDATE posts SET created_at = ?, updated_at = ? WHERE id = ?", (created_at, created_at, post_id)
+            )
+            repository.connection.commit()
+            assert repository.archive_before(2021) == 1
+
+    def test_update_archived_returns_409(self):
+        """아카이브된 글 수정은 409이고 내용은 그대로"""
+        post = self.create()
+        self.archive(post["id"])
+
+        status, headers, data = self.request(f"/posts/{post['id']}", "PUT", {"title": "수정된 제목"})
+
+        assert status == 409
+        assert data["error"] == "아카이브된 게시글은 읽기 전용입니다."
+        assert self.request(f"/posts/{post['id']}")[2]["title"] == "제목"
+
+    def test_delete_archived_returns_409(self):
+        """아카이브된 글 삭제는 409이고 계속 조회됨"""
+        post = self.create()
+        self.archive(post["id"])
+
+        status, headers, data = self.request(f"/posts/{post['id']}", "DELETE")
+
+        assert status == 409
+        assert data["error"] == "아카이브된 게시글은 읽기 전용입니다."
+        assert self.request(f"/posts/{post['id']}")[0] == 200
+
+    def test_concurrent_requests(self):
+        """동시 읽기/쓰기 요청이 모두 성공"""
+        post = self.create()
+
+        def work(i):
+            if i % 5 == 0:
+                return self.request("/posts", "POST", {"title": f"제목{i}", "content": "내용"})[0]
+            return self.request(f"/posts/{post['id']}")[0]
+
+        with ThreadPoolExecutor(max_workers=50) as executor:
+            statuses = list(executor.map(work, range(200)))
+
+        assert all(status in (200, 201) for status in statuses)
+        assert self.request("/posts")[2]["total"] == 41
+
+    def test_tags_filter(self):
+        """tags 쿼리로 목록 거르기"""
+        status, headers, post = self.request(
+            "/posts", "POST", {"title": "공지글", "content": "내용", "tags": ["notice"]}
+        )
+        self.create(title="일반글")
+
+        status, headers, data = self.request("/posts?tags=notice")
+
+        assert post["tags"] == ["notice"]
+        assert [p["title"] for p in data["posts"]] == ["공지글"]
+
+    def test_search(self):
+        """검색"""
+        self.create(title="사과")
+        self.create(title="바나나")
+
+        status, headers, data = self.request("/search?q=%EC%82%AC%EA%B3%BC")
+
+        assert [post["title"] for post in data["posts"]] == ["사과"]
+
+    def test_stats_from_snapshot(self, tmp_path):
+        """사본 모드에서는 통계를 주기적으로 갱신되는 사본에서 조회"""
+        self.create()
+        server = BoardServer(("127.0.0.1", 0), self.db_path, readers=1, snapshot_interval=3600)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            self.create()
+            url = f"http://127.0.0.1:{server.server_address[1]}/stats"
+            with urllib.request.urlopen(url, timeout=10) as response:
+                stats = json.loads(response.read())
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        # 서버 시작 시점의 사본이므로 이후 작성한 글은 포함되지 않음
+        assert stats["total_posts"] == 1
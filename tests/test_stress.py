@@ -0,0 +1,36 @@
+from datetime import timedelta
+from models import Post, PostRepository
+from scripts.stress_test import check_invariants, run
+
+
+class TestStress:
+
+    def test_concurrent_processes_keep_invariants(self, tmp_path):
+        """여러 프로세스/스레드가 같은 DB에 쓰는 동안 수정 유실/잠금 오류 없이 끝남"""
+        report = run(str(tmp_path / "stress.db"), processes=2, threads=2, duration=3,
+                     report_interval=1, wal=True)
+
+        assert report["violations"] == []
+        assert report["errors"] == {}
+        assert {"create", "update", "ctl_create"} <= set(report["operations"])
+        assert report["timeline"] and all(bucket["throughput_ops"] > 0 for bucket in report["timeline"])
+
+    def test_final_updated_at_behind_last_read_is_reported(self, tmp_path):
+        """끝난 뒤 DB의 updated_at이 스레드가 마지막으로 읽은 값보다 이전이면 위반"""
+        db_path = str(tmp_path / "stress.db")
+        repository = PostRepository(db_path)
+        post_id = repository.create(Post(title="stress-0-0", content="rev 0", author="stress-0-0"))
+        updated_at = repository.get_by_id(post_id).updated_at
+        repository.close()
+        result = {
+            "name": "stress-0-0", "errors": {}, "violations": [], "deleted": [],
+            "revisions": {post_id: 0}, "updated_at": {post_id: updated_at},
+        }
+
+        assert check_invariants(db_path, [result]) == []
+
+        result["updated_at"][post_id] = updated_at + timedelta(seconds=1)
+
+        assert check_invariants(db_path, [result]) == [
+            f"stress-0-0: 글 {post_id}의 최종 updated_at이 마지막으로 읽은 값보다 이전"
+        ]
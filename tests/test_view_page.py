@@ -0,0 +1,37 @@
+import pytest
+from models import InMemoryPostRepository, Post
+from controllers import PostController
+from views.view_page import ViewPage
+
+
+class TestViewPage:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, app):
+        """메모리 저장소로 Controller와 조회 페이지 생성"""
+        self.repository = InMemoryPostRepository()
+        self.controller = PostController(self.repository, reader="독자")
+        self.page = ViewPage(self.controller)
+        self.post_id = self.repository.create(Post(title="제목", content="내용", author="작성자"))
+        self.repository.add_comment(self.post_id, "댓글", "작성자")
+        yield
+        self.controller.close()
+        self.repository.close()
+
+    def test_load_more_comments_after_error(self, monkeypatch):
+        """댓글을 불러오다 오류가 나도 다시 불러올 수 있음"""
+        errors = []
+        self.controller.error_occurred.connect(errors.append)
+        original = self.repository.get_comments
+
+        def fail(*args, **kwargs):
+            raise RuntimeError("database is locked")
+
+        monkeypatch.setattr(self.repository, "get_comments", fail)
+        self.page.load_post(self.post_id)
+        assert errors == ["database is locked"]
+        assert self.page.comments_loading is False
+
+        monkeypatch.setattr(self.repository, "get_comments", original)
+        self.page.load_more_comments()
+        assert self.page.comment_list.count() == 1
@@ -3,16 +3,30 @@ from PySide6.QtWidgets import (
     QLineEdit, QTextEdit, QPushButton, QMessageBox, QLabel
 )
 from PySide6.QtCore import Signal
-from controllers import PostController
+from typing import Optional
+from controllers import PostController, DraftAutosaver, DocumentText
+from models import Draft, parse_tags
 
 
 class CreatePage(QWidget):
     request_cancel = Signal()
 
-    def __init__(self, controller: PostController):
+    DRAFT_KEY = "create"
+
+    def __init__(self, controller: PostController, autosaver: Optional[DraftAutosaver] = None):
         super().__init__()
         self.controller = controller
+        self.autosaver = autosaver
+        self._autosave_enabled = True
         self.init_ui()
+        self.content_text = DocumentText(self.content_input.document())
+        self.original_revision = self.content_input.document().revision()
+        if self.autosaver:
+            self.autosaver.draft_loaded.connect(self.on_draft_loaded)
+        self.title_input.textChanged.connect(self.on_input_changed)
+        self.author_input.textChanged.connect(self.on_input_changed)
+        self.tags_input.textChanged.connect(self.on_input_changed)
+        self.content_input.textChanged.connect(self.on_input_changed)
 
     def init_ui(self):
         layout = QVBoxLayout()
@@ -31,6 +45,10 @@ class CreatePage(QWidget):
         self.author_input.setPlaceholderText("작성자 이름 (미입력시 '익명')")
         form_layout.addRow("작성자:", self.author_input)
 
+        self.tags_input = QLineEdit()
+        self.tags_input.setPlaceholderText("쉼표로 구분 (예: 공지, 질문)")
+        form_layout.addRow("태그:", self.tags_input)
+
         layout.addLayout(form_layout)
 
         content_label = QLabel("내용:")
@@ -58,8 +76,9 @@ class CreatePage(QWidget):
         title = self.title_input.text()
         content = self.content_input.toPlainText()
         author = self.author_input.text()
+        tags = parse_tags(self.tags_input.text())
 
-        self.controller.create_post(title, content, author)
+        self.controller.create_post(title, content, author, tags)
 
     def on_cancel_clicked(self):
         if self.has_unsaved_content():
@@ -73,17 +92,61 @@ class CreatePage(QWidget):
             if reply == QMessageBox.StandardButton.No:
                 return
 
+        self.discard_draft()
         self.clear_inputs()
         self.request_cancel.emit()
 
     def has_unsaved_content(self):
-        """작성 중인 내용이 있는지 확인"""
+        """작성 중인 내용이 있는지 확인 (본문은 비운 뒤 문서 revision 카운터가 바뀌었는지로 확인)"""
         title = self.title_input.text().strip()
-        content = self.content_input.toPlainText().strip()
         author = self.author_input.text().strip()
-        return bool(title or content or author)
+        tags = self.tags_input.text().strip()
+        if title or author or tags:
+            return True
+        return self.content_input.document().revision() != self.original_revision
 
     def clear_inputs(self):
+        self._autosave_enabled = False
         self.title_input.clear()
         self.content_input.clear()
         self.author_input.clear()
+        self.tags_input.clear()
+        self._autosave_enabled = True
+        self.original_revision = self.content_input.document().revision()
+
+    def on_input_changed(self):
+        if self.autosaver and self._autosave_enabled:
+            self.autosaver.mark_dirty(self.DRAFT_KEY, self.create_draft)
+
+    def create_draft(self) -> Draft:
+        return Draft(
+            key=self.DRAFT_KEY,
+            title=self.title_input.text(),
+            content=self.content_text.text(),
+            author=self.author_input.text(),
+            tags=self.tags_input.text(),
+        )
+
+    def restore_draft(self):
+        """저장된 임시 저장본을 요청 (읽기는 쓰기 스레드에서, 결과는 on_draft_loaded로)
+
+        복원한 본문은 작성 중인 내용으로 보도록 요청 시점의 revision을 기준으로 삼는다.
+        """
+        self.original_revision = self.content_input.document().revision()
+        if self.autosaver:
+            self.autosaver.request_load(self.DRAFT_KEY)
+
+    def on_draft_loaded(self, key: str, draft: Optional[Draft]):
+        """읽는 사이 이미 입력을 시작했으면 입력 내용을 덮어쓰지 않음"""
+        if key != self.DRAFT_KEY or not draft or self.has_unsaved_content():
+            return
+        self._autosave_enabled = False
+        self.title_input.setText(draft.title)
+        self.content_input.setPlainText(draft.content)
+        self.author_input.setText(draft.author)
+        self.tags_input.setText(draft.tags)
+        self._autosave_enabled = True
+
+    def discard_draft(self):
+        if self.autosaver:
+            self.autosaver.discard(self.DRAFT_KEY)
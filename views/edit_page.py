@@ -3,21 +3,31 @@ from PySide6.QtWidgets import (
     QLineEdit, QTextEdit, QPushButton, QMessageBox, QLabel
 )
 from PySide6.QtCore import Signal
-from controllers import PostController
-from models import Post
+from typing import Optional
+from controllers import PostController, DraftAutosaver, DocumentText
+from models import Draft, Post, parse_tags
 
 
 class EditPage(QWidget):
     request_cancel = Signal()
 
-    def __init__(self, controller: PostController):
+    def __init__(self, controller: PostController, autosaver: Optional[DraftAutosaver] = None):
         super().__init__()
         self.controller = controller
+        self.autosaver = autosaver
         self.current_post_id = None
         self.original_title = ""
-        self.original_content = ""
+        self.original_tags = ""
+        self.original_revision = 0
+        self._autosave_enabled = True
         self.init_ui()
+        self.content_text = DocumentText(self.content_input.document())
         self.controller.post_loaded.connect(self.on_post_loaded)
+        if self.autosaver:
+            self.autosaver.draft_loaded.connect(self.on_draft_loaded)
+        self.title_input.textChanged.connect(self.on_input_changed)
+        self.tags_input.textChanged.connect(self.on_input_changed)
+        self.content_input.textChanged.connect(self.on_input_changed)
 
     def init_ui(self):
         layout = QVBoxLayout()
@@ -35,6 +45,10 @@ class EditPage(QWidget):
         self.label_author = QLabel()
         form_layout.addRow("작성자:", self.label_author)
 
+        self.tags_input = QLineEdit()
+        self.tags_input.setPlaceholderText("쉼표로 구분 (예: 공지, 질문)")
+        form_layout.addRow("태그:", self.tags_input)
+
         layout.addLayout(form_layout)
 
         content_label = QLabel("내용:")
@@ -59,15 +73,25 @@ class EditPage(QWidget):
         self.setLayout(layout)
 
     def load_post(self, post_id: int) -> bool:
+        # 이전 게시글의 대기 중인 변경은 키가 바뀌기 전에 기록
+        if self.autosaver:
+            self.autosaver.flush()
         self.current_post_id = post_id
-        return self.controller.load_post(post_id)
+        if not self.controller.load_post(post_id):
+            return False
+        self.restore_draft()
+        return True
 
     def on_post_loaded(self, post: Post):
+        self._autosave_enabled = False
         self.title_input.setText(post.title)
         self.content_input.setPlainText(post.content)
+        self.tags_input.setText(", ".join(post.tags or []))
+        self._autosave_enabled = True
         self.label_author.setText(post.author)
         self.original_title = post.title
-        self.original_content = post.content
+        self.original_tags = self.tags_input.text()
+        self.original_revision = self.content_input.document().revision()
 
     def on_save_clicked(self):
         if not self.current_post_id:
@@ -75,7 +99,8 @@ class EditPage(QWidget):
 
         title = self.title_input.text()
         content = self.content_input.toPlainText()
-        self.controller.update_post(self.current_post_id, title, content)
+        tags = parse_tags(self.tags_input.text())
+        self.controller.update_post(self.current_post_id, title, content, tags)
 
     def on_cancel_clicked(self):
         if self.has_unsaved_changes():
@@ -89,10 +114,45 @@ class EditPage(QWidget):
             if reply == QMessageBox.StandardButton.No:
                 return
 
+        self.discard_draft()
         self.request_cancel.emit()
 
     def has_unsaved_changes(self):
-        """현재 입력값과 원본 비교"""
-        current_title = self.title_input.text()
-        current_content = self.content_input.toPlainText()
-        return current_title != self.original_title or current_content != self.original_content
+        """제목/태그는 원본과 비교, 본문은 문서 revision 카운터로 변경 여부 확인"""
+        if self.title_input.text() != self.original_title or self.tags_input.text() != self.original_tags:
+            return True
+        return self.content_input.document().revision() != self.original_revision
+
+    def draft_key(self) -> str:
+        return f"edit:{self.current_post_id}"
+
+    def on_input_changed(self):
+        if self.autosaver and self._autosave_enabled and self.current_post_id:
+            self.autosaver.mark_dirty(self.draft_key(), self.create_draft)
+
+    def create_draft(self) -> Draft:
+        return Draft(
+            key=self.draft_key(),
+            title=self.title_input.text(),
+            content=self.content_text.text(),
+            tags=self.tags_input.text(),
+        )
+
+    def restore_draft(self):
+        """저장된 임시 저장본을 요청 (읽기는 쓰기 스레드에서, 결과는 on_draft_loaded로)"""
+        if self.autosaver and self.current_post_id:
+            self.autosaver.request_load(self.draft_key())
+
+    def on_draft_loaded(self, key: str, draft: Optional[Draft]):
+        """원본 대신 복원 (수정 중 상태로 표시됨), 읽는 사이 이미 고쳤으면 덮어쓰지 않음"""
+        if not self.current_post_id or key != self.draft_key() or not draft or self.has_unsaved_changes():
+            return
+        self._autosave_enabled = False
+        self.title_input.setText(draft.title)
+        self.content_input.setPlainText(draft.content)
+        self.tags_input.setText(draft.tags)
+        self._autosave_enabled = True
+
+    def discard_draft(self):
+        if self.autosaver and self.current_post_id:
+            self.autosaver.discard(self.draft_key())
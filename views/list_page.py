@@ -1,37 +1,70 @@
+from typing import Optional
+
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QTableWidget, QTableWidgetItem,
-    QHeaderView
+    QHeaderView, QLineEdit, QCheckBox, QLabel
 )
 from PySide6.QtCore import Signal
 from controllers import PostController
-from models import Post
+from models import Post, format_local, parse_tags
 
 
 class ListPage(QWidget):
     request_create = Signal()
     request_view = Signal(int)     # 행 더블클릭 시 (post_id)
+    request_stats = Signal()
 
     def __init__(self, controller: PostController):
         super().__init__()
         self.controller = controller
+        self.post_ids: list[int] = []
+        self.post_rows: dict[int, int] = {}       # post_id → 행 번호
+        self.loading_id: Optional[int] = None     # 받고 있는 목록의 토큰 id
         self.init_ui()
         self.controller.posts_loaded.connect(self.on_posts_loaded)
+        self.controller.posts_load_started.connect(self.on_posts_load_started)
+        self.controller.posts_chunk_loaded.connect(self.on_posts_chunk_loaded)
+        self.controller.posts_load_finished.connect(self.on_posts_load_finished)
+        self.controller.read_state_loaded.connect(self.on_read_state_loaded)
+        self.controller.unread_count_loaded.connect(self.on_unread_count_loaded)
+        self.controller.read_state_changed.connect(self.on_read_state_changed)
         self.refresh_posts()
 
     def init_ui(self):
         layout = QVBoxLayout()
 
         top_layout = QHBoxLayout()
+
+        self.tag_filter_input = QLineEdit()
+        self.tag_filter_input.setPlaceholderText("태그 필터 (쉼표로 구분)")
+        self.tag_filter_input.returnPressed.connect(self.refresh_posts)
+        top_layout.addWidget(self.tag_filter_input)
+
+        self.check_match_all = QCheckBox("모든 태그 포함")
+        self.check_match_all.toggled.connect(self.refresh_posts)
+        top_layout.addWidget(self.check_match_all)
+
         top_layout.addStretch()
+        self.label_unread = QLabel()
+        top_layout.addWidget(self.label_unread)
+
+        self.btn_mark_all_read = QPushButton("모두 읽음")
+        self.btn_mark_all_read.clicked.connect(self.controller.mark_all_read)
+        top_layout.addWidget(self.btn_mark_all_read)
+
+        self.btn_stats = QPushButton("통계")
+        self.btn_stats.clicked.connect(self.on_stats_clicked)
+        top_layout.addWidget(self.btn_stats)
+
         self.btn_create = QPushButton("새 글 작성")
         self.btn_create.clicked.connect(self.on_create_clicked)
         top_layout.addWidget(self.btn_create)
         layout.addLayout(top_layout)
 
         self.table = QTableWidget()
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels(["ID", "제목", "작성자", "작성일"])
+        self.table.setColumnCount(6)
+        self.table.setHorizontalHeaderLabels(["ID", "제목", "댓글", "조회", "작성자", "작성일"])
         self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
         self.table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
         self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
@@ -41,6 +74,8 @@ class ListPage(QWidget):
         header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
         header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
         header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(4, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(5, QHeaderView.ResizeMode.ResizeToContents)
 
         self.table.verticalHeader().setVisible(False)
         self.table.doubleClicked.connect(self.on_row_double_clicked)
@@ -48,7 +83,8 @@ class ListPage(QWidget):
         self.setLayout(layout)
 
     def refresh_posts(self):
-        self.controller.load_posts()
+        tags = parse_tags(self.tag_filter_input.text())
+        self.controller.stream_posts(tags, self.check_match_all.isChecked())
 
     def truncate_text(self, text: str, max_length: int) -> str:
         if len(text) > max_length:
@@ -56,22 +92,90 @@ class ListPage(QWidget):
         return text
 
     def on_posts_loaded(self, posts: list[Post]):
-        self.table.setRowCount(len(posts))
+        self.loading_id = None
+        self.post_ids = []
+        self.post_rows = {}
+        self.append_rows(posts)
+        self.table.setRowCount(len(self.post_ids))
+        self.controller.load_read_state(self.post_ids)
+        self.controller.load_unread_count()
+
+    def on_posts_load_started(self, token_id: int):
+        """첫 조각이 덮어쓸 만큼의 행만 남겨 항목을 재사용하고, 그보다 많이 남는 행은 다 받은 뒤 지움"""
+        self.loading_id = token_id
+        self.post_ids = []
+        self.post_rows = {}
+        self.table.setRowCount(min(self.table.rowCount(), self.controller.POST_CHUNK_SIZE))
 
-        for row_idx, post in enumerate(posts):
+    def on_posts_chunk_loaded(self, token_id: int, posts: list[Post]):
+        if token_id != self.loading_id:
+            return
+        self.append_rows(posts)
+        self.controller.load_read_state([post.id for post in posts])
+
+    def on_posts_load_finished(self, token_id: int, cancelled: bool):
+        if token_id != self.loading_id:
+            return
+        self.loading_id = None
+        self.table.setRowCount(len(self.post_ids))
+        self.controller.load_unread_count()
+
+    def append_rows(self, posts: list[Post]):
+        start = len(self.post_ids)
+        if self.table.rowCount() < start + len(posts):
+            self.table.setRowCount(start + len(posts))
+
+        for row_idx, post in enumerate(posts, start):
+            self.post_ids.append(post.id)
+            self.post_rows[post.id] = row_idx
             title = self.truncate_text(post.title, 30)
             author = self.truncate_text(post.author, 10)
 
-            self.table.setItem(row_idx, 0, QTableWidgetItem(str(post.id)))
-            self.table.setItem(row_idx, 1, QTableWidgetItem(title))
-            self.table.setItem(row_idx, 2, QTableWidgetItem(author))
-            created_at = post.created_at.strftime("%Y-%m-%d %H:%M:%S") if post.created_at else ""
-            self.table.setItem(row_idx, 3, QTableWidgetItem(created_at))
+            self.set_cell(row_idx, 0, str(post.id))
+            self.set_cell(row_idx, 1, title)
+            self.set_cell(row_idx, 2, str(post.comment_count))
+            self.set_cell(row_idx, 3, str(post.view_count))
+            self.set_cell(row_idx, 4, author)
+            self.set_cell(row_idx, 5, format_local(post.created_at))
+
+    def set_cell(self, row: int, column: int, text: str):
+        """목록으로 돌아올 때마다 항목을 새로 만들지 않고 남아 있는 항목의 글자만 바꿈"""
+        item = self.table.item(row, column)
+        if item is None:
+            self.table.setItem(row, column, QTableWidgetItem(text))
+        elif item.text() != text:
+            item.setText(text)
+
+    def on_read_state_changed(self, post_ids: Optional[list[int]]):
+        """읽음 처리된 글만 굵게 표시를 풀고 (None이면 모두) 읽지 않은 글 수를 다시 셈"""
+        if post_ids is None:
+            post_ids = self.post_ids
+        self.on_read_state_loaded({post_id: True for post_id in post_ids})
+        self.controller.load_unread_count()
+
+    def on_read_state_loaded(self, read: dict):
+        """읽지 않은 글은 제목을 굵게 표시 (read에 있는 글만, 목록은 조각마다 따로 받음)"""
+        for post_id, is_read in read.items():
+            row_idx = self.post_rows.get(post_id)
+            item = self.table.item(row_idx, 1) if row_idx is not None else None
+            if item is None:
+                continue
+            font = item.font()
+            font.setBold(not is_read)
+            item.setFont(font)
+
+    def on_unread_count_loaded(self, unread_count: int):
+        self.label_unread.setText(f"읽지 않은 글 {unread_count}개")
 
     def on_create_clicked(self):
         self.request_create.emit()
 
+    def on_stats_clicked(self):
+        self.request_stats.emit()
+
     def on_row_double_clicked(self, index):
+        """아직 새 목록이 채우지 않은 이전 목록의 행은 열지 않음"""
         row = index.row()
-        post_id = int(self.table.item(row, 0).text())
-        self.request_view.emit(post_id)
+        if row >= len(self.post_ids):
+            return
+        self.request_view.emit(self.post_ids[row])
@@ -1,10 +1,14 @@
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QStackedWidget, QMessageBox
-from models import PostRepository
-from controllers import PostController
+from typing import Optional
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication, QWidget, QVBoxLayout, QStackedWidget, QMessageBox, QProgressDialog
+from models import PostRepository, PostStore, DraftRepository
+from controllers import PostController, DraftAutosaver
 from views.list_page import ListPage
 from views.create_page import CreatePage
 from views.view_page import ViewPage
 from views.edit_page import EditPage
+from views.stats_page import StatsPage
+from views.memory_diagnostics import MemoryDiagnostics
 
 
 class MainWindow(QWidget):
@@ -12,15 +16,55 @@ class MainWindow(QWidget):
     PAGE_CREATE = 1
     PAGE_VIEW = 2
     PAGE_EDIT = 3
+    PAGE_STATS = 4
 
-    def __init__(self):
+    def __init__(self, repository: Optional[PostStore] = None,
+                 draft_repository: Optional[DraftRepository] = None,
+                 memory_diagnostics: bool = False, wal: bool = False):
+        """repository를 주지 않으면 board.db를 사용 (임시 저장본도 같은 파일에)
+
+        memory_diagnostics=True면 목록으로 돌아올 때마다 메모리 사용량과 늘어난 양을 stderr에 출력
+        wal=True면 board.db를 WAL 모드로 전환 (같은 컴퓨터의 로컬 디스크에 있는 DB에만 사용)
+        """
         super().__init__()
-        self.repository = PostRepository()
+        self.migration_dialog = None
+        if repository is None:
+            # 이전 버전 board.db는 여는 동안 변환하므로 진행 상황을 보여 줌
+            repository = PostRepository(migration_progress=self.on_migration_progress)
+            if self.migration_dialog:
+                self.migration_dialog.close()
+                self.migration_dialog = None
+            if wal:
+                # 같은 컴퓨터에서 여러 창/프로그램이 함께 쓸 때 읽기와 쓰기가 서로 막지 않도록
+                repository.enable_wal()
+        self.repository = repository
         self.controller = PostController(self.repository)
+        self.draft_repository = draft_repository or DraftRepository(
+            getattr(self.repository, "db_path", PostRepository.MEMORY_DB)
+        )
+        self.autosaver = DraftAutosaver(self.draft_repository)
         self.init_ui()
         self.connect_signals()
         self.connect_controller_signals()
 
+        self.diagnostics = None
+        if memory_diagnostics:
+            self.diagnostics = MemoryDiagnostics(
+                {"list": self.list_page, "view": self.view_page, "edit": self.edit_page}
+            )
+            self.diagnostics.sample("시작")
+
+    def on_migration_progress(self, step: str, done: int, total: int):
+        if self.migration_dialog is None:
+            self.migration_dialog = QProgressDialog("이전 버전 게시판 DB를 변환하는 중...", None, 0, total)
+            self.migration_dialog.setWindowTitle("DDE 게시판")
+            self.migration_dialog.setWindowModality(Qt.WindowModality.ApplicationModal)
+            self.migration_dialog.setMinimumDuration(0)
+        self.migration_dialog.setMaximum(max(total, 1))
+        self.migration_dialog.setValue(done)
+        self.migration_dialog.setLabelText(f"이전 버전 게시판 DB를 변환하는 중... ({step} {done}/{total})")
+        QApplication.processEvents()
+
     def init_ui(self):
         self.setWindowTitle("DDE 게시판")
         self.resize(800, 600)
@@ -31,14 +75,16 @@ class MainWindow(QWidget):
         self.stacked_widget = QStackedWidget()
 
         self.list_page = ListPage(self.controller)
-        self.create_page = CreatePage(self.controller)
+        self.create_page = CreatePage(self.controller, self.autosaver)
         self.view_page = ViewPage(self.controller)
-        self.edit_page = EditPage(self.controller)
+        self.edit_page = EditPage(self.controller, self.autosaver)
+        self.stats_page = StatsPage(self.controller)
 
         self.stacked_widget.addWidget(self.list_page)     # 0
         self.stacked_widget.addWidget(self.create_page)   # 1
         self.stacked_widget.addWidget(self.view_page)     # 2
         self.stacked_widget.addWidget(self.edit_page)     # 3
+        self.stacked_widget.addWidget(self.stats_page)    # 4
 
         layout.addWidget(self.stacked_widget)
         self.setLayout(layout)
@@ -48,6 +94,7 @@ class MainWindow(QWidget):
     def connect_signals(self):
         self.list_page.request_create.connect(self.switch_to_create)
         self.list_page.request_view.connect(self.switch_to_view)
+        self.list_page.request_stats.connect(self.switch_to_stats)
 
         self.create_page.request_cancel.connect(self.switch_to_list)
 
@@ -56,11 +103,14 @@ class MainWindow(QWidget):
 
         self.edit_page.request_cancel.connect(self.on_edit_cancelled)
 
+        self.stats_page.request_list.connect(self.switch_to_list)
+
     def connect_controller_signals(self):
         self.controller.post_created.connect(self.on_post_created)
         self.controller.post_updated.connect(self.on_post_updated)
         self.controller.post_deleted.connect(self.on_post_deleted)
         self.controller.error_occurred.connect(self.show_error)
+        self.autosaver.error_occurred.connect(self.show_error)
 
     def show_error(self, message: str):
         QMessageBox.critical(self, "오류", message)
@@ -68,13 +118,16 @@ class MainWindow(QWidget):
     def switch_to_list(self):
         self.list_page.refresh_posts()
         self.stacked_widget.setCurrentIndex(self.PAGE_LIST)
+        if self.diagnostics:
+            self.diagnostics.sample(f"목록 {len(self.diagnostics.samples)}")
 
     def switch_to_create(self):
         self.create_page.clear_inputs()
+        self.create_page.restore_draft()
         self.stacked_widget.setCurrentIndex(self.PAGE_CREATE)
 
-    def switch_to_view(self, post_id: int):
-        if self.view_page.load_post(post_id):
+    def switch_to_view(self, post_id: int, count_view: bool = True):
+        if self.view_page.load_post(post_id, count_view):
             self.stacked_widget.setCurrentIndex(self.PAGE_VIEW)
         else:
             self.switch_to_list()
@@ -85,12 +138,18 @@ class MainWindow(QWidget):
         else:
             self.switch_to_list()
 
+    def switch_to_stats(self):
+        self.stats_page.refresh_stats()
+        self.stacked_widget.setCurrentIndex(self.PAGE_STATS)
+
     def on_post_created(self):
+        self.create_page.discard_draft()
         self.switch_to_list()
 
     def on_post_updated(self):
+        self.edit_page.discard_draft()
         if self.edit_page.current_post_id:
-            self.switch_to_view(self.edit_page.current_post_id)
+            self.switch_to_view(self.edit_page.current_post_id, count_view=False)
         else:
             self.switch_to_list()
 
@@ -99,7 +158,7 @@ class MainWindow(QWidget):
 
     def on_edit_cancelled(self):
         if self.edit_page.current_post_id:
-            self.switch_to_view(self.edit_page.current_post_id)
+            self.switch_to_view(self.edit_page.current_post_id, count_view=False)
         else:
             self.switch_to_list()
 
@@ -132,5 +191,11 @@ class MainWindow(QWidget):
                 event.ignore()
                 return
 
+        # 종료 직전까지의 입력은 임시 저장본으로 남겨 다음 실행 시 복원
+        self.autosaver.close()
+        self.draft_repository.close()
+        self.controller.close()
         self.repository.close()
+        if self.diagnostics:
+            self.diagnostics.stop()
         event.accept()
@@ -0,0 +1,128 @@
+import gc
+import os
+import sys
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Optional, TextIO
+
+from PySide6.QtCore import QObject
+from PySide6.QtWidgets import QListWidget, QTableWidget, QWidget
+
+
+@dataclass
+class MemorySample:
+    label: str = ""
+    traced_bytes: int = 0                 # tracemalloc이 추적 중인 Python 할당 크기
+    rss_bytes: Optional[int] = None       # 프로세스 RSS (/proc이 없으면 None)
+    qt_objects: dict[str, int] = field(default_factory=dict)   # 페이지별 자식 QObject + 목록/표 항목 수
+    top_growth: list[str] = field(default_factory=list)        # 이전 측정 대비 가장 많이 늘어난 할당 위치
+
+
+class MemoryDiagnostics:
+    """페이지 이동 한 바퀴마다 메모리 사용량을 측정해 늘어난 양을 보고
+
+    tracemalloc 스냅샷으로 Python 할당을, findChildren()으로 페이지별 Qt 객체 수를 센다.
+    sample()을 부를 때마다 이전 측정과 비교한 한 줄 요약을 stream에 쓰므로
+    오래 켜 두었을 때 어느 페이지/어느 코드에서 메모리가 쌓이는지 확인할 수 있다.
+    """
+
+    def __init__(self, pages: dict[str, QWidget], top_n: int = 5, stream: Optional[TextIO] = sys.stderr):
+        self.pages = pages
+        self.top_n = top_n
+        self.stream = stream
+        self.samples: list[MemorySample] = []
+        self._snapshot: Optional[tracemalloc.Snapshot] = None
+        self._started_tracing = False
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        self._snapshot = self._take_snapshot()
+
+    def stop(self):
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        self._snapshot = None
+
+    def _take_snapshot(self) -> tracemalloc.Snapshot:
+        gc.collect()
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        ))
+
+    def count_qt_objects(self) -> dict[str, int]:
+        """QTableWidgetItem/QListWidgetItem은 QObject가 아니므로 항목 수를 따로 더함"""
+        counts = {}
+        for name, page in self.pages.items():
+            count = len(page.findChildren(QObject))
+            for table in page.findChildren(QTableWidget):
+                count += table.rowCount() * table.columnCount()
+            for list_widget in page.findChildren(QListWidget):
+                count += list_widget.count()
+            counts[name] = count
+        return counts
+
+    def _rss_bytes(self) -> Optional[int]:
+        try:
+            with open("/proc/self/statm") as statm:
+                return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except (OSError, ValueError, IndexError):
+            return None
+
+    def sample(self, label: str) -> MemorySample:
+        if self._snapshot is None:
+            self.start()
+        snapshot = self._take_snapshot()
+        growth = [
+            str(stat) for stat in snapshot.compare_to(self._snapshot, "lineno")[:self.top_n]
+            if stat.size_diff > 0
+        ]
+        self._snapshot = snapshot
+        sample = MemorySample(
+            label=label,
+            traced_bytes=sum(stat.size for stat in snapshot.statistics("filename")),
+            rss_bytes=self._rss_bytes(),
+            qt_objects=self.count_qt_objects(),
+            top_growth=growth,
+        )
+        previous = self.samples[-1] if self.samples else None
+        self.samples.append(sample)
+        if self.stream:
+            self.stream.write(self.format_sample(sample, previous) + "\n")
+            self.stream.flush()
+        return sample
+
+    def format_sample(self, sample: MemorySample, previous: Optional[MemorySample] = None) -> str:
+        line = f"[memory] {sample.label}: Python {sample.traced_bytes / 1024:.1f} KB"
+        if previous:
+            line += f" ({(sample.traced_bytes - previous.traced_bytes) / 1024:+.1f} KB)"
+        if sample.rss_bytes is not None:
+            line += f", RSS {sample.rss_bytes / 1024 / 1024:.1f} MB"
+        objects = ", ".join(
+            f"{name} {count}" + (f"({count - previous.qt_objects.get(name, 0):+d})" if previous else "")
+            for name, count in sample.qt_objects.items()
+        )
+        line += f", Qt {objects}"
+        if previous and sample.top_growth:
+            line += "".join(f"\n    {stat}" for stat in sample.top_growth)
+        return line
+
+    def growth_per_cycle(self, skip: int = 1) -> tuple[float, dict[str, float]]:
+        """앞의 skip개(캐시가 채워지는 구간)를 뺀 나머지 측정에서 한 바퀴당 평균 증가량
+
+        (Python 할당 바이트, 페이지별 Qt 객체 수) 반환
+        """
+        samples = self.samples[skip:]
+        if len(samples) < 2:
+            return 0.0, {name: 0.0 for name in self.pages}
+        cycles = len(samples) - 1
+        first, last = samples[0], samples[-1]
+        return (
+            (last.traced_bytes - first.traced_bytes) / cycles,
+            {name: (last.qt_objects[name] - first.qt_objects[name]) / cycles for name in self.pages},
+        )
+
@@ -0,0 +1,92 @@
+from PySide6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QFormLayout,
+    QLabel, QPushButton, QTableWidget, QTableWidgetItem,
+    QHeaderView
+)
+from PySide6.QtCore import Signal
+from controllers import PostController
+from models import BoardStats, format_local
+
+
+class StatsPage(QWidget):
+    request_list = Signal()
+
+    def __init__(self, controller: PostController):
+        super().__init__()
+        self.controller = controller
+        self.init_ui()
+        self.controller.stats_loaded.connect(self.on_stats_loaded)
+
+    def init_ui(self):
+        layout = QVBoxLayout()
+
+        page_title = QLabel("게시판 통계")
+        page_title.setStyleSheet("font-size: 18px; font-weight: bold; margin-bottom: 10px;")
+        layout.addWidget(page_title)
+
+        form_layout = QFormLayout()
+
+        self.label_total_posts = QLabel()
+        form_layout.addRow("전체 게시글:", self.label_total_posts)
+
+        self.label_total_authors = QLabel()
+        form_layout.addRow("작성자 수:", self.label_total_authors)
+
+        layout.addLayout(form_layout)
+
+        tables_layout = QHBoxLayout()
+
+        author_layout = QVBoxLayout()
+        author_layout.addWidget(QLabel("작성자별 게시글:"))
+        self.author_table = self.create_table(["작성자", "게시글 수", "마지막 활동"])
+        author_layout.addWidget(self.author_table)
+        tables_layout.addLayout(author_layout)
+
+        daily_layout = QVBoxLayout()
+        daily_layout.addWidget(QLabel("일별 게시글:"))
+        self.daily_table = self.create_table(["날짜", "게시글 수"])
+        daily_layout.addWidget(self.daily_table)
+        tables_layout.addLayout(daily_layout)
+
+        layout.addLayout(tables_layout)
+
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+
+        self.btn_list = QPushButton("목록")
+        self.btn_list.clicked.connect(self.on_list_clicked)
+        button_layout.addWidget(self.btn_list)
+
+        layout.addLayout(button_layout)
+        self.setLayout(layout)
+
+    def create_table(self, headers: list[str]) -> QTableWidget:
+        table = QTableWidget()
+        table.setColumnCount(len(headers))
+        table.setHorizontalHeaderLabels(headers)
+        table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        table.verticalHeader().setVisible(False)
+        table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        return table
+
+    def refresh_stats(self):
+        self.controller.load_stats()
+
+    def on_stats_loaded(self, stats: BoardStats):
+        self.label_total_posts.setText(str(stats.total_posts))
+        self.label_total_authors.setText(str(stats.total_authors))
+
+        self.author_table.setRowCount(len(stats.authors))
+        for row_idx, author_stats in enumerate(stats.authors):
+            last_activity = format_local(author_stats.last_activity)
+            self.author_table.setItem(row_idx, 0, QTableWidgetItem(author_stats.author))
+            self.author_table.setItem(row_idx, 1, QTableWidgetItem(str(author_stats.post_count)))
+            self.author_table.setItem(row_idx, 2, QTableWidgetItem(last_activity))
+
+        self.daily_table.setRowCount(len(stats.daily))
+        for row_idx, daily_stats in enumerate(stats.daily):
+            self.daily_table.setItem(row_idx, 0, QTableWidgetItem(daily_stats.day.isoformat()))
+            self.daily_table.setItem(row_idx, 1, QTableWidgetItem(str(daily_stats.post_count)))
+
+    def on_list_clicked(self):
+        self.request_list.emit()
@@ -1,10 +1,12 @@
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QFormLayout,
-    QLabel, QTextEdit, QPushButton, QMessageBox
+    QLabel, QTextEdit, QPushButton, QMessageBox,
+    QListWidget, QListWidgetItem, QLineEdit, QFileDialog, QPlainTextEdit
 )
-from PySide6.QtCore import Signal
+from PySide6.QtCore import Qt, Signal
+from PySide6.QtGui import QTextCursor
 from controllers import PostController
-from models import Post
+from models import Attachment, Comment, Post, format_local
 
 
 class ViewPage(QWidget):
@@ -15,8 +17,19 @@ class ViewPage(QWidget):
         super().__init__()
         self.controller = controller
         self.current_post_id = None
+        self.comments_last_path = None
+        self.comments_has_more = False
+        self.comments_loading = False
         self.init_ui()
         self.controller.post_loaded.connect(self.on_post_loaded)
+        self.controller.comments_loaded.connect(self.on_comments_loaded)
+        self.controller.comment_added.connect(self.on_comment_added)
+        self.controller.comment_deleted.connect(self.on_comments_changed)
+        self.controller.attachments_loaded.connect(self.on_attachments_loaded)
+        self.controller.attachments_changed.connect(self.on_attachments_changed)
+        self.controller.attachment_preview_loaded.connect(self.on_attachment_preview_loaded)
+        self.controller.content_render_started.connect(self.on_content_render_started)
+        self.controller.content_chunk_rendered.connect(self.on_content_chunk_rendered)
 
     def init_ui(self):
         layout = QVBoxLayout()
@@ -35,12 +48,23 @@ class ViewPage(QWidget):
         self.label_author = QLabel()
         form_layout.addRow("작성자:", self.label_author)
 
+        self.label_tags = QLabel()
+        self.label_tags.setWordWrap(True)
+        form_layout.addRow("태그:", self.label_tags)
+
         self.label_created = QLabel()
         form_layout.addRow("작성일:", self.label_created)
 
         self.label_updated = QLabel()
         form_layout.addRow("수정일:", self.label_updated)
 
+        self.label_views = QLabel()
+        form_layout.addRow("조회수:", self.label_views)
+
+        self.label_archived = QLabel("보관된 게시글입니다 (읽기 전용)")
+        self.label_archived.setVisible(False)
+        form_layout.addRow(self.label_archived)
+
         layout.addLayout(form_layout)
 
         content_label = QLabel("내용:")
@@ -48,7 +72,82 @@ class ViewPage(QWidget):
 
         self.text_content = QTextEdit()
         self.text_content.setReadOnly(True)
-        layout.addWidget(self.text_content)
+        # 읽기 전용이므로 조각을 붙일 때마다 실행 취소 기록을 쌓지 않음
+        self.text_content.setUndoRedoEnabled(False)
+        layout.addWidget(self.text_content, 2)
+
+        self.label_attachments = QLabel("첨부파일:")
+        layout.addWidget(self.label_attachments)
+
+        attachment_layout = QHBoxLayout()
+
+        self.attachment_list = QListWidget()
+        self.attachment_list.setMaximumHeight(100)
+        self.attachment_list.currentItemChanged.connect(self.on_attachment_selected)
+        attachment_layout.addWidget(self.attachment_list, 1)
+
+        # 미리보기는 파일 앞부분만 읽어서 표시
+        self.attachment_preview = QPlainTextEdit()
+        self.attachment_preview.setReadOnly(True)
+        self.attachment_preview.setMaximumHeight(100)
+        attachment_layout.addWidget(self.attachment_preview, 1)
+
+        attachment_button_layout = QVBoxLayout()
+
+        self.btn_add_attachment = QPushButton("파일 첨부")
+        self.btn_add_attachment.clicked.connect(self.on_add_attachment_clicked)
+        attachment_button_layout.addWidget(self.btn_add_attachment)
+
+        self.btn_save_attachment = QPushButton("다운로드")
+        self.btn_save_attachment.clicked.connect(self.on_save_attachment_clicked)
+        attachment_button_layout.addWidget(self.btn_save_attachment)
+
+        self.btn_delete_attachment = QPushButton("첨부 삭제")
+        self.btn_delete_attachment.clicked.connect(self.on_delete_attachment_clicked)
+        attachment_button_layout.addWidget(self.btn_delete_attachment)
+
+        attachment_layout.addLayout(attachment_button_layout)
+        layout.addLayout(attachment_layout)
+
+        self.label_comments = QLabel("댓글:")
+        layout.addWidget(self.label_comments)
+
+        # 긴 스레드는 스크롤이 끝에 닿을 때마다 다음 페이지를 읽어 붙임
+        self.comment_list = QListWidget()
+        self.comment_list.setWordWrap(True)
+        self.comment_list.verticalScrollBar().valueChanged.connect(self.on_comment_scrolled)
+        layout.addWidget(self.comment_list, 1)
+
+        self.btn_more_comments = QPushButton("댓글 더 보기")
+        self.btn_more_comments.clicked.connect(self.load_more_comments)
+        self.btn_more_comments.setVisible(False)
+        layout.addWidget(self.btn_more_comments)
+
+        comment_layout = QHBoxLayout()
+
+        self.comment_author_input = QLineEdit()
+        self.comment_author_input.setPlaceholderText("작성자")
+        self.comment_author_input.setMaximumWidth(120)
+        comment_layout.addWidget(self.comment_author_input)
+
+        self.comment_input = QLineEdit()
+        self.comment_input.setPlaceholderText("댓글을 입력하세요")
+        self.comment_input.returnPressed.connect(self.on_add_comment_clicked)
+        comment_layout.addWidget(self.comment_input)
+
+        self.btn_add_comment = QPushButton("댓글 작성")
+        self.btn_add_comment.clicked.connect(self.on_add_comment_clicked)
+        comment_layout.addWidget(self.btn_add_comment)
+
+        self.btn_reply = QPushButton("답글")
+        self.btn_reply.clicked.connect(self.on_reply_clicked)
+        comment_layout.addWidget(self.btn_reply)
+
+        self.btn_delete_comment = QPushButton("댓글 삭제")
+        self.btn_delete_comment.clicked.connect(self.on_delete_comment_clicked)
+        comment_layout.addWidget(self.btn_delete_comment)
+
+        layout.addLayout(comment_layout)
 
         button_layout = QHBoxLayout()
         button_layout.addStretch()
@@ -68,19 +167,224 @@ class ViewPage(QWidget):
         layout.addLayout(button_layout)
         self.setLayout(layout)
 
-    def load_post(self, post_id: int) -> bool:
+    def load_post(self, post_id: int, count_view: bool = True) -> bool:
+        """count_view=False는 수정 후 돌아올 때처럼 새로 연 것이 아닌 경우"""
         self.current_post_id = post_id
-        return self.controller.load_post(post_id)
+        if not self.controller.load_post(post_id, count_view):
+            return False
+        self.controller.load_attachments(post_id)
+        self.refresh_comments()
+        return True
 
     def on_post_loaded(self, post: Post):
         """Controller의 post_loaded Signal을 받아 UI 갱신"""
         self.label_title.setText(post.title)
         self.label_author.setText(post.author)
-        created_at = post.created_at.strftime("%Y-%m-%d %H:%M:%S") if post.created_at else ""
-        updated_at = post.updated_at.strftime("%Y-%m-%d %H:%M:%S") if post.updated_at else ""
-        self.label_created.setText(created_at)
-        self.label_updated.setText(updated_at)
-        self.text_content.setPlainText(post.content)
+        self.label_tags.setText(" ".join(f"#{tag}" for tag in post.tags or []))
+        self.label_created.setText(format_local(post.created_at))
+        self.label_updated.setText(format_local(post.updated_at))
+        self.label_views.setText(str(post.view_count))
+        self.set_read_only(post.archived)
+        self.controller.render_content(post)
+
+    def on_content_render_started(self, post_id: int):
+        if post_id == self.current_post_id:
+            self.text_content.clear()
+
+    def on_content_chunk_rendered(self, post_id: int, html: str):
+        """렌더링된 조각을 본문 끝에 이어 붙임 (스크롤 위치는 그대로)"""
+        if post_id != self.current_post_id:
+            return
+        document = self.text_content.document()
+        cursor = QTextCursor(document)
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        # 앞 조각의 마지막 문단에 이어지지 않도록 새 문단에서 시작하고,
+        # 목록/코드 블록처럼 스스로 새 블록을 만든 경우 남은 빈 문단은 제거
+        separator = None
+        if document.lastBlock().length() > 1:
+            cursor.insertBlock()
+            separator = cursor.block()
+        cursor.insertHtml(html)
+        if separator is not None and separator.isValid() and separator.length() == 1 \
+                and separator != document.lastBlock():
+            cleanup = QTextCursor(separator)
+            cleanup.deletePreviousChar()
+
+    def set_read_only(self, read_only: bool):
+        """아카이브된 글은 수정/삭제/댓글/첨부 추가 불가"""
+        for widget in (self.btn_edit, self.btn_delete, self.comment_input, self.btn_add_comment,
+                       self.btn_reply, self.btn_delete_comment, self.btn_add_attachment,
+                       self.btn_delete_attachment):
+            widget.setEnabled(not read_only)
+        self.label_archived.setVisible(read_only)
+
+    # === 첨부파일 ===
+
+    def on_attachments_loaded(self, post_id: int, attachments: list[Attachment]):
+        if post_id != self.current_post_id:
+            return
+        self.attachment_list.clear()
+        self.attachment_preview.clear()
+        for attachment in attachments:
+            item = QListWidgetItem(f"{attachment.filename} ({self.format_size(attachment.size)})")
+            item.setData(Qt.ItemDataRole.UserRole, attachment.id)
+            item.setData(Qt.ItemDataRole.UserRole + 1, attachment.filename)
+            self.attachment_list.addItem(item)
+        self.label_attachments.setText(f"첨부파일 ({len(attachments)}):")
+
+    def on_attachments_changed(self, post_id: int):
+        if post_id == self.current_post_id:
+            self.controller.load_attachments(post_id)
+
+    def format_size(self, size: int) -> str:
+        for unit in ("B", "KB", "MB"):
+            if size < 1024:
+                return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+            size /= 1024
+        return f"{size:.1f} GB"
+
+    def selected_attachment_id(self):
+        item = self.attachment_list.currentItem()
+        return item.data(Qt.ItemDataRole.UserRole) if item else None
+
+    def on_attachment_selected(self, current, previous):
+        self.attachment_preview.clear()
+        if current is not None:
+            self.controller.load_attachment_preview(current.data(Qt.ItemDataRole.UserRole))
+
+    def on_attachment_preview_loaded(self, attachment: Attachment, preview: bytes):
+        if attachment.id != self.selected_attachment_id():
+            return
+        # NUL 바이트가 있으면 텍스트가 아닌 파일로 봄
+        if b"\0" in preview:
+            self.attachment_preview.setPlainText("미리보기를 지원하지 않는 파일입니다.")
+            return
+        text = preview.decode("utf-8", errors="replace")
+        if attachment.size > len(preview):
+            text += "\n..."
+        self.attachment_preview.setPlainText(text)
+
+    def on_add_attachment_clicked(self):
+        if not self.current_post_id:
+            return
+        file_path, _ = QFileDialog.getOpenFileName(self, "파일 첨부")
+        if file_path:
+            self.controller.add_attachment(self.current_post_id, file_path)
+
+    def on_save_attachment_clicked(self):
+        item = self.attachment_list.currentItem()
+        if item is None:
+            return
+        filename = item.data(Qt.ItemDataRole.UserRole + 1)
+        file_path, _ = QFileDialog.getSaveFileName(self, "다운로드", filename)
+        if file_path:
+            self.controller.save_attachment(item.data(Qt.ItemDataRole.UserRole), file_path)
+
+    def on_delete_attachment_clicked(self):
+        attachment_id = self.selected_attachment_id()
+        if attachment_id is None or not self.current_post_id:
+            return
+
+        reply = QMessageBox.question(
+            self,
+            "삭제 확인",
+            "첨부파일을 삭제하시겠습니까?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            QMessageBox.StandardButton.No
+        )
+
+        if reply == QMessageBox.StandardButton.Yes:
+            self.controller.delete_attachment(self.current_post_id, attachment_id)
+
+    # === 댓글 ===
+
+    def refresh_comments(self):
+        self.comment_list.clear()
+        self.comments_last_path = None
+        self.comments_has_more = False
+        self.load_more_comments()
+
+    def load_more_comments(self):
+        if not self.current_post_id or self.comments_loading:
+            return
+        self.comments_loading = True
+        try:
+            self.controller.load_comments(self.current_post_id, self.comments_last_path)
+        finally:
+            # 오류로 comments_loaded가 오지 않아도 다시 불러올 수 있게
+            self.comments_loading = False
+
+    def on_comments_loaded(self, post_id: int, comments: list[Comment], has_more: bool):
+        self.comments_loading = False
+        if post_id != self.current_post_id:
+            return
+
+        for comment in comments:
+            indent = "    " * min(comment.depth, 8)
+            prefix = "↳ " if comment.depth else ""
+            item = QListWidgetItem(f"{indent}{prefix}{comment.author}: {comment.content}")
+            item.setData(Qt.ItemDataRole.UserRole, comment.id)
+            self.comment_list.addItem(item)
+        if comments:
+            self.comments_last_path = comments[-1].path
+
+        self.comments_has_more = has_more
+        self.btn_more_comments.setVisible(has_more)
+        self.label_comments.setText(f"댓글 ({self.comment_list.count()}{'+' if has_more else ''}):")
+
+    def on_comment_scrolled(self, value: int):
+        scroll_bar = self.comment_list.verticalScrollBar()
+        if self.comments_has_more and value >= scroll_bar.maximum():
+            self.load_more_comments()
+
+    def on_comment_added(self, post_id: int):
+        if post_id == self.current_post_id:
+            self.comment_input.clear()
+            self.refresh_comments()
+
+    def on_comments_changed(self, post_id: int):
+        if post_id == self.current_post_id:
+            self.refresh_comments()
+
+    def selected_comment_id(self):
+        item = self.comment_list.currentItem()
+        return item.data(Qt.ItemDataRole.UserRole) if item else None
+
+    def submit_comment(self, parent_id=None):
+        if not self.current_post_id:
+            return
+        self.controller.add_comment(
+            self.current_post_id,
+            self.comment_input.text(),
+            self.comment_author_input.text(),
+            parent_id,
+        )
+
+    def on_add_comment_clicked(self):
+        self.submit_comment()
+
+    def on_reply_clicked(self):
+        parent_id = self.selected_comment_id()
+        if parent_id is None:
+            QMessageBox.information(self, "답글", "답글을 달 댓글을 선택해주세요.")
+            return
+        self.submit_comment(parent_id)
+
+    def on_delete_comment_clicked(self):
+        comment_id = self.selected_comment_id()
+        if comment_id is None or not self.current_post_id:
+            return
+
+        reply = QMessageBox.question(
+            self,
+            "삭제 확인",
+            "댓글과 답글을 모두 삭제하시겠습니까?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            QMessageBox.StandardButton.No
+        )
+
+        if reply == QMessageBox.StandardButton.Yes:
+            self.controller.delete_comment(self.current_post_id, comment_id)
 
     def on_edit_clicked(self):
         if self.current_post_id: